@@ -59,6 +59,9 @@ class AppConfig:
     session_history_file: str = os.getenv(
         "SESSION_HISTORY_FILE", "session_history.json"
     )
+    # "json" rewrites seen_watches_file; "sqlite" keeps IDs in a WAL-mode
+    # database next to it (same name, .db suffix)
+    seen_items_backend: str = os.getenv("SEEN_ITEMS_BACKEND", "json").lower()
 
     # Monitoring - PRODUCTION SAFE DEFAULTS
     check_interval_seconds: int = int(
@@ -27,6 +27,14 @@ if Path(".env").exists():
 # Windows-specific event loop policy
 if platform.system() == "Windows":
     asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+else:
+    # Use uvloop when installed for cheaper socket I/O on concurrent fetches
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
 
 from monitor import WatchMonitor
 from config import SITE_CONFIGS
@@ -2,6 +2,7 @@
 
 import hashlib
 import re
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
@@ -11,7 +12,13 @@ from urllib.parse import urljoin, quote_plus
 from config import APP_CONFIG
 
 
-@dataclass
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__, which
+# matters for the hundreds of WatchData objects created per scrape (and keeps
+# ScrapingSession to its declared statistics fields).
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class WatchData:
     """Represents a single watch listing."""
     
@@ -139,6 +146,20 @@ class WatchData:
         """Get the composite ID for duplicate detection."""
         return self._composite_id
     
+    def needs_detail(self) -> bool:
+        """Check whether any field shown in the notification is still missing."""
+        return (
+            self.price is None
+            or self.image_url is None
+            or self.reference is None
+            or self.year is None
+            or self.condition is None
+            or self.has_box is None
+            or self.has_papers is None
+            or self.case_material is None
+            or self.diameter is None
+        )
+    
     @property
     def chrono24_search_url(self) -> str:
         """Generate Chrono24 search URL for this watch."""
@@ -299,7 +320,7 @@ class WatchData:
         return embed_title or "Unknown Watch"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ScrapingSession:
     """Represents a single scraping session with statistics."""
     
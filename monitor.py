@@ -13,7 +13,7 @@ from notifications import NotificationManager
 from logging_config import setup_logging, PerformanceLogger
 from scrapers.base import BaseScraper
 from memory_monitor import MemoryMonitor
-from utils import clear_exchange_rate_cache
+from utils import clear_exchange_rate_cache, clear_parse_caches
 from action_store import ActionStore
 from discord_interactions import DiscordInteractionServer
 from muv_service import MUVActionService
@@ -135,7 +135,8 @@ class WatchMonitor:
             )
             await self.discord_interaction_server.start()
 
-        # Load seen items
+        # Load seen items (history is warmed alongside for the first save_session)
+        self.persistence.warm()
         self.seen_items = self.persistence.load_seen_items()
 
         # Initialize scrapers
@@ -222,9 +223,12 @@ class WatchMonitor:
                     self.action_store.close()
                     self.action_store = None
 
+                self.persistence.close()
+
                 # Clear module-level caches
                 self.logger.debug("Clearing exchange rate cache...")
                 clear_exchange_rate_cache()
+                clear_parse_caches()
 
                 self.logger.info("Watch monitor cleaned up successfully")
             except Exception as e:
@@ -260,8 +264,9 @@ class WatchMonitor:
             self.logger.debug("Trimming seen items...")
             self.seen_items = self.persistence.trim_seen_items(self.seen_items)
 
-            # Save trimmed seen items
-            self.persistence.save_seen_items(self.seen_items)
+            # Stage trimmed seen items; the next cycle's flush writes them (and
+            # a lost trim only leaves extra IDs on disk)
+            self.persistence.stage_seen_items(self.seen_items)
 
             # Force garbage collection
             self.logger.debug("Forcing garbage collection...")
@@ -351,8 +356,8 @@ class WatchMonitor:
                         f"Emergency trimmed {site_key}: {original_count} -> {len(self.seen_items[site_key])} items"
                     )
 
-            # Save aggressively trimmed seen items
-            self.persistence.save_seen_items(self.seen_items)
+            # Stage aggressively trimmed seen items for the next flush
+            self.persistence.stage_seen_items(self.seen_items)
 
             # Force multiple garbage collection passes (3 full passes)
             self.logger.warning("Forcing multiple garbage collection passes...")
@@ -447,6 +452,9 @@ class WatchMonitor:
             # Wait for all to complete
             await asyncio.gather(*tasks)
 
+            # Single write for everything staged by the site scrapes
+            self.persistence.flush_if_needed()
+
             # Poll reviewed MUV offer links without a separate worker process.
             await self._monitor_muv_offer_links()
 
@@ -557,8 +565,8 @@ class WatchMonitor:
                     f"[{site_key}] Trimmed seen items: {len(items_list)} -> {len(self.seen_items[site_key])}"
                 )
 
-            # Save seen items after each site
-            self.persistence.save_seen_items(self.seen_items)
+            # Stage seen items; the cycle writes them once after all sites finish
+            self.persistence.stage_seen_items(self.seen_items)
 
         except Exception as e:
             self.logger.exception(f"Error scraping {site_key}: {e}")
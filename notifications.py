@@ -1,8 +1,10 @@
 """Discord notification system for watch monitor application."""
 
 import asyncio
+import time
+from collections.abc import Mapping
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from urllib.parse import quote
 import aiohttp
 import logging
@@ -16,6 +18,14 @@ from action_store import ActionStore
 class NotificationManager:
     """Manages Discord webhook notifications."""
 
+    # Webhook requests allowed in flight at once for one batch of watches
+    MAX_CONCURRENT_SENDS = 5
+    # Client-side token bucket per destination URL: a burst of up to
+    # RATE_LIMIT_CAPACITY requests, then RATE_LIMIT_PER_SECOND, so requests
+    # are held back before Discord has to answer with a 429
+    RATE_LIMIT_CAPACITY = 5
+    RATE_LIMIT_PER_SECOND = 1.0
+
     def __init__(
         self,
         session: aiohttp.ClientSession,
@@ -32,6 +42,8 @@ class NotificationManager:
         self.session = session
         self.logger = logger
         self.action_store = action_store
+        # Destination URL -> (tokens, monotonic time of last update)
+        self._rate_buckets: Dict[str, Tuple[float, float]] = {}
 
     async def send_notifications(
         self, watches: List[WatchData], site_config: SiteConfig
@@ -63,37 +75,44 @@ class NotificationManager:
             )
             return 0
 
-        # Send notifications with rate limiting
+        # A fixed pool of senders pulls watches from a shared iterator, so up to
+        # MAX_CONCURRENT_SENDS webhook requests are in flight at once instead of
+        # each waiting for the previous response. Pacing is left to the
+        # per-destination token bucket in _wait_for_rate_limit.
+        pending = iter(watches)
         success_count = 0
+        sender_count = max(1, min(self.MAX_CONCURRENT_SENDS, len(watches)))
 
-        for i, watch in enumerate(watches):
-            try:
-                # Convert watch to Discord embed
-                embed = watch.to_discord_embed(site_config.color)
+        async def notification_sender():
+            nonlocal success_count
+            for watch in pending:
+                try:
+                    # Convert watch to Discord embed
+                    embed = watch.to_discord_embed(site_config.color)
 
-                components = self._build_muv_components(
-                    watch, use_link_button=not use_bot
-                )
+                    components = self._build_muv_components(
+                        watch, use_link_button=not use_bot
+                    )
 
-                # Send notification
-                success = await self._send_single_notification(
-                    webhook_url,
-                    embed,
-                    site_config.name,
-                    watch.title,
-                    components=components,
-                    bot_channel_id=bot_channel_id if use_bot else None,
-                )
+                    # Send notification
+                    success = await self._send_single_notification(
+                        webhook_url,
+                        embed,
+                        site_config.name,
+                        watch.title,
+                        components=components,
+                        bot_channel_id=bot_channel_id if use_bot else None,
+                    )
 
-                if success:
-                    success_count += 1
+                    if success:
+                        success_count += 1
 
-                # Rate limit between notifications (except for last one)
-                if i < len(watches) - 1:
-                    await asyncio.sleep(1)
+                except Exception as e:
+                    self.logger.error(
+                        f"Error sending notification for {watch.title}: {e}"
+                    )
 
-            except Exception as e:
-                self.logger.error(f"Error sending notification for {watch.title}: {e}")
+        await asyncio.gather(*(notification_sender() for _ in range(sender_count)))
 
         self.logger.info(
             f"Sent {success_count}/{len(watches)} notifications for {site_config.name}"
@@ -147,12 +166,14 @@ class NotificationManager:
                     self.logger.error(f"No webhook URL available for {site_name}")
                     return False
 
+                await self._wait_for_rate_limit(webhook_url)
                 async with self.session.post(
                     webhook_url,
                     json=payload,
                     params={"with_components": "true"} if components else None,
                     timeout=timeout,
                 ) as response:
+                    self._sync_rate_limit(webhook_url, response)
 
                     if response.status == 204:
                         self.logger.debug(
@@ -171,6 +192,7 @@ class NotificationManager:
                         await asyncio.sleep(retry_after)
 
                         # Retry once
+                        await self._wait_for_rate_limit(webhook_url)
                         async with self.session.post(
                             webhook_url,
                             json=payload,
@@ -205,6 +227,54 @@ class NotificationManager:
             finally:
                 payload = None
 
+    def _refilled_tokens(self, url: str, now: float) -> float:
+        """Return the tokens in ``url``'s bucket at ``now``."""
+        tokens, updated = self._rate_buckets.get(
+            url, (self.RATE_LIMIT_CAPACITY, now)
+        )
+        return min(
+            self.RATE_LIMIT_CAPACITY,
+            tokens + (now - updated) * self.RATE_LIMIT_PER_SECOND,
+        )
+
+    async def _wait_for_rate_limit(self, url: str):
+        """
+        Take a token from ``url``'s bucket, sleeping until it is available.
+
+        The token is reserved before sleeping (the bucket may go negative), so
+        concurrent senders queue up behind each other without a lock.
+        """
+        now = time.monotonic()
+        tokens = self._refilled_tokens(url, now) - 1
+        self._rate_buckets[url] = (tokens, now)
+        if tokens < 0:
+            await asyncio.sleep(-tokens / self.RATE_LIMIT_PER_SECOND)
+
+    def _sync_rate_limit(self, url: str, response):
+        """
+        Lower ``url``'s bucket to what Discord reports is left.
+
+        Discord counts every client of the webhook, so its headers can only
+        make the local bucket more conservative, never refill it.
+        """
+        headers = getattr(response, "headers", None)
+        if not isinstance(headers, Mapping):
+            return
+        try:
+            remaining = float(headers["X-RateLimit-Remaining"])
+            reset_after = float(headers["X-RateLimit-Reset-After"])
+        except (KeyError, TypeError, ValueError):
+            return
+
+        now = time.monotonic()
+        if remaining >= 1:
+            reported = remaining
+        else:
+            # Leaves exactly one token once reset_after has elapsed
+            reported = 1 - reset_after * self.RATE_LIMIT_PER_SECOND
+        tokens = min(self._refilled_tokens(url, now), reported)
+        self._rate_buckets[url] = (tokens, now)
+
     async def test_webhook(self, webhook_url: str) -> bool:
         """
         Test if a webhook URL is valid and accessible.
@@ -296,12 +366,14 @@ class NotificationManager:
             "User-Agent": "DiscordBot (https://atlas.hopcomp.com, 1.0)",
         }
 
+        await self._wait_for_rate_limit(url)
         async with self.session.post(
             url,
             json=payload,
             headers=headers,
             timeout=timeout,
         ) as response:
+            self._sync_rate_limit(url, response)
             if response.status in (200, 201):
                 self.logger.debug(
                     f"Successfully sent bot notification for '{watch_title}'"
@@ -314,6 +386,7 @@ class NotificationManager:
                     f"Discord bot rate limit hit. Waiting {retry_after}s before retry"
                 )
                 await asyncio.sleep(retry_after)
+                await self._wait_for_rate_limit(url)
                 async with self.session.post(
                     url,
                     json=payload,
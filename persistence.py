@@ -2,13 +2,28 @@
 
 import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Set, List, Optional
+from typing import Dict, Set, List, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from config import APP_CONFIG
 from models import ScrapingSession
+from seen_store import SeenStore
+
+
+def _dump_json_bytes(value) -> bytes:
+    """Serialize ``value`` to UTF-8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False).encode('utf-8')
 
 
 class PersistenceManager:
@@ -24,6 +39,51 @@ class PersistenceManager:
         self.logger = logger
         self.seen_items_file = Path(APP_CONFIG.seen_watches_file)
         self.session_history_file = Path(APP_CONFIG.session_history_file)
+
+        # Optional SQLite backend for seen IDs (writes only changed rows)
+        self.seen_store: Optional[SeenStore] = None
+        if APP_CONFIG.seen_items_backend == "sqlite":
+            self.seen_store = SeenStore(str(self.seen_items_file.with_suffix(".db")))
+            if self.seen_store.is_empty():
+                self._seed_seen_store_from_json()
+
+        # Parsed file contents keyed by (path, mtime, size) so repeated loads
+        # of an unchanged file skip the disk read and JSON decode
+        self._seen_cache: Optional[Dict[str, Set[str]]] = None
+        self._seen_cache_signature: Optional[Tuple[str, int, int]] = None
+        self._history_cache: Optional[List[Dict]] = None
+        self._history_cache_signature: Optional[Tuple[str, int, int]] = None
+        # False only while the file on disk is exactly what we last wrote after
+        # trimming, which lets cleanup_old_data skip a redundant load/trim/write
+        self._history_dirty = True
+
+        # Seen items staged by stage_seen_items() and written by flush()
+        self._pending_seen_items: Optional[Dict[str, Set[str]]] = None
+        self._seen_dirty = False
+        self._seen_last_flush: Optional[float] = None
+
+    @staticmethod
+    def _file_signature(path: Path) -> Optional[Tuple[str, int, int]]:
+        """Return a cheap change-detection signature for a file."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return (str(path), stat.st_mtime_ns, stat.st_size)
+
+    def warm(self):
+        """
+        Load seen items and session history concurrently on startup.
+
+        Both loads are plain file reads plus a JSON decode, so overlapping them
+        brings startup down to the slower of the two. Results land in the load
+        caches and are served from there until the files change.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            seen_future = executor.submit(self.load_seen_items)
+            history_future = executor.submit(self.load_session_history)
+            seen_future.result()
+            history_future.result()
     
     def load_seen_items(self) -> Dict[str, Set[str]]:
         """
@@ -32,24 +92,42 @@ class PersistenceManager:
         Returns:
             Dictionary mapping site keys to sets of seen watch IDs
         """
+        if self.seen_store is not None:
+            try:
+                result = self.seen_store.load()
+                self.logger.info(f"Loaded seen items: {sum(len(s) for s in result.values())} total")
+                return result
+            except Exception as e:
+                self.logger.error(f"Error loading seen items: {e}")
+                return {}
+        
         if not self.seen_items_file.exists():
             self.logger.info("Seen items file does not exist, starting fresh")
             return {}
         
+        signature = self._file_signature(self.seen_items_file)
+        if self._seen_cache is not None and signature == self._seen_cache_signature:
+            # Hand out copies so callers can mutate their sets freely
+            return {site_key: set(items) for site_key, items in self._seen_cache.items()}
+        
         try:
-            with open(self.seen_items_file, 'r', encoding='utf-8') as f:
+            with open(self.seen_items_file, 'rb') as f:
                 content = f.read()
                 if not content:
                     self.logger.warning("Seen items file is empty")
                     return {}
                 
-                data = json.loads(content)
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                data = orjson.loads(content) if orjson else json.loads(content)
                 
                 # Convert lists to sets for efficient lookup
                 result = {}
                 for site_key, items in data.items():
                     result[site_key] = set(items)
                 
+                self._seen_cache = {site_key: set(items) for site_key, items in result.items()}
+                self._seen_cache_signature = signature
+                
                 self.logger.info(f"Loaded seen items: {sum(len(s) for s in result.values())} total")
                 return result
                 
@@ -60,33 +138,175 @@ class PersistenceManager:
             self.logger.error(f"Error loading seen items: {e}")
             return {}
     
-    def save_seen_items(self, seen_items: Dict[str, Set[str]]):
+    def save_seen_items(self, seen_items: Dict[str, Set[str]]) -> bool:
         """
         Save seen watch IDs to file with strict limits enforced.
         
         Args:
             seen_items: Dictionary mapping site keys to sets of seen watch IDs
+        
+        Returns:
+            True if the items were written, False if the write failed
         """
+        if self.seen_store is not None:
+            return self._save_seen_items_sqlite(seen_items)
+        
         try:
-            # Trim items before saving to enforce strict limits
-            trimmed_items = self.trim_seen_items(seen_items)
-            
-            # Convert sets to lists for JSON serialization
-            serializable_items = {}
-            for site_key, items in trimmed_items.items():
-                serializable_items[site_key] = list(items)
+            max_items = APP_CONFIG.max_seen_items_per_site
             
             # Create directory if needed
             self.seen_items_file.parent.mkdir(parents=True, exist_ok=True)
             
-            # Write to file
-            with open(self.seen_items_file, 'w', encoding='utf-8') as f:
-                json.dump(serializable_items, f, indent=2, ensure_ascii=False)
+            # Trim and serialize one site at a time straight into the file so no
+            # trimmed or list-converted copy of the whole mapping is built
+            with open(self.seen_items_file, 'wb') as f:
+                f.write(b'{')
+                for index, (site_key, items) in enumerate(seen_items.items()):
+                    items_list = list(items)
+                    original_count = len(items_list)
+                    
+                    if original_count > max_items:
+                        # Keep the newest items (FIFO), same as trim_seen_items
+                        items_list = items_list[-max_items:]
+                        self.logger.warning(
+                            f"Trimmed seen items for {site_key}: "
+                            f"{original_count} -> {len(items_list)} items "
+                            f"(removed {original_count - len(items_list)} oldest items)"
+                        )
+                    
+                    f.write(b',\n  ' if index else b'\n  ')
+                    f.write(_dump_json_bytes(site_key))
+                    f.write(b': ')
+                    f.write(_dump_json_bytes(items_list))
+                f.write(b'\n}' if seen_items else b'}')
+            
+            # Callers hold the live sets; drop the startup copy instead of refreshing it
+            self._seen_cache = None
+            self._seen_cache_signature = None
+            
+            self.logger.debug("Saved seen items successfully")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Error saving seen items: {e}")
+            return False
+    
+    def stage_seen_items(self, seen_items: Dict[str, Set[str]]):
+        """
+        Record the latest seen items for a later flush without touching disk.
+        
+        Callers that update seen items several times per cycle (once per site)
+        stage each update and flush once, instead of rewriting the file on
+        every call.
+        
+        Args:
+            seen_items: Dictionary mapping site keys to sets of seen watch IDs
+        """
+        self._pending_seen_items = seen_items
+        self._seen_dirty = True
+    
+    def flush_if_needed(self, min_interval: float = 5.0) -> bool:
+        """
+        Write staged seen items if there are changes and enough time has passed.
+        
+        Args:
+            min_interval: Minimum seconds between two writes
+        
+        Returns:
+            True if the staged items were written
+        """
+        if not self._seen_dirty:
+            return False
+        
+        if (
+            self._seen_last_flush is not None
+            and time.monotonic() - self._seen_last_flush < min_interval
+        ):
+            return False
+        
+        return self.flush()
+    
+    def flush(self) -> bool:
+        """
+        Write staged seen items immediately (e.g. on shutdown).
+        
+        Returns:
+            True if the staged items were written; on failure they stay staged
+        """
+        if not self._seen_dirty or self._pending_seen_items is None:
+            return False
+        
+        # Failed attempts still count toward min_interval so a broken disk is
+        # retried at the normal pace rather than on every call
+        self._seen_last_flush = time.monotonic()
+        if not self.save_seen_items(self._pending_seen_items):
+            return False
+        
+        self._seen_dirty = False
+        return True
+    
+    def _save_seen_items_sqlite(self, seen_items: Dict[str, Set[str]]) -> bool:
+        """Sync seen IDs into the SQLite store and apply FIFO limits there."""
+        try:
+            self.seen_store.sync(seen_items)
+            
+            max_items = APP_CONFIG.max_seen_items_per_site
+            for site_key, items in seen_items.items():
+                evicted = self.seen_store.trim(site_key, max_items)
+                if evicted:
+                    # Forget evicted IDs in memory too, otherwise the next sync
+                    # sees them as new and re-inserts them as the newest rows
+                    items.difference_update(evicted)
+                    self.logger.warning(
+                        f"Trimmed seen items for {site_key}: "
+                        f"removed {len(evicted)} oldest items (limit {max_items})"
+                    )
             
             self.logger.debug("Saved seen items successfully")
+            return True
             
         except Exception as e:
             self.logger.error(f"Error saving seen items: {e}")
+            return False
+    
+    def _seed_seen_store_from_json(self):
+        """
+        Import an existing seen items JSON file into a new SQLite store.
+        
+        Switching an install to the sqlite backend would otherwise start from
+        an empty database and report every listed watch as new. The JSON file
+        is left in place so the switch can be reverted.
+        """
+        if not self.seen_items_file.exists():
+            return
+        
+        try:
+            with open(self.seen_items_file, 'rb') as f:
+                content = f.read()
+            if not content:
+                return
+            
+            data = orjson.loads(content) if orjson else json.loads(content)
+            # One call per site keeps the file's oldest-to-newest order in rowid
+            for site_key, items in data.items():
+                self.seen_store.record_seen(site_key, items)
+            
+            self.logger.info(
+                f"Imported {sum(len(items) for items in data.values())} seen items "
+                f"from {self.seen_items_file} into the SQLite store"
+            )
+        except Exception as e:
+            self.logger.error(f"Error importing seen items from {self.seen_items_file}: {e}")
+    
+    def close(self):
+        """
+        Release the SQLite connection when the sqlite backend is in use.
+        
+        The store stays selected, so a save after close fails loudly instead
+        of quietly falling back to the JSON file.
+        """
+        if self.seen_store is not None:
+            self.seen_store.close()
     
     def trim_seen_items(self, seen_items: Dict[str, Set[str]]) -> Dict[str, Set[str]]:
         """
@@ -145,13 +365,21 @@ class PersistenceManager:
         if not self.session_history_file.exists():
             return []
         
+        signature = self._file_signature(self.session_history_file)
+        if self._history_cache is not None and signature == self._history_cache_signature:
+            return list(self._history_cache)
+        
         try:
             with open(self.session_history_file, 'r', encoding='utf-8') as f:
                 content = f.read()
                 if not content:
                     return []
                 
-                return json.loads(content)
+                history = json.loads(content)
+                self._history_cache = list(history)
+                self._history_cache_signature = signature
+                self._history_dirty = True
+                return history
                 
         except Exception as e:
             self.logger.error(f"Error loading session history: {e}")
@@ -168,11 +396,9 @@ class PersistenceManager:
             # Load existing history
             history = self.load_session_history()
 
-            # Trim to enforce strict limits BEFORE appending (prevents memory spikes)
-            history = self.trim_session_history(history)
-
-            # Add new session
+            # Add new session, then trim so the file never exceeds the limits
             history.append(session.to_dict())
+            history = self.trim_session_history(history)
             
             # Create directory if needed
             self.session_history_file.parent.mkdir(parents=True, exist_ok=True)
@@ -181,6 +407,10 @@ class PersistenceManager:
             with open(self.session_history_file, 'w', encoding='utf-8') as f:
                 json.dump(history, f, indent=2, ensure_ascii=False)
             
+            self._history_cache = list(history)
+            self._history_cache_signature = self._file_signature(self.session_history_file)
+            self._history_dirty = False
+            
             self.logger.info(f"Saved session {session.session_id} to history")
             
         except Exception as e:
@@ -209,14 +439,33 @@ class PersistenceManager:
                     "average_duration": 0.0
                 }
             
-            # Filter by date
+            # Filter by date and accumulate every statistic in one pass
             cutoff_date = datetime.now() - timedelta(days=days)
-            recent_sessions = [
-                s for s in history
-                if datetime.fromisoformat(s['started_at']) > cutoff_date
-            ]
+            total_sessions = 0
+            successful_sessions = 0
+            total_watches = 0
+            total_new = 0
+            total_notifications = 0
+            duration_sum = 0
+            duration_count = 0
+            
+            for s in history:
+                if datetime.fromisoformat(s['started_at']) <= cutoff_date:
+                    continue
+                
+                total_sessions += 1
+                if s.get('errors_encountered', 0) == 0:
+                    successful_sessions += 1
+                total_watches += s.get('total_watches_found', 0)
+                total_new += s.get('total_new_watches', 0)
+                total_notifications += s.get('notifications_sent', 0)
+                
+                duration = s.get('duration_seconds')
+                if duration:
+                    duration_sum += duration
+                    duration_count += 1
             
-            if not recent_sessions:
+            if not total_sessions:
                 return {
                     "total_sessions": 0,
                     "total_watches_found": 0,
@@ -226,15 +475,7 @@ class PersistenceManager:
                     "average_duration": 0.0
                 }
             
-            # Calculate statistics
-            total_sessions = len(recent_sessions)
-            successful_sessions = sum(1 for s in recent_sessions if s.get('errors_encountered', 0) == 0)
-            total_watches = sum(s.get('total_watches_found', 0) for s in recent_sessions)
-            total_new = sum(s.get('total_new_watches', 0) for s in recent_sessions)
-            total_notifications = sum(s.get('notifications_sent', 0) for s in recent_sessions)
-            
-            durations = [s.get('duration_seconds', 0) for s in recent_sessions if s.get('duration_seconds')]
-            avg_duration = sum(durations) / len(durations) if durations else 0
+            avg_duration = duration_sum / duration_count if duration_count else 0
             
             return {
                 "total_sessions": total_sessions,
@@ -296,9 +537,27 @@ class PersistenceManager:
         
         return history
     
+    @staticmethod
+    def _history_has_expired_entries(history: List[Dict]) -> bool:
+        """Check whether the oldest (first) session is past the retention cutoff."""
+        if not history or APP_CONFIG.session_history_retention_days <= 0:
+            return False
+        cutoff_date = datetime.now() - timedelta(days=APP_CONFIG.session_history_retention_days)
+        return datetime.fromisoformat(history[0]['started_at']) <= cutoff_date
+    
     def cleanup_old_data(self):
         """Clean up old data files and entries."""
         try:
+            # save_session already trimmed what is on disk; nothing to do until
+            # the file changes underneath us or its oldest entry ages out
+            if (
+                not self._history_dirty
+                and self._history_cache is not None
+                and self._file_signature(self.session_history_file) == self._history_cache_signature
+                and not self._history_has_expired_entries(self._history_cache)
+            ):
+                return
+            
             # Clean session history
             if self.session_history_file.exists():
                 history = self.load_session_history()
@@ -308,9 +567,14 @@ class PersistenceManager:
                     with open(self.session_history_file, 'w', encoding='utf-8') as f:
                         json.dump(cleaned_history, f, indent=2, ensure_ascii=False)
                     
+                    self._history_cache = list(cleaned_history)
+                    self._history_cache_signature = self._file_signature(self.session_history_file)
+                    
                     self.logger.info(
                         f"Cleaned session history: {len(history)} -> {len(cleaned_history)} sessions"
                     )
+                
+                self._history_dirty = False
             
         except Exception as e:
             self.logger.error(f"Error during cleanup: {e}")
\ No newline at end of file
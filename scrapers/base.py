@@ -2,11 +2,14 @@
 
 import asyncio
 import logging
+import re
 from abc import ABC, abstractmethod
-from typing import List, Set, Optional, Dict, Any
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import List, Set, Optional, Dict, Any, AsyncIterator
 from urllib.parse import urljoin
 import aiohttp
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from config import SiteConfig, APP_CONFIG
 from models import WatchData
@@ -20,10 +23,29 @@ from utils import (
     extract_text_from_element,
 )
 
+# Characters dropped from reference numbers
+_REF_STRIP_RE = re.compile(r"[^\w\-.]")
+
+
+def listing_strainer(tag: str, *css_classes: str) -> SoupStrainer:
+    """
+    Build a strainer matching ``tag`` elements that carry any of ``css_classes``.
+
+    The class attribute is matched as a whitespace-separated word because the
+    strainer sees the raw attribute string while parsing, so ``class_="watch"``
+    alone would miss ``class="watch sold"``.
+    """
+    classes = "|".join(re.escape(css_class) for css_class in css_classes)
+    return SoupStrainer(tag, class_=re.compile(rf"(?:^|\s)(?:{classes})(?:\s|$)"))
+
 
 class BaseScraper(ABC):
     """Abstract base class for all watch scrapers."""
 
+    # Optional strainer limiting listing page parsing to the watch elements.
+    # Scrapers that leave this as None get the full document.
+    LISTING_STRAINER: Optional[SoupStrainer] = None
+
     def __init__(self, config: SiteConfig, session: aiohttp.ClientSession, logger):
         """
         Initialize scraper.
@@ -37,6 +59,7 @@ class BaseScraper(ABC):
         self.session = session
         self.logger = ContextLogger(logger, {"site": config.key})
         self.seen_ids: Set[str] = set()
+        self._brand_prefix_re = self._compile_brand_prefixes(config.known_brands)
 
     def set_seen_ids(self, seen_ids: Set[str]):
         """Update the set of seen watch IDs."""
@@ -50,7 +73,6 @@ class BaseScraper(ABC):
             List of new watches found
         """
         with PerformanceLogger(self.logger.logger, f"scraping {self.config.name}"):
-            soup = None
             try:
                 # Fetch listing page
                 self.logger.info(f"Fetching listing page: {self.config.url}")
@@ -62,20 +84,13 @@ class BaseScraper(ABC):
                     self.logger.error("Failed to fetch listing page")
                     return []
 
-                # Parse watches
-                soup = BeautifulSoup(content, "lxml")
-
-                # CRITICAL FIX: Delete content string immediately after soup creation
-                # to prevent memory leak from accumulating large HTML strings
-                del content
-                content = None
+                # Parse watches; the soup is decomposed as soon as extraction is done
+                async with self._parsed_soup(content, self.LISTING_STRAINER) as soup:
+                    # CRITICAL FIX: Delete content string immediately after soup creation
+                    # to prevent memory leak from accumulating large HTML strings
+                    del content
 
-                watches = await self._extract_watches(soup)
-
-                # Clean up soup object immediately after parsing
-                self._cleanup_soup(soup)
-                del soup
-                soup = None
+                    watches = await self._extract_watches(soup)
 
                 self.logger.info(f"Found {len(watches)} watches on listing page")
 
@@ -88,17 +103,20 @@ class BaseScraper(ABC):
                             f"ID: {watch.composite_id[:12]}..."
                         )
 
-                # Filter new watches
+                # Filter new watches (only build per-watch debug messages when
+                # they will actually be emitted)
+                debug_enabled = self.logger.logger.isEnabledFor(logging.DEBUG)
                 new_watches = []
                 for watch in watches:
                     composite_id = watch.composite_id
                     if composite_id not in self.seen_ids:
                         new_watches.append(watch)
                         self.seen_ids.add(composite_id)
-                        self.logger.debug(
-                            f"New watch detected: {watch.title[:50]}... (ID: {composite_id[:8]}...)"
-                        )
-                    else:
+                        if debug_enabled:
+                            self.logger.debug(
+                                f"New watch detected: {watch.title[:50]}... (ID: {composite_id[:8]}...)"
+                            )
+                    elif debug_enabled:
                         self.logger.debug(
                             f"Already seen: {watch.title[:50]}... (ID: {composite_id[:8]}...)"
                         )
@@ -116,10 +134,6 @@ class BaseScraper(ABC):
             except Exception as e:
                 self.logger.exception(f"Error during scraping: {e}")
                 return []
-            finally:
-                # Ensure soup is cleaned up even if an exception occurs
-                if soup is not None:
-                    self._cleanup_soup(soup)
 
     @abstractmethod
     async def _extract_watches(self, soup: BeautifulSoup) -> List[WatchData]:
@@ -141,21 +155,45 @@ class BaseScraper(ABC):
         Args:
             watches: List of watches to fetch details for
         """
-        # Limit concurrent detail fetches
-        semaphore = asyncio.Semaphore(APP_CONFIG.max_concurrent_details)
+        # Listings that already supplied every notification field skip the
+        # detail request entirely
+        watches = [watch for watch in watches if watch.needs_detail()]
+        if not watches:
+            return
 
-        async def fetch_single_detail(watch: WatchData):
-            async with semaphore:
+        # A fixed pool of workers pulls watches from a shared iterator, so only
+        # max_concurrent_details detail pages are in flight (and in memory) at
+        # once, regardless of how many new watches the listing produced.
+        pending = iter(watches)
+        worker_count = max(1, min(APP_CONFIG.max_concurrent_details, len(watches)))
+
+        # Space request starts evenly instead of idling each worker after its
+        # fetch: the site still sees at most max_concurrent_details requests
+        # per detail_page_delay, but a slow response no longer adds the full
+        # delay on top before that worker can start its next request.
+        start_interval = APP_CONFIG.detail_page_delay / max(
+            1, APP_CONFIG.max_concurrent_details
+        )
+        loop = asyncio.get_running_loop()
+        next_start = loop.time()
+
+        async def wait_for_start_slot():
+            nonlocal next_start
+            now = loop.time()
+            slot = max(now, next_start)
+            next_start = slot + start_interval
+            if slot > now:
+                await asyncio.sleep(slot - now)
+
+        async def detail_worker():
+            for watch in pending:
                 try:
+                    await wait_for_start_slot()
                     await self._fetch_single_watch_detail(watch)
-                    # Add delay between requests
-                    await asyncio.sleep(APP_CONFIG.detail_page_delay)
                 except Exception as e:
                     self.logger.error(f"Error fetching details for {watch.url}: {e}")
 
-        # Fetch all details concurrently
-        tasks = [fetch_single_detail(watch) for watch in watches]
-        await asyncio.gather(*tasks)
+        await asyncio.gather(*(detail_worker() for _ in range(worker_count)))
 
     async def _fetch_single_watch_detail(self, watch: WatchData):
         """
@@ -170,24 +208,15 @@ class BaseScraper(ABC):
         if not content:
             return
 
-        soup = None
-        try:
-            soup = BeautifulSoup(content, "lxml")
-
+        async with self._parsed_soup(content) as soup:
             # CRITICAL FIX: Delete content string immediately after soup creation
             # to prevent memory leak from accumulating large HTML strings
             del content
-            content = None
 
             # Call site-specific detail extraction
             await self._extract_watch_details(watch, soup)
 
             watch.detail_scraped = True
-        finally:
-            # Clean up soup object after use
-            if soup is not None:
-                self._cleanup_soup(soup)
-                del soup
 
     async def _extract_watch_details(self, watch: WatchData, soup: BeautifulSoup):
         """
@@ -200,6 +229,34 @@ class BaseScraper(ABC):
         """
         pass
 
+    @asynccontextmanager
+    async def _parsed_soup(
+        self, content: str, parse_only: Optional[SoupStrainer] = None
+    ) -> AsyncIterator[BeautifulSoup]:
+        """
+        Parse HTML and decompose the soup when the block exits.
+
+        Tree building runs in the default executor so other sites' fetches
+        keep being serviced by the event loop while a large page is parsed.
+
+        Args:
+            content: HTML to parse
+            parse_only: Optional strainer limiting which elements are parsed
+
+        Yields:
+            BeautifulSoup of the content
+        """
+        loop = asyncio.get_running_loop()
+        soup = await loop.run_in_executor(
+            None, partial(BeautifulSoup, content, "lxml", parse_only=parse_only)
+        )
+        # Only the tree needs to stay alive; release this frame's HTML reference
+        del content
+        try:
+            yield soup
+        finally:
+            self._cleanup_soup(soup)
+
     def _cleanup_soup(self, soup: BeautifulSoup):
         """
         Explicitly clean up BeautifulSoup object to release memory.
@@ -237,6 +294,18 @@ class BaseScraper(ABC):
 
         return price_text
 
+    @staticmethod
+    def _compile_brand_prefixes(known_brands: Dict[str, str]) -> Optional[re.Pattern]:
+        """
+        Compile known brand keys into one anchored alternation.
+
+        Alternatives are tried in dict order, so the first brand that prefixes
+        a title wins exactly as with a sequential startswith scan.
+        """
+        if not known_brands:
+            return None
+        return re.compile("|".join(re.escape(brand) for brand in known_brands))
+
     def _extract_brand_model(self, title: str) -> tuple[Optional[str], Optional[str]]:
         """
         Extract brand and model from title using known brands.
@@ -253,22 +322,25 @@ class BaseScraper(ABC):
         title_lower = title.lower()
 
         # Check known brands
-        for brand_lower, brand_proper in self.config.known_brands.items():
-            if title_lower.startswith(brand_lower):
-                # Extract model as remainder after brand
-                model_text = title[len(brand_lower) :].strip()
+        match = self._brand_prefix_re.match(title_lower) if self._brand_prefix_re else None
+        if match:
+            brand_lower = match.group(0)
+            brand_proper = self.config.known_brands[brand_lower]
+
+            # Extract model as remainder after brand
+            model_text = title[len(brand_lower) :].strip()
 
-                # Clean up model text
-                if model_text.startswith("-") or model_text.startswith("|"):
-                    model_text = model_text[1:].strip()
+            # Clean up model text
+            if model_text.startswith("-") or model_text.startswith("|"):
+                model_text = model_text[1:].strip()
 
-                return brand_proper, model_text if model_text else None
+            return brand_proper, model_text if model_text else None
 
         # If no known brand, try to split by common patterns
         # This is a fallback and may not be accurate
-        parts = title.split(" ", 1)
-        if len(parts) >= 2:
-            return parts[0], parts[1]
+        head, sep, tail = title.partition(" ")
+        if sep:
+            return head, tail
 
         return title, None
 
@@ -294,8 +366,6 @@ class BaseScraper(ABC):
                 ref = ref[len(prefix) :].strip()
 
         # Remove special characters but keep alphanumeric and dashes
-        import re
-
-        ref = re.sub(r"[^\w\-.]", "", ref)
+        ref = _REF_STRIP_RE.sub("", ref)
 
         return ref if ref else None
@@ -4,21 +4,40 @@ import re
 from typing import List, Optional
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
+import soupsieve as sv
 
-from scrapers.base import BaseScraper
+from scrapers.base import BaseScraper, listing_strainer
 from models import WatchData
 from utils import parse_price, parse_year, parse_box_papers, parse_condition, extract_text_from_element, parse_table_data
 
 
+_DETAILS_HEADING_RE = re.compile(r'Details', re.I)
+
+# Listing row selectors, compiled once and reused for every row
+_SEL_LINK = sv.compile('figure a')
+_SEL_IMG = sv.compile('figure a img')
+_SEL_TITLE = sv.compile('section.fh h1')
+_SEL_BRAND = sv.compile('span a')
+_SEL_PRICE = sv.compile('section.fh p')
+
+# Listing and detail page selectors, compiled once per process
+_SEL_ITEMS = sv.compile('article.watch')
+_SEL_DETAIL_TITLE = sv.compile('div.c-7.do-lefty h1.lowpad-b')
+_SEL_DETAIL_PRICE = sv.compile('h1.lowpad-b + p')
+_SEL_DETAILS = sv.compile('div.c-7.do-lefty')
+
+
 class GrimmeissenScraper(BaseScraper):
     """Scraper for Grimmeissen website."""
+
+    LISTING_STRAINER = listing_strainer("article", "watch")
     
     async def _extract_watches(self, soup: BeautifulSoup) -> List[WatchData]:
         """Extract watches from Grimmeissen listing page."""
         watches = []
         
         # Use exact selectors from original implementation
-        watch_elements = soup.select('article.watch')
+        watch_elements = _SEL_ITEMS.select(soup)
         
         for watch_tag in watch_elements:
             try:
@@ -34,36 +53,37 @@ class GrimmeissenScraper(BaseScraper):
         """Parse a single watch element from listing page - matching original logic exactly."""
         
         # Extract URL
-        link_tag_listing = watch_tag.select_one('figure a')
+        link_tag_listing = _SEL_LINK.select_one(watch_tag)
         if not link_tag_listing or not link_tag_listing.has_attr('href'):
             return None
         
         url = urljoin(self.config.base_url, link_tag_listing['href'])
         
         # Extract image URL
-        img_tag_listing = watch_tag.select_one('figure a img')
+        img_tag_listing = _SEL_IMG.select_one(watch_tag)
         image_url = None
         if img_tag_listing and img_tag_listing.has_attr('data-src'):
             image_url = urljoin(self.config.base_url, img_tag_listing['data-src'])
         
         # Extract title from listing
-        title_listing_tag = watch_tag.select_one('section.fh h1')
+        title_listing_tag = _SEL_TITLE.select_one(watch_tag)
         title = extract_text_from_element(title_listing_tag) if title_listing_tag else "Unknown Watch"
         
         # Extract brand from title (original logic)
         brand = None
         model = None
         if title_listing_tag:
-            brand_tag = title_listing_tag.select_one("span a")
+            brand_tag = _SEL_BRAND.select_one(title_listing_tag)
             if brand_tag:
                 brand = extract_text_from_element(brand_tag)
-                # Extract model by removing brand from title
-                model = extract_text_from_element(title_listing_tag, separator=" ").replace(brand, "").strip()
+                # Extract model by removing the leading brand from the title (same
+                # text as title, extract_text_from_element joins with a space by default)
+                model = title.removeprefix(brand).strip(" -|")
             else:
                 model = title
         
         # Extract price from listing
-        price_listing_tag = watch_tag.select_one('section.fh p')
+        price_listing_tag = _SEL_PRICE.select_one(watch_tag)
         price = None
         if price_listing_tag:
             price_text_raw = extract_text_from_element(price_listing_tag)
@@ -87,20 +107,20 @@ class GrimmeissenScraper(BaseScraper):
         """Extract additional details from Grimmeissen detail page - matching original exactly."""
         
         # Update title and brand from detail page if available
-        title_detail_tag = soup.select_one("div.c-7.do-lefty h1.lowpad-b")
+        title_detail_tag = _SEL_DETAIL_TITLE.select_one(soup)
         if title_detail_tag:
             watch.title = extract_text_from_element(title_detail_tag)
             
             # Extract brand from detail page
-            brand_detail_tag = title_detail_tag.select_one("span a")
+            brand_detail_tag = _SEL_BRAND.select_one(title_detail_tag)
             if brand_detail_tag:
                 watch.brand = extract_text_from_element(brand_detail_tag)
-                # Update model by removing brand from title
-                watch.model = extract_text_from_element(title_detail_tag, separator=" ").replace(watch.brand, "").strip()
+                # Update model by removing the leading brand from the title
+                watch.model = watch.title.removeprefix(watch.brand).strip(" -|")
         
         # Extract price from detail page (fallback/override if missing or different)
         # Selector: sibling paragraph of the title h1
-        price_detail_tag = soup.select_one("h1.lowpad-b + p")
+        price_detail_tag = _SEL_DETAIL_PRICE.select_one(soup)
         if price_detail_tag:
             price_text = extract_text_from_element(price_detail_tag)
             if price_text:
@@ -109,7 +129,7 @@ class GrimmeissenScraper(BaseScraper):
                     watch.price = parsed_price
         
         # Parse details from tables - exact mapping from original
-        details_container = soup.select_one("div.c-7.do-lefty")
+        details_container = _SEL_DETAILS.select_one(soup)
         if details_container:
             # First table with main details
             table1_map = {
@@ -120,7 +140,7 @@ class GrimmeissenScraper(BaseScraper):
                 "Durchmesser": "diameter"
             }
             
-            table1 = details_container.select_one("table:nth-of-type(1)")
+            table1 = details_container.find("table")
             table1_data = self._parse_details_from_table_th_td(table1, table1_map)
             
             # Extract reference
@@ -148,7 +168,7 @@ class GrimmeissenScraper(BaseScraper):
                 watch.diameter = table1_data["diameter"]
             
             # Look for second table with "Details" section for box/papers info
-            h3_details_tag = details_container.find('h3', string=re.compile(r'Details', re.I))
+            h3_details_tag = details_container.find('h3', string=_DETAILS_HEADING_RE)
             lieferumfang_text = ""
             
             if h3_details_tag:
@@ -173,16 +193,18 @@ class GrimmeissenScraper(BaseScraper):
         
         try:
             # Find all table rows with th and td
-            for row in container.select("tr"):
-                th_elem = row.select_one("th")
-                td_elem = row.select_one("td")
+            for row in container.find_all("tr"):
+                th_elem = row.find("th")
+                td_elem = row.find("td")
                 
                 if th_elem and td_elem:
                     # Clean header text and remove colon
                     header = extract_text_from_element(th_elem).replace(":", "").strip()
-                    value = extract_text_from_element(td_elem)
+                    if header not in headers_map:
+                        continue
                     
-                    if header in headers_map and value:
+                    value = extract_text_from_element(td_elem)
+                    if value:
                         details[headers_map[header]] = value
         
         except Exception as e:
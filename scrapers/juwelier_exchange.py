@@ -5,21 +5,54 @@ from typing import List, Optional
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 import json
+import soupsieve as sv
 
-from scrapers.base import BaseScraper
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from scrapers.base import BaseScraper, listing_strainer
 from models import WatchData
 from utils import parse_price, parse_year, parse_box_papers, parse_condition, extract_text_from_element
 
 
+# Patterns used on every detail page
+# Diameter, rectangular case dimensions and case material are found in a
+# single scan of the description; each alternative has one named group.
+_DIA_PATTERN = r'(?:Durchmesser|Gehäusedurchmesser|Gehäusegröße)\s*(?:von|ca\.)?\s*(?P<dia>\d{1,2}(?:[,.]\d{1,2})?)\s*mm'
+_DIA_RECT_PATTERN = r'(?P<rect>\d{1,2}(?:[,.]\d{1,2})?)\s*x\s*\d{1,2}(?:[,.]\d{1,2})?\s*mm'
+_MAT_PATTERN = r'(?:Gehäuse aus |Material: |aus |Kaliber\s+\d+\s+)\b(?P<mat>Stahl|Edelstahl|Gold|Gelbgold|Weißgold|Rotgold|Roségold|Titan|Keramik|Silber(?:,\s*vergoldet)?|PVD-Beschichtung|Rosévergoldung|750er Gold|333er Gold|925er Silber)\b'
+_DESC_SPECS_RE = re.compile("|".join((_DIA_PATTERN, _DIA_RECT_PATTERN, _MAT_PATTERN)), re.IGNORECASE)
+_GENDER_PREFIX_RE = re.compile(r"^(Herrenuhr|Damenuhr|Unisexuhr)\s+", re.IGNORECASE)
+_TRAIL_RE = re.compile(r'\s*(Automatik|Quarz|Chrono|GMT|Date)$', re.IGNORECASE)
+
+# srcset markers in order of preference; anything else ranks after them
+_SRCSET_PREFERENCE = ("1920x1920.webp", "800x800.webp", "400x400.webp", ".webp")
+
+# Listing card selectors, compiled once and reused for every card
+_SEL_LINK = sv.compile('a.card-body-link')
+_SEL_IMG = sv.compile('img.product-image')
+_SEL_PRICE = sv.compile('span.product-price')
+
+# Listing and detail page selectors, compiled once per process
+_SEL_ITEMS = sv.compile('div.card.product-box[data-product-information]')
+_SEL_DETAIL_TITLE = sv.compile('h1.product-detail-name')
+_SEL_PROPERTIES_TABLE = sv.compile('table.product-detail-properties-table')
+_SEL_DESCRIPTION = sv.compile('div.product-detail-description-text[itemprop="description"]')
+
+
 class JuwelierExchangeScraper(BaseScraper):
     """Scraper for Juwelier Exchange website."""
+
+    LISTING_STRAINER = listing_strainer("div", "product-box")
     
     async def _extract_watches(self, soup: BeautifulSoup) -> List[WatchData]:
         """Extract watches from Juwelier Exchange listing page."""
         watches = []
         
         # Use exact selectors from original implementation
-        watch_elements = soup.select('div.card.product-box[data-product-information]')
+        watch_elements = _SEL_ITEMS.select(soup)
         
         for item_tag in watch_elements:
             try:
@@ -35,7 +68,7 @@ class JuwelierExchangeScraper(BaseScraper):
         """Parse a single watch element from listing page - matching original logic exactly."""
         
         # Extract URL
-        link_tag = item_tag.select_one('a.card-body-link')
+        link_tag = _SEL_LINK.select_one(item_tag)
         if not (link_tag and link_tag.has_attr('href')):
             return None
         
@@ -43,27 +76,19 @@ class JuwelierExchangeScraper(BaseScraper):
         
         # Extract image URL with srcset logic from original
         image_url = None
-        img_tag = item_tag.select_one('img.product-image')
+        img_tag = _SEL_IMG.select_one(item_tag)
         if img_tag:
             # Simplified srcset logic from original
             srcset = img_tag.get('srcset', '')
             if srcset:
                 # Prefer higher resolution webp, then jpg, then src
-                potential_srcs = [s.strip().split(" ")[0] for s in srcset.split(",")]
-                best_src = img_tag.get('src', '')  # fallback to src
-                for res in ["1920x1920.webp", "800x800.webp", "400x400.webp", ".webp"]:  # Order of preference
-                    for p_src in potential_srcs:
-                        if res in p_src:
-                            best_src = p_src
-                            break
-                    if res in best_src:
-                        break  # Found preferred type
+                best_src = self._pick_srcset_image(srcset) or img_tag.get('src', '')  # fallback to src
                 image_url = urljoin(self.config.base_url, best_src)
             elif img_tag.has_attr('src'):
                 image_url = urljoin(self.config.base_url, img_tag['src'])
         
         # Get price from listing first
-        price_tag_listing = item_tag.select_one('span.product-price')
+        price_tag_listing = _SEL_PRICE.select_one(item_tag)
         price = None
         if price_tag_listing:
             price_text_raw_listing = extract_text_from_element(price_tag_listing)
@@ -81,6 +106,34 @@ class JuwelierExchangeScraper(BaseScraper):
             image_url=image_url
         )
     
+    @staticmethod
+    def _pick_srcset_image(srcset: str) -> Optional[str]:
+        """
+        Pick the preferred image URL from a srcset in a single pass.
+
+        Candidates are ranked by _SRCSET_PREFERENCE (earlier entries win), then
+        by width descriptor; ties keep srcset order.
+        """
+        best_src = None
+        best_key = None
+        for candidate in srcset.split(","):
+            parts = candidate.split()
+            if not parts:
+                continue
+            src = parts[0]
+            width = 0
+            if len(parts) > 1 and parts[1].endswith("w") and parts[1][:-1].isdigit():
+                width = int(parts[1][:-1])
+            rank = len(_SRCSET_PREFERENCE)
+            for i, marker in enumerate(_SRCSET_PREFERENCE):
+                if marker in src:
+                    rank = i
+                    break
+            key = (rank, -width)
+            if best_key is None or key < best_key:
+                best_src, best_key = src, key
+        return best_src
+    
     async def _extract_watch_details(self, watch: WatchData, soup: BeautifulSoup):
         """Extract additional details from Juwelier Exchange detail page - matching original exactly."""
         
@@ -92,26 +145,37 @@ class JuwelierExchangeScraper(BaseScraper):
         }
         
         # Parse JSON-LD Data first (original logic)
-        json_ld_script = soup.find("script", type="application/ld+json", string=re.compile(r'"@type": "Product"'))
-        if json_ld_script:
+        # Plain substring check per script; only the Product blob gets parsed
+        json_ld_text = None
+        for script in soup.find_all("script", type="application/ld+json"):
+            text = script.string or script.get_text()
+            if text and '"@type": "Product"' in text:
+                # Plain str: orjson rejects NavigableString
+                json_ld_text = str(text)
+                break
+        if json_ld_text:
             try:
-                json_data = json.loads(json_ld_script.string)
+                json_data = orjson.loads(json_ld_text) if orjson else json.loads(json_ld_text)
                 if json_data.get("name"):
                     details["title"] = json_data["name"]
-                if json_data.get("brand", {}).get("name"):
-                    details["brand"] = json_data["brand"]["name"]
+                brand = json_data.get("brand")
+                if isinstance(brand, dict):
+                    if brand.get("name"):
+                        details["brand"] = brand["name"]
+                elif isinstance(brand, str) and brand:
+                    details["brand"] = brand
                 if json_data.get("description"):
                     details["description_main"] = json_data["description"]
             except Exception as e:
                 self.logger.error(f"Error parsing JSON-LD for Juwelier Exchange: {e}")
         
         # Override/Supplement with visible elements if JSON-LD is incomplete
-        title_tag = soup.select_one('h1.product-detail-name')
+        title_tag = _SEL_DETAIL_TITLE.select_one(soup)
         if title_tag and (details["title"] is None or not details["title"]):
             details["title"] = extract_text_from_element(title_tag)
         
         # Properties Table
-        properties_table = soup.select_one('table.product-detail-properties-table')
+        properties_table = _SEL_PROPERTIES_TABLE.select_one(soup)
         if properties_table:
             for row in properties_table.find_all('tr', class_='properties-row'):
                 label_tag = row.find('th', class_='properties-label')
@@ -134,7 +198,7 @@ class JuwelierExchangeScraper(BaseScraper):
                         details["case_material"] = value
         
         # Main Description (for year, box/papers, diameter, richer condition)
-        description_div = soup.select_one('div.product-detail-description-text[itemprop="description"]')
+        description_div = _SEL_DESCRIPTION.select_one(soup)
         full_description_text = ""
         if description_div:
             full_description_text = extract_text_from_element(description_div, separator=" ")
@@ -148,20 +212,30 @@ class JuwelierExchangeScraper(BaseScraper):
             details["papers_status"] = papers_status
             details["box_status"] = box_status
             
-            # Diameter from description
-            dia_match = re.search(r'(?:Durchmesser|Gehäusedurchmesser|Gehäusegröße)\s*(?:von|ca\.)?\s*(\d{1,2}(?:[,.]\d{1,2})?)\s*mm', full_description_text, re.IGNORECASE)
-            if dia_match:
-                details["diameter"] = dia_match.group(1).replace(',', '.') + " mm"
-            else:  # Check for format like "20,5 x 28 mm" for rectangular cases (take first dimension)
-                dia_match_rect = re.search(r'(\d{1,2}(?:[,.]\d{1,2})?)\s*x\s*\d{1,2}(?:[,.]\d{1,2})?\s*mm', full_description_text, re.IGNORECASE)
-                if dia_match_rect:
-                    details["diameter"] = dia_match_rect.group(1).replace(',', '.') + " mm"
+            # Diameter, rectangular dimensions and material in one pass; keep the
+            # first hit of each kind and stop once nothing more is needed
+            need_material = details["case_material"] is None
+            dia_text = rect_text = mat_text_raw = None
+            for spec_match in _DESC_SPECS_RE.finditer(full_description_text):
+                kind = spec_match.lastgroup
+                if kind == "dia" and dia_text is None:
+                    dia_text = spec_match.group("dia")
+                elif kind == "rect" and rect_text is None:
+                    rect_text = spec_match.group("rect")
+                elif kind == "mat" and mat_text_raw is None:
+                    mat_text_raw = spec_match.group("mat")
+                if dia_text is not None and (mat_text_raw is not None or not need_material):
+                    break
+            
+            # Diameter from description; fall back to format like "20,5 x 28 mm"
+            # for rectangular cases (take first dimension)
+            diameter_text = dia_text or rect_text
+            if diameter_text:
+                details["diameter"] = diameter_text.replace(',', '.') + " mm"
             
             # Case material from description if not found in table
-            if details["case_material"] is None:
-                mat_match = re.search(r'(?:Gehäuse aus |Material: |aus |Kaliber\s+\d+\s+)\b(Stahl|Edelstahl|Gold|Gelbgold|Weißgold|Rotgold|Roségold|Titan|Keramik|Silber(?:,\s*vergoldet)?|PVD-Beschichtung|Rosévergoldung|750er Gold|333er Gold|925er Silber)\b', full_description_text, re.IGNORECASE)
-                if mat_match:
-                    mat_text_raw = mat_match.group(1)
+            if need_material:
+                if mat_text_raw:
                     mat_text = mat_text_raw.lower()
                     if "stahl" in mat_text or "edelstahl" in mat_text:
                         details["case_material"] = "Steel"
@@ -187,7 +261,7 @@ class JuwelierExchangeScraper(BaseScraper):
         # Refine model extraction from title
         if details["brand"] and details["title"]:
             model_candidate = details["title"]
-            model_candidate = re.sub(r"^(Herrenuhr|Damenuhr|Unisexuhr)\s+", "", model_candidate, flags=re.IGNORECASE).strip()
+            model_candidate = _GENDER_PREFIX_RE.sub("", model_candidate).strip()
             model_candidate = re.sub(fr"^{re.escape(details['brand'])}\s*", "", model_candidate, flags=re.IGNORECASE).strip()
             
             # Try to extract from single quotes
@@ -198,7 +272,7 @@ class JuwelierExchangeScraper(BaseScraper):
                 temp_model = model_candidate
                 if details.get("reference") and details["reference"] in temp_model:
                     temp_model = temp_model.replace(details["reference"], "").strip(" |,-")
-                temp_model = re.sub(r'\s*(Automatik|Quarz|Chrono|GMT|Date)$', '', temp_model, flags=re.IGNORECASE).strip(" ,")
+                temp_model = _TRAIL_RE.sub('', temp_model).strip(" ,")
                 details["model"] = " ".join(temp_model.split()[:3]).strip() if temp_model else None
             
             if not details["model"] or details["model"].lower() == details["brand"].lower() or len(details["model"]) < 2:
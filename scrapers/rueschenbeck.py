@@ -1,30 +1,101 @@
 """Rüschenbeck scraper implementation."""
 
 import re
-from typing import List, Optional
-from bs4 import BeautifulSoup
+from typing import Iterator, List, Optional, Tuple
+from bs4 import BeautifulSoup, Tag
 from urllib.parse import urljoin
+import soupsieve as sv
 
-from scrapers.base import BaseScraper
+from scrapers.base import BaseScraper, listing_strainer
 from models import WatchData
 from utils import parse_price, parse_year, parse_box_papers, parse_condition, extract_text_from_element
 
 
+_REF_RE = re.compile(r'^([A-Za-z0-9\-./]+)')
+_DIA_RE = re.compile(r'(\d{1,2}(?:[.,]\d{1,2})?)\s*mm', re.IGNORECASE)
+_CLEAN_DIA_RE = re.compile(r'^\d+(\.\d+)?$')
+# Decimal comma to dot and spaces dropped in one pass over the diameter text
+_DIA_TRANSLATION = str.maketrans({',': '.', ' ': None})
+
+# Known watch brands keyed by the first (lowercase) URL slug word
+_SLUG_BRANDS = {
+    'rolex': 'Rolex', 'omega': 'Omega', 'patek': 'Patek Philippe',
+    'audemars': 'Audemars Piguet', 'cartier': 'Cartier', 'iwc': 'IWC',
+    'breitling': 'Breitling', 'panerai': 'Panerai', 'tudor': 'Tudor',
+    'jaeger': 'Jaeger-LeCoultre', 'hublot': 'Hublot', 'tag': 'TAG Heuer',
+    'vacheron': 'Vacheron Constantin', 'zenith': 'Zenith', 'longines': 'Longines',
+    'tissot': 'Tissot', 'seiko': 'Seiko', 'grand': 'Grand Seiko',
+    'chopard': 'Chopard', 'girard': 'Girard-Perregaux', 'blancpain': 'Blancpain',
+    'glashutte': 'Glashütte Original', 'a': 'A. Lange & Söhne'
+}
+
+# Spec label keywords, one lookahead per field in priority order: the first
+# field whose keyword appears anywhere in the label wins (e.g.
+# "gehäusedurchmesser" is a diameter, not a case material)
+_SPEC_LABEL_RE = re.compile(
+    r'^(?:'
+    r'(?=.*(?:jahr|year|baujahr))(?P<year_text>)'
+    r'|(?=.*(?:referenz|reference|ref))(?P<reference_text>)'
+    r'|(?=.*(?:durchmesser|diameter|größe))(?P<diameter_text>)'
+    r'|(?=.*(?:material|gehäuse))(?P<case_material_text>)'
+    r'|(?=.*(?:zustand|condition))(?P<condition_text>)'
+    r')',
+    re.DOTALL,
+)
+
+# Listing card selectors, compiled once and reused for every card
+_SEL_ITEMS = sv.compile('div.product-list-item.card.product-box')
+_SEL_LINK = sv.compile('a.card-body')
+_SEL_IMG = sv.compile('img.product-image')
+_SEL_PRODUCT_NUMBER = sv.compile('[data-product-number]')
+_SEL_PRICE = sv.compile('span.product-price')
+_SEL_CPO_BADGE = sv.compile('div.badge-cpo, .badge.badge-cpo')
+# All of the above in one selector, so a card is walked once; each hit is
+# then assigned with the cheap per-element match() of its own selector
+_SEL_CARD_PARTS = sv.compile(
+    'a.card-body, img.product-image, [data-product-number], span.product-price, '
+    'div.badge-cpo, .badge.badge-cpo'
+)
+_CARD_PART_SELECTORS = (
+    ("link", _SEL_LINK),
+    ("img", _SEL_IMG),
+    ("product_number", _SEL_PRODUCT_NUMBER),
+    ("price", _SEL_PRICE),
+    ("cpo_badge", _SEL_CPO_BADGE),
+)
+
+# Detail page selectors, compiled once per process
+_SEL_DETAIL_TITLE = sv.compile('div.product-name h1 span.prod-name')
+_SEL_DETAIL_BRAND = sv.compile('div.product-name h1 span.manufacturer-name')
+_SEL_DETAIL_MODEL = sv.compile('div.product-name h1 span.line-name')
+_SEL_SPECS = sv.compile('div.product-specifications, div.product-details, .product-info')
+_SEL_SPEC_CELLS = sv.compile('th, td')
+_SEL_DESCRIPTION = sv.compile('div.product-description, div.description, .product-details-description')
+_SEL_CONDITION = sv.compile('div.product-condition, .condition-info')
+_SEL_ACCESSORIES = sv.compile('div.product-accessories, .lieferumfang, .scope-delivery')
+
+
 class RueschenbeckScraper(BaseScraper):
     """Scraper for Rüschenbeck website."""
+
+    LISTING_STRAINER = listing_strainer("div", "product-list-item")
     
     async def _extract_watches(self, soup: BeautifulSoup) -> List[WatchData]:
         """Extract watches from Rüschenbeck listing page."""
         watches = []
 
         # Updated selector for new website structure (2025+)
-        watch_elements = soup.select('div.product-list-item.card.product-box')
+        watch_elements = _SEL_ITEMS.select(soup)
+
+        # Bound once so the per-row loop skips the attribute lookups
+        parse_watch_element = self._parse_watch_element
+        append_watch = watches.append
 
         for item_tag in watch_elements:
             try:
-                watch = self._parse_watch_element(item_tag)
+                watch = parse_watch_element(item_tag)
                 if watch:
-                    watches.append(watch)
+                    append_watch(watch)
             except Exception as e:
                 self.logger.error(f"Error parsing watch element: {e}")
         
@@ -33,8 +104,15 @@ class RueschenbeckScraper(BaseScraper):
     def _parse_watch_element(self, item_tag) -> Optional[WatchData]:
         """Parse a single watch element from listing page - updated for 2025 website structure."""
 
+        # Collect the first element for each card part in a single walk
+        parts = {}
+        for node in _SEL_CARD_PARTS.select(item_tag):
+            for part, selector in _CARD_PART_SELECTORS:
+                if part not in parts and selector.match(node):
+                    parts[part] = node
+
         # Extract URL and title from the main card link
-        link_tag = item_tag.select_one('a.card-body')
+        link_tag = parts.get("link")
         if not (link_tag and link_tag.has_attr('href')):
             return None
 
@@ -46,7 +124,7 @@ class RueschenbeckScraper(BaseScraper):
         full_title_from_listing = link_tag.get('data-title', 'Unknown Watch')
 
         # Extract image URL
-        img_tag = item_tag.select_one('img.product-image')
+        img_tag = parts.get("img")
         image_url = None
         if img_tag:
             # Prefer srcset for higher resolution, fallback to src
@@ -73,25 +151,13 @@ class RueschenbeckScraper(BaseScraper):
             # Remove the "certified-pre-owned" suffix
             slug_parts = url_path.replace('-certified-pre-owned', '').split('-')
 
-            # Known watch brands (lowercase)
-            known_brands = {
-                'rolex': 'Rolex', 'omega': 'Omega', 'patek': 'Patek Philippe',
-                'audemars': 'Audemars Piguet', 'cartier': 'Cartier', 'iwc': 'IWC',
-                'breitling': 'Breitling', 'panerai': 'Panerai', 'tudor': 'Tudor',
-                'jaeger': 'Jaeger-LeCoultre', 'hublot': 'Hublot', 'tag': 'TAG Heuer',
-                'vacheron': 'Vacheron Constantin', 'zenith': 'Zenith', 'longines': 'Longines',
-                'tissot': 'Tissot', 'seiko': 'Seiko', 'grand': 'Grand Seiko',
-                'chopard': 'Chopard', 'girard': 'Girard-Perregaux', 'blancpain': 'Blancpain',
-                'glashutte': 'Glashütte Original', 'a': 'A. Lange & Söhne'
-            }
-
             if slug_parts:
                 # First part is typically the brand
                 first_part = slug_parts[0].lower()
-                brand = known_brands.get(first_part, slug_parts[0].title())
+                brand = _SLUG_BRANDS.get(first_part, slug_parts[0].title())
 
                 # Try to extract reference from data-product-number attribute
-                price_wrapper = item_tag.select_one('[data-product-number]')
+                price_wrapper = parts.get("product_number")
                 if price_wrapper:
                     product_number = price_wrapper.get('data-product-number', '')
                     # Format: "16710#*510918" -> reference is "16710"
@@ -116,7 +182,7 @@ class RueschenbeckScraper(BaseScraper):
 
         # Fallback: extract reference from title if not found
         if not reference and full_title_from_listing:
-            ref_match = re.match(r'^([A-Za-z0-9\-./]+)', full_title_from_listing)
+            ref_match = _REF_RE.match(full_title_from_listing)
             if ref_match:
                 potential_ref = ref_match.group(1)
                 if not (potential_ref.lower() == "certified" or
@@ -125,7 +191,7 @@ class RueschenbeckScraper(BaseScraper):
 
         # Extract price
         price = None
-        price_tag = item_tag.select_one('span.product-price')
+        price_tag = parts.get("price")
         if price_tag:
             price_text_raw = extract_text_from_element(price_tag)
             # Clean up: may contain both sale price and original price
@@ -135,7 +201,7 @@ class RueschenbeckScraper(BaseScraper):
 
         # Set condition based on CPO badge
         condition = None
-        if item_tag.select_one('div.badge-cpo, .badge.badge-cpo'):
+        if "cpo_badge" in parts:
             condition = "★★★★☆"  # CPO (Certified Pre-Owned) condition
 
         # Create watch data
@@ -157,17 +223,17 @@ class RueschenbeckScraper(BaseScraper):
         """Extract additional details from Rüschenbeck detail page - matching original exactly."""
         
         # Update title from detail page
-        detail_title_tag = soup.select_one('div.product-name h1 span.prod-name')
+        detail_title_tag = _SEL_DETAIL_TITLE.select_one(soup)
         if detail_title_tag:
             watch.title = extract_text_from_element(detail_title_tag)
         
         # Update brand from detail page
-        detail_brand_tag = soup.select_one('div.product-name h1 span.manufacturer-name')
+        detail_brand_tag = _SEL_DETAIL_BRAND.select_one(soup)
         if detail_brand_tag:
             watch.brand = extract_text_from_element(detail_brand_tag)
         
         # Update model from detail page
-        detail_model_tag = soup.select_one('div.product-name h1 span.line-name')
+        detail_model_tag = _SEL_DETAIL_MODEL.select_one(soup)
         if detail_model_tag:
             watch.model = extract_text_from_element(detail_model_tag)
         
@@ -188,13 +254,13 @@ class RueschenbeckScraper(BaseScraper):
         # Extract diameter
         if parsed_details.get("diameter_text"):
             dia_text = parsed_details["diameter_text"]
-            dia_match = re.search(r'(\d{1,2}(?:[.,]\d{1,2})?)\s*mm', dia_text, re.IGNORECASE)
+            dia_match = _DIA_RE.search(dia_text)
             if dia_match:
                 watch.diameter = dia_match.group(1).replace(",", ".") + "mm"
             else:
                 # Try to clean and validate diameter
-                cleaned_dia = dia_text.replace("mm", "").strip().replace(",", ".").replace(" ", "")
-                if re.match(r'^\d+(\.\d+)?$', cleaned_dia):
+                cleaned_dia = dia_text.replace("mm", "").translate(_DIA_TRANSLATION).strip()
+                if _CLEAN_DIA_RE.match(cleaned_dia):
                     watch.diameter = cleaned_dia + "mm"
                 else:
                     watch.diameter = dia_text
@@ -222,6 +288,22 @@ class RueschenbeckScraper(BaseScraper):
             if condition:
                 watch.condition = condition
     
+    @staticmethod
+    def _iter_spec_pairs(specs_container) -> Iterator[Tuple[Tag, Tag]]:
+        """Yield (label, value) elements from spec tables, then from definition lists."""
+        # Parse any tables in the specs container
+        for table in specs_container.select('table'):
+            for row in table.select('tr'):
+                cells = _SEL_SPEC_CELLS.select(row)
+                if len(cells) >= 2:
+                    yield cells[0], cells[1]
+        
+        # Also parse definition lists (dl/dt/dd)
+        for dl in specs_container.select('dl'):
+            for dt, dd in zip(dl.select('dt'), dl.select('dd')):
+                if dt and dd:
+                    yield dt, dd
+    
     def _parse_rueschenbeck_details(self, soup: BeautifulSoup) -> dict:
         """Parse detailed information from Rüschenbeck detail page - matching original helper function."""
         parsed_details = {}
@@ -230,60 +312,26 @@ class RueschenbeckScraper(BaseScraper):
             # Look for product details in various sections
             
             # Check for specifications table/list
-            specs_container = soup.select_one('div.product-specifications, div.product-details, .product-info')
+            specs_container = _SEL_SPECS.select_one(soup)
             if specs_container:
-                # Parse any tables in the specs container
-                for table in specs_container.select('table'):
-                    for row in table.select('tr'):
-                        cells = row.select('th, td')
-                        if len(cells) >= 2:
-                            label = extract_text_from_element(cells[0]).lower().strip().replace(":", "")
-                            value = extract_text_from_element(cells[1]).strip()
-                            
-                            if any(keyword in label for keyword in ["jahr", "year", "baujahr"]):
-                                parsed_details["year_text"] = value
-                            elif any(keyword in label for keyword in ["referenz", "reference", "ref"]):
-                                parsed_details["reference_text"] = value
-                            elif any(keyword in label for keyword in ["durchmesser", "diameter", "größe"]):
-                                parsed_details["diameter_text"] = value
-                            elif any(keyword in label for keyword in ["material", "gehäuse"]):
-                                parsed_details["case_material_text"] = value
-                            elif any(keyword in label for keyword in ["zustand", "condition"]):
-                                parsed_details["condition_text"] = value
-                
-                # Also parse definition lists (dl/dt/dd)
-                for dl in specs_container.select('dl'):
-                    dt_elements = dl.select('dt')
-                    dd_elements = dl.select('dd')
-                    
-                    for dt, dd in zip(dt_elements, dd_elements):
-                        if dt and dd:
-                            label = extract_text_from_element(dt).lower().strip().replace(":", "")
-                            value = extract_text_from_element(dd).strip()
-                            
-                            if any(keyword in label for keyword in ["jahr", "year", "baujahr"]):
-                                parsed_details["year_text"] = value
-                            elif any(keyword in label for keyword in ["referenz", "reference", "ref"]):
-                                parsed_details["reference_text"] = value
-                            elif any(keyword in label for keyword in ["durchmesser", "diameter", "größe"]):
-                                parsed_details["diameter_text"] = value
-                            elif any(keyword in label for keyword in ["material", "gehäuse"]):
-                                parsed_details["case_material_text"] = value
-                            elif any(keyword in label for keyword in ["zustand", "condition"]):
-                                parsed_details["condition_text"] = value
+                for label_tag, value_tag in self._iter_spec_pairs(specs_container):
+                    label = extract_text_from_element(label_tag).lower().strip().replace(":", "")
+                    label_match = _SPEC_LABEL_RE.match(label)
+                    if label_match:
+                        parsed_details[label_match.lastgroup] = extract_text_from_element(value_tag).strip()
             
             # Look for description sections
-            description_container = soup.select_one('div.product-description, div.description, .product-details-description')
+            description_container = _SEL_DESCRIPTION.select_one(soup)
             if description_container:
                 parsed_details["description_text"] = extract_text_from_element(description_container)
             
             # Look for condition information
-            condition_container = soup.select_one('div.product-condition, .condition-info')
+            condition_container = _SEL_CONDITION.select_one(soup)
             if condition_container:
                 parsed_details["condition_text"] = extract_text_from_element(condition_container)
             
             # Look for accessories/scope of delivery information
-            accessories_container = soup.select_one('div.product-accessories, .lieferumfang, .scope-delivery')
+            accessories_container = _SEL_ACCESSORIES.select_one(soup)
             if accessories_container:
                 parsed_details["accessories_text"] = extract_text_from_element(accessories_container)
         
@@ -1,13 +1,15 @@
 """Tropical Watch scraper implementation."""
 
+import logging
 import re
 from typing import List, Optional
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
+import soupsieve as sv
 
 from decimal import Decimal
 
-from scrapers.base import BaseScraper
+from scrapers.base import BaseScraper, listing_strainer
 from models import WatchData
 from utils import (
     parse_price,
@@ -20,9 +22,69 @@ from utils import (
 from config import APP_CONFIG
 
 
+_PRICE_CLEAN_RE = re.compile(r"[^\d.]")
+_REF_IN_TITLE_RE = re.compile(r"\b([A-Z0-9]{3,}(?:[./\-\s]?[A-Z0-9]+)*)\b")
+_FULL_YEAR_RE = re.compile(r"\d{4}")
+_DIA_RE = re.compile(r"(\d{2}(?:\.\d+)?)\s*mm", re.IGNORECASE)
+
+# Case material keywords in the title, one lookahead per material in priority
+# order so the first material with any keyword present wins
+_TITLE_MATERIAL_RE = re.compile(
+    r"^(?:"
+    r"(?=.*(?:18k wg|white gold))(?P<white_gold>)"
+    r"|(?=.*(?:18k yg|yellow gold))(?P<yellow_gold>)"
+    r"|(?=.*(?:18k pg|pink gold|rose gold))(?P<rose_gold>)"
+    r"|(?=.*(?:steel|stainless))(?P<steel>)"
+    r"|(?=.*gold)(?P<gold>)"
+    r")",
+    re.DOTALL,
+)
+_TITLE_MATERIALS = {
+    "white_gold": "White Gold",
+    "yellow_gold": "Yellow Gold",
+    "rose_gold": "Rose Gold",
+    "steel": "Steel",
+    "gold": "Gold",
+}
+
+# Listing row selectors, compiled once and reused for every row
+_SEL_ITEMS = sv.compile("li.watch")
+_SEL_LINK = sv.compile("div.photo-wrapper a")
+_SEL_TITLE = sv.compile("div.content a h2")
+_SEL_PRICE = sv.compile("div.content a h3")
+_SEL_IMG = sv.compile("div.photo-wrapper a img")
+
+# Detail page selectors, compiled once per process
+_SEL_DETAIL_TITLE = sv.compile("h1.watch-main-title")
+_SEL_DESCRIPTION = sv.compile("div.watch-main-description")
+
+
+def _remove_ignore_case(text: str, literal: str) -> str:
+    """Remove every case-insensitive occurrence of ``literal`` from ``text``."""
+    text_lower = text.lower()
+    literal_lower = literal.lower()
+    if not literal_lower or literal_lower not in text_lower:
+        return text
+    if len(text_lower) != len(text):
+        # Lowercasing shifted offsets (rare non-ASCII); slicing would misalign
+        return re.sub(re.escape(literal), "", text, flags=re.IGNORECASE)
+
+    parts = []
+    start = 0
+    index = text_lower.find(literal_lower)
+    while index != -1:
+        parts.append(text[start:index])
+        start = index + len(literal_lower)
+        index = text_lower.find(literal_lower, start)
+    parts.append(text[start:])
+    return "".join(parts)
+
+
 class TropicalWatchScraper(BaseScraper):
     """Scraper for Tropical Watch website."""
 
+    LISTING_STRAINER = listing_strainer("li", "watch")
+
     KNOWN_BRANDS = [
         "A. Lange & Söhne",
         "Audemars Piguet",
@@ -42,6 +104,15 @@ class TropicalWatchScraper(BaseScraper):
         "Urwerk",
         "Zenith",
     ]
+    # One alternation over all brands, longest first: search() returns the
+    # earliest match and, at that position, the longest brand
+    _KNOWN_BRAND_RE = re.compile(
+        "|".join(
+            re.escape(brand.casefold())
+            for brand in sorted(KNOWN_BRANDS, key=len, reverse=True)
+        )
+    )
+    _KNOWN_BRAND_BY_KEY = {brand.casefold(): brand for brand in KNOWN_BRANDS}
 
     async def scrape(self) -> List[WatchData]:
         """Override scrape to add USD to EUR conversion."""
@@ -57,18 +128,22 @@ class TropicalWatchScraper(BaseScraper):
                     f"Converting USD prices to EUR (rate: 1 USD = {exchange_rate:.4f} EUR)"
                 )
 
+                # Convert the rate once; prices are Decimal so the product stays exact
+                rate = Decimal(str(exchange_rate))
+                debug_enabled = self.logger.logger.isEnabledFor(logging.DEBUG)
                 for watch in new_watches:
                     if watch.currency == "USD" and watch.price:
                         # Store original USD price for logging
                         usd_price = watch.price
                         # Convert price from USD to EUR (both as Decimal)
-                        watch.price = watch.price * Decimal(str(exchange_rate))
+                        watch.price = usd_price * rate
                         watch.currency = "EUR"
                         # Update the display format to show EUR
                         watch.price_display = watch._format_price_display()
-                        self.logger.debug(
-                            f"Converted price for {watch.title}: ${usd_price:.0f} USD → €{watch.price:.0f} EUR"
-                        )
+                        if debug_enabled:
+                            self.logger.debug(
+                                f"Converted price for {watch.title}: ${usd_price:.0f} USD → €{watch.price:.0f} EUR"
+                            )
             else:
                 self.logger.warning(
                     "Could not fetch USD to EUR exchange rate, prices remain in USD"
@@ -81,13 +156,17 @@ class TropicalWatchScraper(BaseScraper):
         watches = []
 
         # Use exact selectors from original implementation
-        watch_elements = soup.select("li.watch")
+        watch_elements = _SEL_ITEMS.select(soup)
+
+        # Bound once so the per-row loop skips the attribute lookups
+        parse_watch_element = self._parse_watch_element
+        append_watch = watches.append
 
         for watch_tag in watch_elements:
             try:
-                watch = self._parse_watch_element(watch_tag)
+                watch = parse_watch_element(watch_tag)
                 if watch:
-                    watches.append(watch)
+                    append_watch(watch)
             except Exception as e:
                 self.logger.error(f"Error parsing watch element: {e}")
 
@@ -97,14 +176,14 @@ class TropicalWatchScraper(BaseScraper):
         """Parse a single watch element from listing page - matching original logic exactly."""
 
         # Extract URL
-        link_tag_wrapper = watch_tag.select_one("div.photo-wrapper a")
+        link_tag_wrapper = _SEL_LINK.select_one(watch_tag)
         if not link_tag_wrapper or not link_tag_wrapper.has_attr("href"):
             return None
 
         url = urljoin(self.config.base_url, link_tag_wrapper["href"])
 
         # Extract title from listing
-        title_listing_tag = watch_tag.select_one("div.content a h2")
+        title_listing_tag = _SEL_TITLE.select_one(watch_tag)
         title = (
             extract_text_from_element(title_listing_tag)
             if title_listing_tag
@@ -112,7 +191,7 @@ class TropicalWatchScraper(BaseScraper):
         )
 
         # Extract USD price (original uses USD and converts to EUR)
-        price_usd_tag = watch_tag.select_one("div.content a h3")
+        price_usd_tag = _SEL_PRICE.select_one(watch_tag)
         price_usd_text_raw = (
             extract_text_from_element(price_usd_tag) if price_usd_tag else ""
         )
@@ -122,7 +201,7 @@ class TropicalWatchScraper(BaseScraper):
         if price_usd_text_raw:
             try:
                 # Clean price text to extract numeric value
-                price_clean = re.sub(r"[^\d.]", "", price_usd_text_raw)
+                price_clean = _PRICE_CLEAN_RE.sub("", price_usd_text_raw)
                 if price_clean:
                     price = parse_price(price_clean, "USD")
             except:
@@ -131,7 +210,7 @@ class TropicalWatchScraper(BaseScraper):
             return None
 
         # Extract image URL
-        img_tag_listing = watch_tag.select_one("div.photo-wrapper a img")
+        img_tag_listing = _SEL_IMG.select_one(watch_tag)
         image_url = None
         if img_tag_listing and img_tag_listing.has_attr("src"):
             image_url = urljoin(self.config.base_url, img_tag_listing["src"])
@@ -153,7 +232,7 @@ class TropicalWatchScraper(BaseScraper):
         """Extract additional details from Tropical Watch detail page - matching original exactly."""
 
         # Update title from detail page if available
-        title_detail_tag = soup.select_one("h1.watch-main-title")
+        title_detail_tag = _SEL_DETAIL_TITLE.select_one(soup)
         if title_detail_tag:
             watch.title = extract_text_from_element(title_detail_tag)
 
@@ -178,11 +257,12 @@ class TropicalWatchScraper(BaseScraper):
         if table_details.get("brand_table"):
             watch.brand = table_details["brand_table"]
 
+        title_folded = (watch.title or "").casefold()
         title_brand = self._extract_brand_from_title(watch.title or "")
         if title_brand and (
             not watch.brand
             or title_brand.casefold() != watch.brand.casefold()
-            and watch.brand.casefold() not in (watch.title or "").casefold()
+            and watch.brand.casefold() not in title_folded
         ):
             watch.brand = title_brand
 
@@ -208,15 +288,17 @@ class TropicalWatchScraper(BaseScraper):
         if table_details.get("diameter_table"):
             watch.diameter = table_details["diameter_table"]
 
-        # Fallback brand extraction if not found in table - matching original logic
+        # Fallback brand extraction if not found in table: title_brand above is
+        # already the title-derived brand, so it is not searched for again
         if not watch.brand and watch.title:
-            watch.brand = self._extract_brand_from_title(watch.title)
+            watch.brand = title_brand
 
         # Extract model from title if not found in table - matching original logic
         if not watch.model and watch.brand and watch.title:
-            temp_model_str = re.sub(
-                rf"^{re.escape(watch.brand)}\s*", "", watch.title, flags=re.IGNORECASE
-            ).strip()
+            temp_model_str = watch.title
+            if temp_model_str.lower().startswith(watch.brand.lower()):
+                temp_model_str = temp_model_str[len(watch.brand) :]
+            temp_model_str = temp_model_str.strip()
 
             # Remove year from model string
             year_in_title = parse_year("", temp_model_str)
@@ -229,9 +311,9 @@ class TropicalWatchScraper(BaseScraper):
                 if watch.reference
                 else table_details.get("reference_text", "")
             )
-            if ref_in_title_val and ref_in_title_val.lower() in temp_model_str.lower():
-                temp_model_str = re.sub(
-                    re.escape(ref_in_title_val), "", temp_model_str, flags=re.IGNORECASE
+            if ref_in_title_val:
+                temp_model_str = _remove_ignore_case(
+                    temp_model_str, ref_in_title_val
                 ).strip()
 
             # Take first 3 words as model
@@ -251,14 +333,14 @@ class TropicalWatchScraper(BaseScraper):
 
             # Remove brand from search string
             if watch.brand:
-                temp_ref_search_str = re.sub(
-                    re.escape(watch.brand), "", temp_ref_search_str, flags=re.IGNORECASE
+                temp_ref_search_str = _remove_ignore_case(
+                    temp_ref_search_str, watch.brand
                 )
 
             # Remove model from search string
             if watch.model:
-                temp_ref_search_str = re.sub(
-                    re.escape(watch.model), "", temp_ref_search_str, flags=re.IGNORECASE
+                temp_ref_search_str = _remove_ignore_case(
+                    temp_ref_search_str, watch.model
                 )
 
             # Remove year from search string
@@ -267,16 +349,13 @@ class TropicalWatchScraper(BaseScraper):
                 temp_ref_search_str = temp_ref_search_str.replace(year_val_for_ref, "")
 
             # Look for reference pattern
-            ref_match_title = re.search(
-                r"\b([A-Z0-9]{3,}(?:[./\-\s]?[A-Z0-9]+)*)\b",
-                temp_ref_search_str.strip(),
-            )
-            if ref_match_title and not re.fullmatch(r"\d{4}", ref_match_title.group(1)):
+            ref_match_title = _REF_IN_TITLE_RE.search(temp_ref_search_str.strip())
+            if ref_match_title and not _FULL_YEAR_RE.fullmatch(ref_match_title.group(1)):
                 watch.reference = ref_match_title.group(1)
 
         # Parse accessories and condition from description - matching original logic
         accessories_text, condition_desc_parts = "", []
-        description_container = soup.select_one("div.watch-main-description")
+        description_container = _SEL_DESCRIPTION.select_one(soup)
 
         if description_container:
             for p_tag in description_container.find_all("p"):
@@ -318,19 +397,9 @@ class TropicalWatchScraper(BaseScraper):
 
         # Extract case material from title if not found in table - matching original logic
         if not watch.case_material and watch.title:
-            title_l = watch.title.lower()
-            if "18k wg" in title_l or "white gold" in title_l:
-                watch.case_material = "White Gold"
-            elif "18k yg" in title_l or "yellow gold" in title_l:
-                watch.case_material = "Yellow Gold"
-            elif (
-                "18k pg" in title_l or "pink gold" in title_l or "rose gold" in title_l
-            ):
-                watch.case_material = "Rose Gold"
-            elif "steel" in title_l or "stainless" in title_l:
-                watch.case_material = "Steel"
-            elif "gold" in title_l:
-                watch.case_material = "Gold"
+            material_match = _TITLE_MATERIAL_RE.match(title_folded)
+            if material_match:
+                watch.case_material = _TITLE_MATERIALS[material_match.lastgroup]
 
         # Extract diameter from description if not found in table - matching original logic
         if not watch.diameter:
@@ -339,24 +408,16 @@ class TropicalWatchScraper(BaseScraper):
                 if condition_desc_parts
                 else [watch.title]
             )
-            dia_match = re.search(
-                r"(\d{2}(?:\.\d+)?)\s*mm", desc_text_for_dia, re.IGNORECASE
-            )
+            dia_match = _DIA_RE.search(desc_text_for_dia)
             if dia_match:
                 watch.diameter = dia_match.group(1) + "mm"
 
     @classmethod
     def _extract_brand_from_title(cls, title: str) -> Optional[str]:
-        title_lower = (title or "").casefold()
-        matches = []
-        for brand in cls.KNOWN_BRANDS:
-            index = title_lower.find(brand.casefold())
-            if index >= 0:
-                matches.append((index, -len(brand), brand))
-        if not matches:
+        match = cls._KNOWN_BRAND_RE.search((title or "").casefold())
+        if not match:
             return None
-        matches.sort()
-        return matches[0][2]
+        return cls._KNOWN_BRAND_BY_KEY[match.group(0)]
 
     def _parse_details_from_table_th_td(self, container, headers_map: dict) -> dict:
         """Parse details from table with th/td structure - matching original logic."""
@@ -3,9 +3,15 @@
 import re
 import json
 from decimal import Decimal, InvalidOperation
-from typing import List, Optional
-from bs4 import BeautifulSoup
+from typing import Dict, List, Optional, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib.parse import urljoin
+import soupsieve as sv
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from scrapers.base import BaseScraper
 from models import WatchData
@@ -20,10 +26,51 @@ from utils import (
     extract_text_from_element,
 )
 
+# Shopify analytics script lookup and its embedded product metadata
+_SHOPIFY_META_SCRIPT_RE = re.compile(r"window\.ShopifyAnalytics\.meta")
+_SHOPIFY_META_MARKER = "var meta = "
+# Decodes the first complete JSON value at an offset and ignores the rest
+_JSON_DECODER = json.JSONDecoder()
+_DIAMETER_RE = re.compile(r"(\d{1,2}(?:[.,]\d{1,2})?)\s*mm", re.IGNORECASE)
+# One "key: value" spec line, split at the first colon with surrounding
+# whitespace trimmed; [^\S\n] keeps keys and values on their own line
+_SPEC_LINE_RE = re.compile(
+    r"^[^\S\n]*([^:\n]*?)[^\S\n]*:[^\S\n]*([^\n]*?)[^\S\n]*$", re.MULTILINE
+)
+# Spec key keywords in priority order and the accordion field they fill
+_SPEC_FIELDS = (
+    (("herstellungsjahr", "jahr"), "herstellungsjahr"),
+    (("referenz",), "referenznummer"),
+    (("durchmesser",), "durchmesser"),
+    (("gehäusematerial", "material"), "gehäusematerial"),
+    (("zustand", "condition"), "zustand"),
+)
+# Any of the keywords above, anywhere in the key: keys for fields the monitor
+# ignores (Marke, Farbe, ...) fail this single scan and skip the keyword ladder
+_SPEC_KEY_PREFILTER_RE = re.compile(
+    "|".join(re.escape(needle) for needles, _ in _SPEC_FIELDS for needle in needles)
+)
+
+# Product card selectors, compiled once and reused for every card
+_SEL_CARDS = sv.compile("product-card")
+_SEL_PRODUCT_LINK = sv.compile('a[href*="/products/"]')
+_SEL_CARD_TITLE = sv.compile(".product-card__title a.bold")
+_SEL_BRAND = sv.compile(".product-card__info a.text-xs.link-faded")
+_SEL_PRICE = sv.compile("sale-price")
+_SEL_REF_BADGE = sv.compile(".product-card__badge-list span.badge--primary")
+_SEL_IMG = sv.compile("img.product-card__image")
+
+# Detail page selectors, compiled once per process
+_SEL_ACCORDION = sv.compile("div.accordion-box")
+_SEL_COLLAPSIBLES = sv.compile("collapsible-element")
+
 
 class WatchOutScraper(BaseScraper):
     """Scraper for Watch Out website."""
 
+    # Product cards plus the scripts carrying the ShopifyAnalytics metadata
+    LISTING_STRAINER = SoupStrainer(["product-card", "script"])
+
     async def scrape(self) -> List[WatchData]:
         """Scrape Watch Out through Shopify's smaller collection JSON endpoint."""
         if "watch-out.shop" not in self.config.base_url:
@@ -37,7 +84,7 @@ class WatchOutScraper(BaseScraper):
                 return await super().scrape()
 
             try:
-                data = json.loads(content)
+                data = orjson.loads(content) if orjson else json.loads(content)
                 watches = self._extract_watches_from_json(data)
             except Exception as e:
                 self.logger.warning(
@@ -133,16 +180,14 @@ class WatchOutScraper(BaseScraper):
         # First extract Shopify analytics data
         shopify_products_data = []
         try:
-            script_tag_analytics = soup.find(
-                "script", string=re.compile(r"window\.ShopifyAnalytics\.meta")
-            )
+            script_tag_analytics = soup.find("script", string=_SHOPIFY_META_SCRIPT_RE)
             if script_tag_analytics and script_tag_analytics.string:
-                match = re.search(
-                    r"var meta = (\{.*?\})\s*;", script_tag_analytics.string, re.DOTALL
-                )
-                if match:
-                    meta_json_str = match.group(1)
-                    meta_data = json.loads(meta_json_str)
+                script_text = script_tag_analytics.string
+                meta_start = script_text.find(_SHOPIFY_META_MARKER)
+                if meta_start >= 0:
+                    meta_data, _ = _JSON_DECODER.raw_decode(
+                        script_text, meta_start + len(_SHOPIFY_META_MARKER)
+                    )
                     if "products" in meta_data:
                         shopify_products_data = meta_data["products"]
                         self.logger.info(
@@ -159,13 +204,16 @@ class WatchOutScraper(BaseScraper):
         except Exception as e:
             self.logger.error(f"Error parsing Watch Out ShopifyAnalytics data: {e}")
 
+        # Built once per page and shared by every card's handle lookup
+        products_by_handle = self._index_shopify_products(shopify_products_data)
+
         # Use exact selectors from original implementation
-        product_card_elements = soup.select("product-card")
+        product_card_elements = _SEL_CARDS.select(soup)
 
         for idx, card_element in enumerate(product_card_elements):
             try:
                 watch = self._parse_watch_element(
-                    card_element, idx, shopify_products_data
+                    card_element, idx, shopify_products_data, products_by_handle
                 )
                 if watch:
                     watches.append(watch)
@@ -174,13 +222,52 @@ class WatchOutScraper(BaseScraper):
 
         return watches
 
+    @staticmethod
+    def _shopify_variant_and_title(shopify_item: dict) -> Tuple[dict, Optional[str]]:
+        """Return an analytics item's first variant and its product title."""
+        variants = shopify_item.get("variants")
+        variant = variants[0] if variants else {}
+        return variant, shopify_item.get(
+            "untranslatedTitle", shopify_item.get("title")
+        )
+
+    @staticmethod
+    def _shopify_product_url(shopify_item: dict) -> str:
+        """Return the product URL of an analytics item (via its first variant)."""
+        variants = shopify_item.get("variants")
+        if variants:
+            variant_product = variants[0].get("product")
+            return variant_product.get("url", "") if variant_product else ""
+        return shopify_item.get("url", "")
+
+    @classmethod
+    def _index_shopify_products(cls, shopify_products_data: list) -> Dict[str, dict]:
+        """Map each product handle to its first analytics item."""
+        products_by_handle = {}
+        for shopify_item in shopify_products_data:
+            product_url = cls._shopify_product_url(shopify_item)
+            if "/products/" in product_url:
+                item_handle = product_url.split("/products/")[-1].split("?")[0]
+                products_by_handle.setdefault(item_handle, shopify_item)
+        return products_by_handle
+
     def _parse_watch_element(
-        self, card_element, idx: int, shopify_products_data: list
+        self,
+        card_element,
+        idx: int,
+        shopify_products_data: list,
+        products_by_handle: Optional[Dict[str, dict]] = None,
     ) -> Optional[WatchData]:
-        """Parse a single watch element from listing page - matching original logic exactly."""
+        """
+        Parse a single watch element from listing page - matching original logic exactly.
+
+        ``products_by_handle`` is the page's handle index from
+        _index_shopify_products; it is built here when not passed in.
+        """
 
-        # Skip sold out items
-        if card_element.select_one("sold-out-badge"):
+        # Skip sold out items before any other lookups; a plain tag-name find
+        # avoids going through the CSS selector engine for every card
+        if card_element.find("sold-out-badge"):
             return None
 
         # Extract URL and handle
@@ -190,7 +277,7 @@ class WatchOutScraper(BaseScraper):
         if handle:
             url = urljoin(self.config.base_url, f"/products/{handle}")
         else:
-            link_tag_in_card = card_element.select_one('a[href*="/products/"]')
+            link_tag_in_card = _SEL_PRODUCT_LINK.select_one(card_element)
             if link_tag_in_card and link_tag_in_card.has_attr("href"):
                 path = link_tag_in_card["href"]
                 url = urljoin(self.config.base_url, path)
@@ -211,35 +298,31 @@ class WatchOutScraper(BaseScraper):
         }
 
         # Get card title
-        card_title_tag = card_element.select_one(".product-card__title a.bold")
+        card_title_tag = _SEL_CARD_TITLE.select_one(card_element)
         card_title_text = (
             extract_text_from_element(card_title_tag) if card_title_tag else None
         )
 
-        # Match with Shopify analytics data
+        # Match with Shopify analytics data: an exact handle lookup first, then
+        # the positional candidate checked by handle substring or title
         shopify_item = None
-        if idx < len(shopify_products_data):
+        if handle:
+            if products_by_handle is None:
+                products_by_handle = self._index_shopify_products(shopify_products_data)
+            shopify_item = products_by_handle.get(handle)
+        if shopify_item is None and idx < len(shopify_products_data):
             temp_shopify_item = shopify_products_data[idx]
-            temp_shopify_title_variant = (
-                temp_shopify_item.get("variants")[0].get("name")
-                if temp_shopify_item.get("variants")
-                else None
-            )
-            temp_shopify_title_product = temp_shopify_item.get(
-                "untranslatedTitle", temp_shopify_item.get("title")
+            variant, temp_shopify_title_product = self._shopify_variant_and_title(
+                temp_shopify_item
             )
+            temp_shopify_title_variant = variant.get("name")
             shopify_item_title = (
                 temp_shopify_title_variant
                 if temp_shopify_title_variant
                 and temp_shopify_title_variant.lower() != "default title"
                 else temp_shopify_title_product
             )
-
-            analytics_prod_url_part = (
-                temp_shopify_item.get("variants")[0].get("product", {}).get("url", "")
-                if temp_shopify_item.get("variants")
-                else temp_shopify_item.get("url", "")
-            )
+            analytics_prod_url_part = self._shopify_product_url(temp_shopify_item)
 
             # Match by handle in URL or title similarity
             if handle and analytics_prod_url_part and handle in analytics_prod_url_part:
@@ -252,15 +335,16 @@ class WatchOutScraper(BaseScraper):
                 shopify_item = temp_shopify_item
             elif not analytics_prod_url_part and not card_title_text:
                 shopify_item = temp_shopify_item
+        elif shopify_item is not None:
+            variant, temp_shopify_title_product = self._shopify_variant_and_title(
+                shopify_item
+            )
 
         # Extract data from Shopify analytics
         if shopify_item:
             watch_data["brand"] = (
                 shopify_item.get("vendor") if shopify_item.get("vendor") else None
             )
-            variant = (
-                shopify_item.get("variants")[0] if shopify_item.get("variants") else {}
-            )
 
             # Prefer variant name, but fall back to untranslatedTitle if variant name is "Default Title"
             variant_name = variant.get("name")
@@ -268,11 +352,8 @@ class WatchOutScraper(BaseScraper):
                 watch_data["title"] = variant_name
             else:
                 # Fall back to untranslatedTitle, then title
-                title_candidate = shopify_item.get(
-                    "untranslatedTitle", shopify_item.get("title")
-                )
-                if title_candidate:
-                    watch_data["title"] = title_candidate
+                if temp_shopify_title_product:
+                    watch_data["title"] = temp_shopify_title_product
 
             price_cents = variant.get("price")
             if price_cents is not None:
@@ -286,37 +367,33 @@ class WatchOutScraper(BaseScraper):
         if not watch_data["title"] and card_title_text:
             watch_data["title"] = card_title_text
 
-        brand_tag_visual = card_element.select_one(
-            ".product-card__info a.text-xs.link-faded"
-        )
+        brand_tag_visual = _SEL_BRAND.select_one(card_element)
         if brand_tag_visual and not watch_data["brand"]:
             watch_data["brand"] = extract_text_from_element(brand_tag_visual)
 
         if not watch_data["price"]:
-            price_tag_visual = card_element.select_one("sale-price")
+            price_tag_visual = _SEL_PRICE.select_one(card_element)
             if price_tag_visual:
                 price_text_raw = extract_text_from_element(price_tag_visual)
                 if price_text_raw:
                     watch_data["price"] = parse_price(price_text_raw, "EUR")
 
         # Extract reference from badge
-        ref_badge = card_element.select_one(
-            ".product-card__badge-list span.badge--primary"
-        )
+        ref_badge = _SEL_REF_BADGE.select_one(card_element)
         if ref_badge and not watch_data["reference"]:
             ref_text = extract_text_from_element(ref_badge)
             if ref_text:
                 watch_data["reference"] = ref_text
 
         # Extract image URL
-        img_tag_visual = card_element.select_one("img.product-card__image")
+        img_tag_visual = _SEL_IMG.select_one(card_element)
         if img_tag_visual:
             src_val = img_tag_visual.get("srcset")
             if src_val:
-                img_parts = [s.strip().split(" ")[0] for s in src_val.split(",")]
+                # The last srcset candidate is the largest; take just its URL
+                last_candidate = src_val.rsplit(",", 1)[-1].strip()
                 watch_data["image_url"] = urljoin(
-                    self.config.base_url,
-                    img_parts[-1] if img_parts else (img_tag_visual.get("src") or ""),
+                    self.config.base_url, last_candidate.split(" ", 1)[0]
                 )
             elif img_tag_visual.get("src"):
                 watch_data["image_url"] = urljoin(
@@ -352,7 +429,7 @@ class WatchOutScraper(BaseScraper):
         )
 
         # Parse accordion details
-        accordion_box = soup.select_one("div.accordion-box")
+        accordion_box = _SEL_ACCORDION.select_one(soup)
         accordion_data = self._parse_accordion_details_watch_out(accordion_box)
 
         # Extract details from accordion data (original logic)
@@ -366,9 +443,7 @@ class WatchOutScraper(BaseScraper):
 
         if accordion_data.get("durchmesser"):
             dia_text = accordion_data["durchmesser"]
-            dia_match = re.search(
-                r"(\d{1,2}(?:[.,]\d{1,2})?)\s*mm", dia_text, re.IGNORECASE
-            )
+            dia_match = _DIAMETER_RE.search(dia_text)
             if dia_match:
                 watch.diameter = dia_match.group(1).replace(",", ".") + "mm"
             else:
@@ -396,13 +471,24 @@ class WatchOutScraper(BaseScraper):
             return parsed_details
 
         try:
-            for collapsible in accordion_box.select("collapsible-element"):
+            for collapsible in _SEL_COLLAPSIBLES.select(accordion_box):
                 summary_elem = collapsible.select_one("summary")
                 if not summary_elem:
                     continue
 
                 summary_text = extract_text_from_element(summary_elem).lower().strip()
 
+                # Classify the section first so unmapped sections (shipping,
+                # payment, ...) never have their content text extracted
+                if "spezifikationen" in summary_text or "details" in summary_text:
+                    section = "specs"
+                elif "zustand" in summary_text or "condition" in summary_text:
+                    section = "zustand"
+                elif "lieferumfang" in summary_text or "scope" in summary_text:
+                    section = "lieferumfang"
+                else:
+                    continue
+
                 # Get content from the collapsible
                 content_area = collapsible.select_one(
                     "div[id]"
@@ -413,38 +499,19 @@ class WatchOutScraper(BaseScraper):
                 content_text = extract_text_from_element(content_area)
 
                 # Map to fields based on summary text
-                if "spezifikationen" in summary_text or "details" in summary_text:
+                if section == "specs":
                     # Parse key-value pairs from specifications
-                    lines = content_text.split("\n")
-                    current_key = None
-
-                    for line in lines:
-                        line = line.strip()
-                        if ":" in line:
-                            key, value = line.split(":", 1)
-                            key = key.strip().lower()
-                            value = value.strip()
-
-                            if "herstellungsjahr" in key or "jahr" in key:
-                                parsed_details["herstellungsjahr"] = value
-                            elif "referenz" in key:
-                                parsed_details["referenznummer"] = value
-                            elif "durchmesser" in key:
-                                parsed_details["durchmesser"] = value
-                            elif "gehäusematerial" in key or "material" in key:
-                                parsed_details["gehäusematerial"] = value
-                            elif "zustand" in key or "condition" in key:
-                                parsed_details["zustand"] = value
-                        elif current_key and line:
-                            # Continuation of previous value
-                            if current_key in parsed_details:
-                                parsed_details[current_key] += " " + line
+                    for spec_match in _SPEC_LINE_RE.finditer(content_text):
+                        key = spec_match.group(1).lower()
+                        if not _SPEC_KEY_PREFILTER_RE.search(key):
+                            continue
+                        for needles, field in _SPEC_FIELDS:
+                            if any(needle in key for needle in needles):
+                                parsed_details[field] = spec_match.group(2)
+                                break
 
-                elif "zustand" in summary_text or "condition" in summary_text:
-                    parsed_details["zustand"] = content_text
-
-                elif "lieferumfang" in summary_text or "scope" in summary_text:
-                    parsed_details["lieferumfang"] = content_text
+                else:
+                    parsed_details[section] = content_text
 
         except Exception as e:
             self.logger.warning(f"Error parsing accordion details: {e}")
@@ -4,21 +4,90 @@ import re
 from typing import List, Optional
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
+import soupsieve as sv
 
-from scrapers.base import BaseScraper
+from scrapers.base import BaseScraper, listing_strainer
 from models import WatchData
 from utils import parse_price, parse_year, parse_box_papers, parse_condition, extract_text_from_element
 
+# Listing selectors, compiled once and reused for every row
+_SEL_ITEMS = sv.compile('div.new-arrivals-watch, div.paged-clocks-container div.watch-link')
+_SEL_LINK = sv.compile('div.image a, div > a:has(img)')
+_SEL_TITLE = sv.compile("div.text-truncate[style*='font-size: 17px'][style*='font-family: \\'AB\\'']")
+_SEL_PRICE = sv.compile("div.pt-4.mt-auto p, p.m-0.price[style*='font-size: 17px']")
+_SEL_IMG = sv.compile('div.image img, div.square-container img')
+_SEL_DESCRIPTION = sv.compile('p.m-0.truncate-two-lines, p.m-0.characteristics')
+# Inline style marking the reference line next to the title
+_REF_STYLE_RE = re.compile(r'font-size: 16px')
+
+# Material mentions with an optional trailing "case", scanned in one pass: a
+# case-qualified mention anywhere wins over an earlier plain mention
+_MAT_RE = re.compile(
+    r'\b(steel|stahl|gold|yellow-gold|white-gold|rose gold|titanium|platinum|ceramic|nickel plated|rosegold|weissgold|gelbgold|edelstahl)\b'
+    r'(\s+case\b)?',
+    re.IGNORECASE
+)
+# Ceramic only counts as a plain mention, never as the case material
+_NON_CASE_MATERIALS = {"ceramic"}
+# Display name for each material literal _MAT_RE can capture (lowercased)
+_MAT_CANON = {
+    "steel": "Steel",
+    "stahl": "Steel",
+    "edelstahl": "Steel",
+    "yellow-gold": "Yellow Gold",
+    "gelbgold": "Yellow Gold",
+    "white-gold": "White Gold",
+    "weissgold": "White Gold",
+    "rose gold": "Rose Gold",
+    "rosegold": "Rose Gold",
+    "gold": "Gold",
+    "titanium": "Titanium",
+    "platinum": "Platinum",
+    "ceramic": "Ceramic",
+    "nickel plated": "Nickel",
+}
+
+# Known brand prefixes (lowercase) and their display names
+_KNOWN_BRANDS = {
+    "patek philippe": "Patek Philippe",
+    "rolex vintage": "Rolex",
+    "rolex": "Rolex",
+    "omega": "Omega",
+    "iwc": "IWC",
+    "jaeger lecoultre": "Jaeger LeCoultre",
+    "cartier": "Cartier",
+    "breitling": "Breitling",
+    "audemars piguet": "Audemars Piguet",
+    "heuer": "Heuer",
+    "universal geneve": "Universal Genève",
+    "panerai": "Panerai",
+    "tudor": "Tudor",
+    "longines": "Longines",
+    "zenith": "Zenith",
+    "a. lange & söhne": "A. Lange & Söhne",
+}
+# Anchored alternation, longest first with ties in dict order, so match()
+# picks the same brand as a sorted startswith scan
+_KNOWN_BRAND_PREFIX_RE = re.compile(
+    "|".join(
+        re.escape(brand)
+        for brand in sorted(_KNOWN_BRANDS, key=len, reverse=True)
+    )
+)
+
 
 class WorldOfTimeScraper(BaseScraper):
     """Scraper for worldoftime.de website."""
     
+    # Watch rows live in either container; the paged rows are matched inside it
+    LISTING_STRAINER = listing_strainer("div", "new-arrivals-watch", "paged-clocks-container")
+    
     async def _extract_watches(self, soup: BeautifulSoup) -> List[WatchData]:
         """Extract watches from World of Time listing page."""
         watches = []
         
         # Use exact selectors from original implementation
-        watch_elements = soup.select('div.new-arrivals-watch, div.paged-clocks-container div.watch-link')
+        watch_elements = _SEL_ITEMS.select(soup)
         
         for item_tag in watch_elements:
             try:
@@ -34,51 +103,29 @@ class WorldOfTimeScraper(BaseScraper):
         """Parse a single watch element from listing page - matching original logic exactly."""
         
         # Extract URL
-        link_tag = item_tag.select_one('div.image a, div > a:has(img)')
+        link_tag = _SEL_LINK.select_one(item_tag)
         if not link_tag or not link_tag.has_attr('href'):
             return None
         
         url = urljoin(self.config.base_url, link_tag['href'])
         
         # Extract title using exact original selector
-        title_tag = item_tag.select_one("div.text-truncate[style*='font-size: 17px'][style*='font-family: \\'AB\\'']")
+        title_tag = _SEL_TITLE.select_one(item_tag)
         full_title = extract_text_from_element(title_tag) if title_tag else "Unknown Watch"
         
         # Extract brand and model using original logic
-        known_brands = {
-            "patek philippe": "Patek Philippe", 
-            "rolex vintage": "Rolex", 
-            "rolex": "Rolex", 
-            "omega": "Omega", 
-            "iwc": "IWC", 
-            "jaeger lecoultre": "Jaeger LeCoultre", 
-            "cartier": "Cartier", 
-            "breitling": "Breitling", 
-            "audemars piguet": "Audemars Piguet", 
-            "heuer": "Heuer", 
-            "universal geneve": "Universal Genève", 
-            "panerai": "Panerai", 
-            "tudor": "Tudor", 
-            "longines": "Longines", 
-            "zenith": "Zenith", 
-            "a. lange & söhne": "A. Lange & Söhne"
-        }
-        
         parsed_brand, parsed_model = None, None
         
         if full_title:
             title_lower = full_title.lower()
-            found_brand_proper = None
-            
-            # Check if title starts with known brand (sorted by length descending)
-            for kb_lower, kb_proper in sorted(known_brands.items(), key=lambda item: len(item[0]), reverse=True):
-                if title_lower.startswith(kb_lower):
-                    parsed_brand, found_brand_proper = kb_proper, kb_proper
-                    break
+            # Check if title starts with known brand (longest brand first)
+            brand_match = _KNOWN_BRAND_PREFIX_RE.match(title_lower)
+            if brand_match:
+                parsed_brand = _KNOWN_BRANDS[brand_match.group(0)]
             
-            if parsed_brand and found_brand_proper:
-                # Extract model text after brand
-                model_text = re.sub(fr"^{re.escape(found_brand_proper)}", "", full_title, flags=re.IGNORECASE).strip()
+            if brand_match and parsed_brand:
+                # Extract model text after the matched brand prefix
+                model_text = full_title[brand_match.end():].strip()
                 parsed_model = model_text if model_text else None
                 
                 # Special handling for Rolex vintage
@@ -86,11 +133,14 @@ class WorldOfTimeScraper(BaseScraper):
                     parsed_model = f"Vintage {parsed_model.replace('Vintage','').strip()}" if parsed_model else "Vintage"
             
             elif title_words := full_title.split():
-                # Check for two-word brand names
-                if (len(title_words) > 2 and 
-                    (title_words[0] + " " + title_words[1]).lower() in known_brands):
-                    parsed_brand = known_brands[(title_words[0] + " " + title_words[1]).lower()]
-                    parsed_model = " ".join(title_words[2:]) if len(title_words) > 2 else None
+                # Check for two-word brand names (one lookup on the joined pair)
+                two_word_brand = (
+                    _KNOWN_BRANDS.get(f"{title_words[0]} {title_words[1]}".lower())
+                    if len(title_words) > 2 else None
+                )
+                if two_word_brand:
+                    parsed_brand = two_word_brand
+                    parsed_model = " ".join(title_words[2:])
                 else:
                     # Fallback: first word as brand, rest as model
                     parsed_brand = title_words[0]
@@ -99,8 +149,7 @@ class WorldOfTimeScraper(BaseScraper):
         # Extract reference using original logic
         ref_container = None
         if title_tag:
-            ref_container = title_tag.find_next_sibling("div", class_="text-truncate", 
-                                                       style=lambda x: x and "font-size: 16px" in x)
+            ref_container = title_tag.find_next_sibling("div", class_="text-truncate", style=_REF_STYLE_RE)
         
         reference = None
         if ref_container:
@@ -109,7 +158,7 @@ class WorldOfTimeScraper(BaseScraper):
                 reference = ref_val
         
         # Extract price using original selectors
-        price_p_tag = item_tag.select_one("div.pt-4.mt-auto p, p.m-0.price[style*='font-size: 17px']")
+        price_p_tag = _SEL_PRICE.select_one(item_tag)
         price = None
         if price_p_tag:
             price_text_raw = extract_text_from_element(price_p_tag)
@@ -117,13 +166,13 @@ class WorldOfTimeScraper(BaseScraper):
                 price = parse_price(price_text_raw, "EUR")
         
         # Extract image URL
-        img_tag = item_tag.select_one('div.image img, div.square-container img')
+        img_tag = _SEL_IMG.select_one(item_tag)
         image_url = None
         if img_tag and img_tag.has_attr('src'):
             image_url = urljoin(self.config.base_url, img_tag['src'])
         
         # Extract description for additional details
-        desc_p_tag = item_tag.select_one('p.m-0.truncate-two-lines, p.m-0.characteristics')
+        desc_p_tag = _SEL_DESCRIPTION.select_one(item_tag)
         description_text = extract_text_from_element(desc_p_tag) if desc_p_tag else ""
         
         # Parse year from description
@@ -135,41 +184,20 @@ class WorldOfTimeScraper(BaseScraper):
         # Parse case material from description using original logic
         case_material = None
         if description_text:
-            # Try to find case material first (prioritize case over bezel)
-            mat_search = re.search(
-                r'\b(steel|stahl|gold|yellow-gold|white-gold|rose gold|titanium|platinum|nickel plated|rosegold|weissgold|gelbgold|edelstahl)\s+case\b', 
-                description_text, re.IGNORECASE
-            )
-            
-            # Fallback to any material mention if no case-specific material found
-            if not mat_search:
-                mat_search = re.search(
-                    r'\b(steel|stahl|gold|yellow-gold|white-gold|rose gold|titanium|platinum|ceramic|nickel plated|rosegold|weissgold|gelbgold|edelstahl)\b', 
-                    description_text, re.IGNORECASE
-                )
+            # Prefer a case material (prioritize case over bezel), falling back
+            # to the first material mention if no case-specific one is found
+            mat_search = None
+            for mat_match in _MAT_RE.finditer(description_text):
+                if mat_match.group(2) and mat_match.group(1).lower() not in _NON_CASE_MATERIALS:
+                    mat_search = mat_match
+                    break
+                if mat_search is None:
+                    mat_search = mat_match
             
             if mat_search:
-                mat_text = mat_search.group(1).lower()
-                if "stahl" in mat_text or "steel" in mat_text:
-                    case_material = "Steel"
-                elif "yellow-gold" in mat_text or "gelbgold" in mat_text:
-                    case_material = "Yellow Gold"
-                elif "white-gold" in mat_text or "weissgold" in mat_text:
-                    case_material = "White Gold"
-                elif "rose gold" in mat_text or "rosegold" in mat_text:
-                    case_material = "Rose Gold"
-                elif "gold" in mat_text:
-                    case_material = "Gold"
-                elif "titanium" in mat_text:
-                    case_material = "Titanium"
-                elif "platinum" in mat_text:
-                    case_material = "Platinum"
-                elif "ceramic" in mat_text:
-                    case_material = "Ceramic"
-                elif "nickel plated" in mat_text:
-                    case_material = "Nickel"
-                else:
-                    case_material = mat_search.group(1).title()
+                case_material = _MAT_CANON.get(
+                    mat_search.group(1).lower(), mat_search.group(1).title()
+                )
         
         # Set condition based on description
         condition = parse_condition(description_text, self.config.key) if description_text else None
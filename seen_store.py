@@ -0,0 +1,151 @@
+"""SQLite-backed storage for seen watch IDs."""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Set
+
+
+class SeenStore:
+    """WAL-mode SQLite store for per-site seen watch IDs with FIFO trimming."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        self._initialize()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _initialize(self):
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS seen (
+                    site TEXT NOT NULL,
+                    watch_id TEXT NOT NULL,
+                    ts INTEGER NOT NULL,
+                    PRIMARY KEY (site, watch_id)
+                )
+                """)
+
+    def load(self) -> Dict[str, Set[str]]:
+        """Return all seen IDs grouped by site."""
+        result: Dict[str, Set[str]] = {}
+        with self._lock:
+            for site, watch_id in self._conn.execute("SELECT site, watch_id FROM seen"):
+                result.setdefault(site, set()).add(watch_id)
+        return result
+
+    def is_empty(self) -> bool:
+        """Check whether no IDs have been stored for any site yet."""
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM seen LIMIT 1").fetchone()
+        return row is None
+
+    def contains(self, site: str, watch_id: str) -> bool:
+        """Check whether a single ID has been seen for a site."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM seen WHERE site = ? AND watch_id = ?",
+                (site, watch_id),
+            ).fetchone()
+        return row is not None
+
+    def record_seen(self, site: str, watch_ids: Iterable[str]):
+        """Insert IDs for a site, ignoring ones that are already stored."""
+        ts = time.time_ns()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen (site, watch_id, ts) VALUES (?, ?, ?)",
+                ((site, watch_id, ts) for watch_id in watch_ids),
+            )
+
+    def sync(self, seen_items: Dict[str, Set[str]]):
+        """
+        Make the stored IDs match ``seen_items``.
+
+        Only the difference is written: new IDs are inserted, IDs that are no
+        longer tracked are deleted, and sites missing from ``seen_items`` are
+        dropped entirely.
+        """
+        ts = time.time_ns()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                stored_sites = {
+                    row[0] for row in self._conn.execute("SELECT DISTINCT site FROM seen")
+                }
+                for site in stored_sites - seen_items.keys():
+                    self._conn.execute("DELETE FROM seen WHERE site = ?", (site,))
+
+                for site, watch_ids in seen_items.items():
+                    stored = {
+                        row[0]
+                        for row in self._conn.execute(
+                            "SELECT watch_id FROM seen WHERE site = ?", (site,)
+                        )
+                    }
+                    removed = stored - watch_ids
+                    added = watch_ids - stored
+                    if removed:
+                        self._conn.executemany(
+                            "DELETE FROM seen WHERE site = ? AND watch_id = ?",
+                            ((site, watch_id) for watch_id in removed),
+                        )
+                    if added:
+                        self._conn.executemany(
+                            "INSERT OR IGNORE INTO seen (site, watch_id, ts) VALUES (?, ?, ?)",
+                            ((site, watch_id, ts) for watch_id in added),
+                        )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def count(self, site: str) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT count(*) FROM seen WHERE site = ?", (site,)
+            ).fetchone()[0]
+
+    def trim(self, site: str, max_items: int) -> Set[str]:
+        """
+        Keep only the ``max_items`` most recently recorded IDs for a site.
+
+        Returns:
+            The IDs that were removed, so callers can drop them from memory too
+        """
+        if self.count(site) <= max_items:
+            return set()
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                evicted = {
+                    row[0]
+                    for row in self._conn.execute(
+                        """
+                        SELECT watch_id FROM seen
+                        WHERE site = ?
+                        ORDER BY ts DESC, rowid DESC LIMIT -1 OFFSET ?
+                        """,
+                        (site, max_items),
+                    )
+                }
+                self._conn.executemany(
+                    "DELETE FROM seen WHERE site = ? AND watch_id = ?",
+                    ((site, watch_id) for watch_id in evicted),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return evicted
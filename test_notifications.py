@@ -7,6 +7,9 @@ Usage:
     python test_notifications.py watch_out         # Test only Watch Out
     python test_notifications.py tropicalwatch     # Test only Tropical Watch
     python test_notifications.py --reset-all       # Reset all seen watches and test
+
+Without a terminal, set CONTINUE_ON_MISSING_WEBHOOK=y to continue when a
+webhook is missing instead of aborting.
 """
 
 import asyncio
@@ -16,25 +19,41 @@ import os
 from pathlib import Path
 from datetime import datetime
 import json
+from functools import lru_cache
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from monitor import WatchMonitor
+# Only the lightweight config module is imported eagerly; the monitor stack
+# (aiohttp, BeautifulSoup, scrapers) loads once arguments have been parsed,
+# so --help and usage errors return immediately
 from config import SITE_CONFIGS, APP_CONFIG
-from persistence import PersistenceManager
-from logging_config import setup_logging
+
+# Sites tested by default (and by "all"); any configured site can be named
+DEFAULT_TEST_SITES = ("watch_out", "tropicalwatch")
+ALL_SITES_TOKEN = "all"
+
+
+@lru_cache(maxsize=1)
+def _get_persistence():
+    """Persistence manager shared by the status report and the reset step."""
+    from logging_config import setup_logging
+    from persistence import PersistenceManager
+
+    return PersistenceManager(setup_logging("INFO"))
 
 
 def check_webhooks(sites=None):
     """Check webhook configuration for specified sites."""
-    sites = sites or ['watch_out', 'tropicalwatch']
+    sites = sites or DEFAULT_TEST_SITES
     missing = []
     configured = []
     
     for site_key in sites:
-        if site_key in SITE_CONFIGS:
-            site_config = SITE_CONFIGS[site_key]
+        site_config = SITE_CONFIGS.get(site_key)
+        if site_config:
+            # Read per call: webhook URLs come from the environment, which
+            # __main__ may fill from .env after config was imported
             if site_config.webhook_url:
                 configured.append((site_key, site_config.name))
             else:
@@ -45,8 +64,7 @@ def check_webhooks(sites=None):
 
 def show_seen_watches_status():
     """Display current seen watches status."""
-    logger = setup_logging("INFO")
-    persistence = PersistenceManager(logger)
+    persistence = _get_persistence()
     seen_items = persistence.load_seen_items()
     
     print("\n📊 Current Seen Watches Status:")
@@ -55,21 +73,30 @@ def show_seen_watches_status():
     if not seen_items:
         print("   No seen watches recorded yet")
     else:
-        total = 0
-        for site_key, items in seen_items.items():
-            count = len(items)
-            total += count
-            site_name = SITE_CONFIGS.get(site_key, {}).get('name', site_key)
-            print(f"   {site_name:25} {count:5} watches")
-        print("-" * 60)
-        print(f"   {'TOTAL':25} {total:5} watches")
+        counts = {site_key: len(items) for site_key, items in seen_items.items()}
+        lines = []
+        for site_key, count in counts.items():
+            site_config = SITE_CONFIGS.get(site_key)
+            site_name = site_config.name if site_config else site_key
+            lines.append(f"   {site_name:25} {count:5} watches")
+        lines.append("-" * 60)
+        lines.append(f"   {'TOTAL':25} {sum(counts.values()):5} watches")
+        print("\n".join(lines))
     
     print("=" * 60)
     return seen_items
 
 
-async def test_single_scraper(monitor, site_key):
-    """Test a single scraper and report results."""
+async def test_single_scraper(monitor, site_key, pending_scrape=None):
+    """
+    Test a single scraper and report results.
+
+    Args:
+        monitor: Initialized WatchMonitor
+        site_key: Site to test
+        pending_scrape: Already started scrape of the site to report on
+            (started here when omitted)
+    """
     print(f"\n🔍 Testing {SITE_CONFIGS[site_key].name} scraper...")
     print("-" * 60)
     
@@ -81,7 +108,9 @@ async def test_single_scraper(monitor, site_key):
     try:
         # Run the scraper
         print(f"   Fetching {SITE_CONFIGS[site_key].url}...")
-        new_watches = await scraper.scrape()
+        if pending_scrape is None:
+            pending_scrape = scraper.scrape()
+        new_watches = await pending_scrape
         
         # Report findings
         print(f"\n   📦 Results:")
@@ -123,16 +152,16 @@ async def test_single_scraper(monitor, site_key):
             print(f"      - No watches found on the site")
             print(f"      - Use --reset flag to clear seen watches")
         
-        # Update seen items
+        # Stage seen items; monitor.cleanup() writes them once after all sites
         monitor.seen_items[site_key] = scraper.seen_ids
-        monitor.persistence.save_seen_items(monitor.seen_items)
+        monitor.persistence.stage_seen_items(monitor.seen_items)
         
         return True
         
     except Exception as e:
         print(f"❌ Error testing {site_key}: {e}")
-        import traceback
-        traceback.print_exc()
+        # The monitor's console handler prints the traceback after the message
+        monitor.logger.exception("Error testing %s", site_key)
         return False
 
 
@@ -146,9 +175,9 @@ async def main():
     parser.add_argument(
         "sites",
         nargs="*",
-        choices=["watch_out", "tropicalwatch", "all"],
-        default=["all"],
-        help="Sites to test (default: all)"
+        choices=(*SITE_CONFIGS, ALL_SITES_TOKEN),
+        default=[ALL_SITES_TOKEN],
+        help=f"Sites to test (default: {', '.join(DEFAULT_TEST_SITES)})"
     )
     
     parser.add_argument(
@@ -178,11 +207,11 @@ async def main():
     args = parser.parse_args()
     
     # Determine which sites to test
-    test_sites = []
-    if "all" in args.sites or not args.sites:
-        test_sites = ["watch_out", "tropicalwatch"]
+    if ALL_SITES_TOKEN in args.sites or not args.sites:
+        test_sites = list(DEFAULT_TEST_SITES)
     else:
-        test_sites = args.sites
+        # Drop repeated sites, keeping the order they were given in
+        test_sites = list(dict.fromkeys(args.sites))
     
     print("\n🧪 Watch Monitor Notification Test")
     print("=" * 60)
@@ -207,7 +236,15 @@ async def main():
         print("\n💡 Tip: Create a .env file with webhook URLs")
         
         if not args.dry_run:
-            response = input("\nContinue anyway? (y/N): ")
+            if sys.stdin.isatty():
+                # Read in the default executor so the event loop keeps running
+                loop = asyncio.get_running_loop()
+                response = await loop.run_in_executor(
+                    None, input, "\nContinue anyway? (y/N): "
+                )
+            else:
+                # Non-interactive runs (CI, cron) answer from the environment
+                response = os.environ.get("CONTINUE_ON_MISSING_WEBHOOK", "n")
             if response.lower() != 'y':
                 print("Aborted.")
                 return
@@ -218,8 +255,7 @@ async def main():
     # Handle reset
     if args.reset or args.reset_all:
         print("\n🔄 Resetting seen watches...")
-        logger = setup_logging("INFO")
-        persistence = PersistenceManager(logger)
+        persistence = _get_persistence()
         
         if args.reset_all:
             # Reset all
@@ -238,6 +274,8 @@ async def main():
         APP_CONFIG.enable_notifications = False
     
     # Create monitor
+    from monitor import WatchMonitor
+
     log_level = "DEBUG" if args.debug else "INFO"
     monitor = WatchMonitor(log_level=log_level)
     
@@ -246,10 +284,20 @@ async def main():
         print("\n🚀 Initializing monitor...")
         await monitor.initialize()
         
+        # Start every site's scrape at once so their page fetches overlap;
+        # results are still reported (and notified) one site at a time
+        scrapes = {
+            site_key: asyncio.ensure_future(monitor.scrapers[site_key].scrape())
+            for site_key in test_sites
+            if site_key in monitor.scrapers
+        }
+
         # Test each site
         results = {}
         for site_key in test_sites:
-            success = await test_single_scraper(monitor, site_key)
+            success = await test_single_scraper(
+                monitor, site_key, scrapes.get(site_key)
+            )
             results[site_key] = success
         
         # Summary
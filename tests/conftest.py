@@ -183,7 +183,8 @@ def mock_beautiful_soup():
     </div>
     """
     
-    return BeautifulSoup(html, 'html.parser')
+    # Same C-backed parser as BaseScraper._parsed_soup
+    return BeautifulSoup(html, 'lxml')
 
 
 @pytest.fixture
@@ -1,20 +1,56 @@
 """Comprehensive tests for Grimmeissen scraper."""
 
 import pytest
-import json
+import copy
+import string
+import types
 from decimal import Decimal
-from unittest.mock import Mock, AsyncMock, patch
-from bs4 import BeautifulSoup
-import aiohttp
+from unittest.mock import patch
+from bs4 import BeautifulSoup, SoupStrainer
 
 from scrapers.grimmeissen import GrimmeissenScraper
 from models import WatchData
 from config import SiteConfig
 
 
-@pytest.fixture
+# Site fields shared by every WatchData built in this module
+_DEFAULT_WATCH_KWARGS = {"site_name": "Grimmeissen", "site_key": "grimmeissen"}
+
+# The table tests only look at the spec table itself
+_TABLE_STRAINER = SoupStrainer('table')
+
+# Detail page holding only a Lieferumfang (scope of delivery) row
+_LIEFERUMFANG_HTML = string.Template("""
+<div class="c-7 do-lefty">
+    <h3>Details</h3>
+    <table>
+        <tr>
+            <th>Lieferumfang:</th>
+            <td>$text</td>
+        </tr>
+    </table>
+</div>
+""")
+
+# Listing row with a configurable price line
+_PRICED_WATCH_HTML = string.Template("""
+<article class="watch">
+    <figure>
+        <a href="/uhren/test-watch">
+            <img data-src="/images/test.jpg" alt="Test"/>
+        </a>
+    </figure>
+    <section class="fh">
+        <h1>Test Watch</h1>
+        <p>$price_text</p>
+    </section>
+</article>
+""")
+
+
+@pytest.fixture(scope="module")
 def grimmeissen_config():
-    """Grimmeissen site configuration for testing."""
+    """Grimmeissen site configuration, shared read-only across the module."""
     return SiteConfig(
         name="Grimmeissen",
         key="grimmeissen", 
@@ -22,21 +58,21 @@ def grimmeissen_config():
         webhook_env_var="GRIMMEISSEN_WEBHOOK_URL",
         color=0x8B4513,
         base_url="https://grimmeissen.de",
-        known_brands={
+        known_brands=types.MappingProxyType({
             "rolex": "Rolex",
             "omega": "Omega", 
             "breitling": "Breitling",
             "iwc": "IWC",
             "jaeger lecoultre": "Jaeger LeCoultre",
             "patek philippe": "Patek Philippe"
-        },
-        condition_mappings={
+        }),
+        condition_mappings=types.MappingProxyType({
             "neu": "★★★★★",
             "sehr gut": "★★★★☆", 
             "gut": "★★★☆☆",
             "gebraucht": "★★☆☆☆",
             "vintage": "★★☆☆☆"
-        }
+        })
     )
 
 
@@ -46,7 +82,17 @@ def grimmeissen_scraper(grimmeissen_config, mock_aiohttp_session, mock_logger):
     return GrimmeissenScraper(grimmeissen_config, mock_aiohttp_session, mock_logger)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def grimmeissen_watch_prototype():
+    """Bare listing watch; tests that fill in details work on a copy."""
+    return WatchData(
+        title="Test Watch",
+        url="https://grimmeissen.de/uhren/test",
+        **_DEFAULT_WATCH_KWARGS
+    )
+
+
+@pytest.fixture(scope="module")
 def grimmeissen_listing_html():
     """Sample HTML from Grimmeissen listing page."""
     return """
@@ -104,7 +150,7 @@ def grimmeissen_listing_html():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def grimmeissen_detail_html():
     """Sample HTML from Grimmeissen detail page."""
     return """
@@ -153,7 +199,7 @@ def grimmeissen_detail_html():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def grimmeissen_edge_case_html():
     """HTML with edge cases for testing."""
     return """
@@ -220,7 +266,10 @@ class TestGrimmeissenScraper:
 
     async def test_extract_watches_success(self, grimmeissen_scraper, grimmeissen_listing_html):
         """Test successful watch extraction from listing page."""
-        soup = BeautifulSoup(grimmeissen_listing_html, 'html.parser')
+        # Strained like BaseScraper.scrape() does for the live listing page
+        soup = BeautifulSoup(
+            grimmeissen_listing_html, 'lxml', parse_only=GrimmeissenScraper.LISTING_STRAINER
+        )
         watches = await grimmeissen_scraper._extract_watches(soup)
         
         assert len(watches) == 3
@@ -253,25 +302,28 @@ class TestGrimmeissenScraper:
 
     async def test_extract_watches_edge_cases(self, grimmeissen_scraper, grimmeissen_edge_case_html):
         """Test watch extraction with edge cases."""
-        soup = BeautifulSoup(grimmeissen_edge_case_html, 'html.parser')
+        soup = BeautifulSoup(
+            grimmeissen_edge_case_html, 'lxml', parse_only=GrimmeissenScraper.LISTING_STRAINER
+        )
         watches = await grimmeissen_scraper._extract_watches(soup)
         
         # Should only get watches with valid URLs
         assert len(watches) == 3  # Missing image, no price, and malformed price should still work
+        by_slug = {w.url.rsplit('/', 1)[-1]: w for w in watches}
         
         # Watch without image should work
-        watch_no_image = next((w for w in watches if "missing-image" in w.url), None)
+        watch_no_image = by_slug.get("missing-image-watch")
         assert watch_no_image is not None
         assert watch_no_image.image_url is None
         assert watch_no_image.price == Decimal("1000")
         
         # Watch without price should work
-        watch_no_price = next((w for w in watches if "no-price" in w.url), None)
+        watch_no_price = by_slug.get("no-price-watch")
         assert watch_no_price is not None
         assert watch_no_price.price is None
         
         # Watch with malformed price should work
-        watch_bad_price = next((w for w in watches if "malformed-price" in w.url), None)
+        watch_bad_price = by_slug.get("malformed-price-watch")
         assert watch_bad_price is not None
         assert watch_bad_price.price is None  # "Price varies" should not parse
 
@@ -281,11 +333,10 @@ class TestGrimmeissenScraper:
         watch = WatchData(
             title="Test Watch",
             url="https://grimmeissen.de/uhren/test-watch",
-            site_name="Grimmeissen",
-            site_key="grimmeissen"
+            **_DEFAULT_WATCH_KWARGS
         )
         
-        soup = BeautifulSoup(grimmeissen_detail_html, 'html.parser')
+        soup = BeautifulSoup(grimmeissen_detail_html, 'lxml')
         await grimmeissen_scraper._extract_watch_details(watch, soup)
         
         # Check updated fields
@@ -314,12 +365,11 @@ class TestGrimmeissenScraper:
         
         watch = WatchData(
             title="Original Title",
-            url="https://grimmeissen.de/uhren/test-watch", 
-            site_name="Grimmeissen",
-            site_key="grimmeissen"
+            url="https://grimmeissen.de/uhren/test-watch",
+            **_DEFAULT_WATCH_KWARGS
         )
         
-        soup = BeautifulSoup(minimal_html, 'html.parser')
+        soup = BeautifulSoup(minimal_html, 'lxml')
         await grimmeissen_scraper._extract_watch_details(watch, soup)
         
         # Should update title but keep other fields as original
@@ -346,7 +396,7 @@ class TestGrimmeissenScraper:
         </table>
         """
         
-        soup = BeautifulSoup(table_html, 'html.parser')
+        soup = BeautifulSoup(table_html, 'lxml', parse_only=_TABLE_STRAINER)
         table = soup.find('table')
         
         headers_map = {
@@ -383,7 +433,7 @@ class TestGrimmeissenScraper:
         </table>
         """
         
-        soup = BeautifulSoup(malformed_html, 'html.parser')
+        soup = BeautifulSoup(malformed_html, 'lxml', parse_only=_TABLE_STRAINER)
         table = soup.find('table')
         
         headers_map = {"Complete": "complete_field"}
@@ -405,50 +455,51 @@ class TestGrimmeissenScraper:
         </article>
         """
         
-        soup = BeautifulSoup(no_link_html, 'html.parser')
+        soup = BeautifulSoup(no_link_html, 'lxml')
         watch_tag = soup.find('article')
         
         result = grimmeissen_scraper._parse_watch_element(watch_tag)
         assert result is None
 
-    async def test_scraper_with_mock_data(self, grimmeissen_scraper):
+    @patch('scrapers.base.fetch_page', autospec=True)
+    async def test_scraper_with_mock_data(self, mock_fetch, grimmeissen_scraper):
         """Test full scraping flow with mocked data."""
         # Mock the seen_ids
         grimmeissen_scraper.set_seen_ids(set())
         
         # Mock fetch_page to return our test HTML
-        with patch('scrapers.grimmeissen.fetch_page') as mock_fetch:
-            mock_fetch.return_value = """
-            <article class="watch">
-                <figure>
-                    <a href="/uhren/test-watch">
-                        <img data-src="/images/test.jpg" alt="Test"/>
-                    </a>
-                </figure>
-                <section class="fh">
-                    <h1><span><a href="/brands/rolex">Rolex</a></span> Test Watch</h1>
-                    <p>€ 5.000</p>
-                </section>
-            </article>
-            """
-            
-            watches = await grimmeissen_scraper.scrape()
-            
-            assert len(watches) == 1
-            assert watches[0].title == "Rolex Test Watch"
-            assert watches[0].brand == "Rolex"
-            assert watches[0].price == Decimal("5000")
+        mock_fetch.return_value = """
+        <article class="watch">
+            <figure>
+                <a href="/uhren/test-watch">
+                    <img data-src="/images/test.jpg" alt="Test"/>
+                </a>
+            </figure>
+            <section class="fh">
+                <h1><span><a href="/brands/rolex">Rolex</a></span> Test Watch</h1>
+                <p>€ 5.000</p>
+            </section>
+        </article>
+        """
+        
+        watches = await grimmeissen_scraper.scrape()
+        
+        assert len(watches) == 1
+        assert watches[0].title == "Rolex Test Watch"
+        assert watches[0].brand == "Rolex"
+        assert watches[0].price == Decimal("5000")
 
-    async def test_scraper_error_handling(self, grimmeissen_scraper):
+    @patch('scrapers.base.fetch_page', autospec=True)
+    async def test_scraper_error_handling(self, mock_fetch, grimmeissen_scraper):
         """Test scraper error handling."""
         # Mock fetch_page to return None (simulating network error)
-        with patch('scrapers.grimmeissen.fetch_page') as mock_fetch:
-            mock_fetch.return_value = None
-            
-            watches = await grimmeissen_scraper.scrape()
-            assert watches == []
+        mock_fetch.return_value = None
+        
+        watches = await grimmeissen_scraper.scrape()
+        assert watches == []
 
-    def test_condition_mapping(self, grimmeissen_scraper):
+    @patch('scrapers.grimmeissen.parse_condition', autospec=True)
+    async def test_condition_mapping(self, mock_parse, grimmeissen_scraper, grimmeissen_watch_prototype):
         """Test condition text mapping."""
         # Test with actual condition parsing
         test_html = """
@@ -466,62 +517,46 @@ class TestGrimmeissenScraper:
         </html>
         """
         
-        watch = WatchData(
-            title="Test Watch",
-            url="https://grimmeissen.de/uhren/test",
-            site_name="Grimmeissen", 
-            site_key="grimmeissen"
-        )
+        watch = copy.copy(grimmeissen_watch_prototype)
         
-        soup = BeautifulSoup(test_html, 'html.parser')
+        soup = BeautifulSoup(test_html, 'lxml')
         
         # Mock parse_condition to test the flow
-        with patch('scrapers.grimmeissen.parse_condition') as mock_parse:
-            mock_parse.return_value = "★★★★★"
-            
-            grimmeissen_scraper._extract_watch_details(watch, soup)
-            
-            mock_parse.assert_called_once_with(
-                "Neu", 
-                "grimmeissen",
-                grimmeissen_scraper.config.condition_mappings
-            )
+        mock_parse.return_value = "★★★★★"
+        
+        await grimmeissen_scraper._extract_watch_details(watch, soup)
+        
+        mock_parse.assert_called_once_with(
+            "Neu", 
+            "grimmeissen",
+            grimmeissen_scraper.config.condition_mappings
+        )
 
-    async def test_box_papers_detection(self, grimmeissen_scraper):
+    @pytest.mark.parametrize("lieferumfang_text,expected_papers,expected_box", [
+        ("Uhr, Originalbox, Papiere", True, True),
+        ("Uhr, Box", False, True),
+        ("Uhr, Zertifikat, Papiere", True, False),
+        ("Nur Uhr", False, False),
+        ("Uhr, Originalverpackung, Garantiekarte", True, True),
+    ])
+    async def test_box_papers_detection(
+        self,
+        grimmeissen_scraper,
+        grimmeissen_watch_prototype,
+        lieferumfang_text,
+        expected_papers,
+        expected_box,
+    ):
         """Test box and papers detection."""
-        test_cases = [
-            ("Uhr, Originalbox, Papiere", True, True),
-            ("Uhr, Box", False, True), 
-            ("Uhr, Zertifikat, Papiere", True, False),
-            ("Nur Uhr", False, False),
-            ("Uhr, Originalverpackung, Garantiekarte", True, True),
-        ]
-        
-        for lieferumfang_text, expected_papers, expected_box in test_cases:
-            detail_html = f"""
-            <div class="c-7 do-lefty">
-                <h3>Details</h3>
-                <table>
-                    <tr>
-                        <th>Lieferumfang:</th>
-                        <td>{lieferumfang_text}</td>
-                    </tr>
-                </table>
-            </div>
-            """
-            
-            watch = WatchData(
-                title="Test Watch",
-                url="https://grimmeissen.de/uhren/test",
-                site_name="Grimmeissen",
-                site_key="grimmeissen"
-            )
-            
-            soup = BeautifulSoup(detail_html, 'html.parser')
-            await grimmeissen_scraper._extract_watch_details(watch, soup)
-            
-            assert watch.has_papers == expected_papers, f"Papers detection failed for: {lieferumfang_text}"
-            assert watch.has_box == expected_box, f"Box detection failed for: {lieferumfang_text}"
+        detail_html = _LIEFERUMFANG_HTML.substitute(text=lieferumfang_text)
+        
+        watch = copy.copy(grimmeissen_watch_prototype)
+        
+        soup = BeautifulSoup(detail_html, 'lxml')
+        await grimmeissen_scraper._extract_watch_details(watch, soup)
+        
+        assert watch.has_papers == expected_papers, f"Papers detection failed for: {lieferumfang_text}"
+        assert watch.has_box == expected_box, f"Box detection failed for: {lieferumfang_text}"
 
     @pytest.mark.parametrize("price_text,expected_price", [
         ("€ 8.500", Decimal("8500")),
@@ -534,21 +569,9 @@ class TestGrimmeissenScraper:
     ])
     def test_price_parsing_variations(self, grimmeissen_scraper, price_text, expected_price):
         """Test various price text formats."""
-        watch_html = f"""
-        <article class="watch">
-            <figure>
-                <a href="/uhren/test-watch">
-                    <img data-src="/images/test.jpg" alt="Test"/>
-                </a>
-            </figure>
-            <section class="fh">
-                <h1>Test Watch</h1>
-                <p>{price_text}</p>
-            </section>
-        </article>
-        """
+        watch_html = _PRICED_WATCH_HTML.substitute(price_text=price_text)
         
-        soup = BeautifulSoup(watch_html, 'html.parser')
+        soup = BeautifulSoup(watch_html, 'lxml')
         watch_tag = soup.find('article')
         
         result = grimmeissen_scraper._parse_watch_element(watch_tag)
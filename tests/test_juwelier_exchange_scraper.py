@@ -310,7 +310,7 @@ class TestJuwelierExchangeScraper:
     @pytest.mark.asyncio
     async def test_extract_watches_success(self, juwelier_exchange_scraper, juwelier_exchange_listing_html):
         """Test successful watch extraction from listing page."""
-        soup = BeautifulSoup(juwelier_exchange_listing_html, 'html.parser')
+        soup = BeautifulSoup(juwelier_exchange_listing_html, 'lxml')
         
         watches = await juwelier_exchange_scraper._extract_watches(soup)
         
@@ -347,7 +347,7 @@ class TestJuwelierExchangeScraper:
     @pytest.mark.asyncio
     async def test_extract_watches_empty_page(self, juwelier_exchange_scraper, juwelier_exchange_empty_html):
         """Test extraction from empty listing page."""
-        soup = BeautifulSoup(juwelier_exchange_empty_html, 'html.parser')
+        soup = BeautifulSoup(juwelier_exchange_empty_html, 'lxml')
         
         watches = await juwelier_exchange_scraper._extract_watches(soup)
         
@@ -356,7 +356,7 @@ class TestJuwelierExchangeScraper:
     @pytest.mark.asyncio
     async def test_extract_watches_malformed_elements(self, juwelier_exchange_scraper, juwelier_exchange_malformed_html):
         """Test extraction with malformed/missing elements."""
-        soup = BeautifulSoup(juwelier_exchange_malformed_html, 'html.parser')
+        soup = BeautifulSoup(juwelier_exchange_malformed_html, 'lxml')
         
         watches = await juwelier_exchange_scraper._extract_watches(soup)
         
@@ -375,7 +375,7 @@ class TestJuwelierExchangeScraper:
             <span class="product-price">€ 1.000,00</span>
         </div>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         element = soup.select_one('.card.product-box')
         
         result = juwelier_exchange_scraper._parse_watch_element(element)
@@ -405,7 +405,7 @@ class TestJuwelierExchangeScraper:
                 </a>
             </div>
             """
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, 'lxml')
             element = soup.select_one('.card.product-box')
             
             watch = juwelier_exchange_scraper._parse_watch_element(element)
@@ -427,7 +427,7 @@ class TestJuwelierExchangeScraper:
             site_key="juwelier_exchange"
         )
         
-        soup = BeautifulSoup(juwelier_exchange_detail_html, 'html.parser')
+        soup = BeautifulSoup(juwelier_exchange_detail_html, 'lxml')
         
         await juwelier_exchange_scraper._extract_watch_details(watch, soup)
         
@@ -458,7 +458,7 @@ class TestJuwelierExchangeScraper:
             site_key="juwelier_exchange"
         )
         
-        soup = BeautifulSoup(juwelier_exchange_minimal_detail_html, 'html.parser')
+        soup = BeautifulSoup(juwelier_exchange_minimal_detail_html, 'lxml')
         
         await juwelier_exchange_scraper._extract_watch_details(watch, soup)
         
@@ -481,7 +481,7 @@ class TestJuwelierExchangeScraper:
             site_key="juwelier_exchange"
         )
         
-        soup = BeautifulSoup(juwelier_exchange_complex_detail_html, 'html.parser')
+        soup = BeautifulSoup(juwelier_exchange_complex_detail_html, 'lxml')
         
         await juwelier_exchange_scraper._extract_watch_details(watch, soup)
         
@@ -515,13 +515,35 @@ class TestJuwelierExchangeScraper:
             site_key="juwelier_exchange"
         )
         
-        soup = BeautifulSoup(malformed_json_html, 'html.parser')
+        soup = BeautifulSoup(malformed_json_html, 'lxml')
         
         # Should not raise an exception and should keep original title
         juwelier_exchange_scraper._extract_watch_details(watch, soup)
         
         assert watch.title == "Original Title"  # Should remain unchanged due to JSON error
     
+    @pytest.mark.asyncio
+    async def test_json_ld_brand_as_plain_string(self, juwelier_exchange_scraper):
+        """Test JSON-LD brand given as a string instead of a Brand object."""
+        html = """
+        <script type="application/ld+json">
+        {"@context": "https://schema.org/", "@type": "Product", "name": "Omega Seamaster 300", "brand": "Omega"}
+        </script>
+        """
+
+        watch = WatchData(
+            title="Original Title",
+            url="https://juwelier-exchange.de/uhren/test",
+            site_name="Juwelier Exchange",
+            site_key="juwelier_exchange"
+        )
+
+        soup = BeautifulSoup(html, 'lxml')
+        await juwelier_exchange_scraper._extract_watch_details(watch, soup)
+
+        assert watch.title == "Omega Seamaster 300"
+        assert watch.brand == "Omega"
+
     def test_case_material_extraction_from_description(self, juwelier_exchange_scraper):
         """Test case material extraction from description text."""
         test_cases = [
@@ -555,7 +577,7 @@ class TestJuwelierExchangeScraper:
                 site_key="juwelier_exchange"
             )
             
-            soup = BeautifulSoup(detail_html, 'html.parser')
+            soup = BeautifulSoup(detail_html, 'lxml')
             
             # Extract the material parsing logic
             import re
@@ -686,7 +708,7 @@ class TestJuwelierExchangeScraper:
                     site_key="juwelier_exchange"
                 )
                 
-                soup = BeautifulSoup(detail_html, 'html.parser')
+                soup = BeautifulSoup(detail_html, 'lxml')
                 juwelier_exchange_scraper._extract_watch_details(watch, soup)
                 
                 assert watch.has_papers == expected_papers, f"Papers detection failed for: {description}"
@@ -713,7 +735,7 @@ class TestJuwelierExchangeScraper:
         </div>
         """
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         element = soup.select_one('.card.product-box')
         
         result = juwelier_exchange_scraper._parse_watch_element(element)
@@ -813,8 +835,8 @@ class TestJuwelierExchangeScraper:
         html1 = html_template.format(id=12345, url_path="watch-1")
         html2 = html_template.format(id=12346, url_path="watch-2")
         
-        soup1 = BeautifulSoup(html1, 'html.parser')
-        soup2 = BeautifulSoup(html2, 'html.parser')
+        soup1 = BeautifulSoup(html1, 'lxml')
+        soup2 = BeautifulSoup(html2, 'lxml')
         
         watch1 = juwelier_exchange_scraper._parse_watch_element(soup1.select_one('.card.product-box'))
         watch2 = juwelier_exchange_scraper._parse_watch_element(soup2.select_one('.card.product-box'))
@@ -1,5 +1,6 @@
 """Tests for data models."""
 
+import sys
 import pytest
 from decimal import Decimal
 from datetime import datetime
@@ -196,6 +197,42 @@ class TestWatchData:
         embed_title = watch._build_embed_title()
         assert len(embed_title) <= 253  # 250 + "..."
 
+    def test_needs_detail(self):
+        """Test detail fetching is only needed while notification fields are missing."""
+        watch = WatchData(
+            title="Rolex Submariner",
+            url="https://example.com/watch",
+            site_name="Test Site",
+            site_key="test_site",
+            price=Decimal("8500"),
+            image_url="https://example.com/image.jpg",
+            reference="116610LN",
+            year="2020",
+            condition="★★★★☆",
+            has_box=True,
+            has_papers=False,
+            case_material="Steel",
+            diameter="40 mm"
+        )
+        assert watch.needs_detail() is False
+
+        watch.has_papers = None
+        assert watch.needs_detail() is True
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need Python 3.10+")
+    def test_watch_data_uses_slots(self):
+        """Test WatchData instances carry no per-instance __dict__."""
+        watch = WatchData(
+            title="Test Watch",
+            url="https://example.com/watch",
+            site_name="Test Site",
+            site_key="test_site"
+        )
+
+        assert not hasattr(watch, "__dict__")
+        with pytest.raises(AttributeError):
+            watch.unknown_field = "value"
+
 
 class TestScrapingSession:
     """Test ScrapingSession model."""
@@ -214,6 +251,15 @@ class TestScrapingSession:
         assert session.errors_encountered == 0
         assert len(session.site_stats) == 0
     
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need Python 3.10+")
+    def test_scraping_session_uses_slots(self):
+        """Test ScrapingSession instances carry no per-instance __dict__."""
+        session = ScrapingSession(session_id="test-123")
+        
+        assert not hasattr(session, "__dict__")
+        with pytest.raises(AttributeError):
+            session.unknown_stat = 1
+    
     def test_add_site_result(self):
         """Test adding site results to session."""
         session = ScrapingSession(session_id="test-123")
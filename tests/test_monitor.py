@@ -78,6 +78,34 @@ class TestWatchMonitor:
                                 len(monitor.scrapers) > 0 or len(SCRAPER_CLASSES) == 0
                             )
 
+    @pytest.mark.asyncio
+    async def test_initialize_shares_one_pooled_session(self):
+        """Test every scraper receives the same pooled aiohttp session."""
+        with patch("monitor.aiohttp.TCPConnector") as mock_connector_class:
+            with patch("monitor.aiohttp.ClientSession") as mock_session_class:
+                with patch("monitor.PersistenceManager") as mock_persistence_class:
+                    site_configs = {"site_a": Mock(), "site_b": Mock()}
+                    scraper_classes = {"site_a": Mock(), "site_b": Mock()}
+                    with patch("monitor.SITE_CONFIGS", site_configs):
+                        with patch("monitor.SCRAPER_CLASSES", scraper_classes):
+                            mock_session = AsyncMock()
+                            mock_session_class.return_value = mock_session
+                            mock_persistence_class.return_value.load_seen_items.return_value = {}
+
+                            monitor = WatchMonitor()
+                            await monitor.initialize()
+
+        mock_connector_class.assert_called_once()
+        connector_kwargs = mock_connector_class.call_args.kwargs
+        assert connector_kwargs["limit_per_host"] > 0
+        assert connector_kwargs["ttl_dns_cache"] > 0
+        mock_session_class.assert_called_once()
+
+        for site_key, scraper_class in scraper_classes.items():
+            scraper_class.assert_called_once_with(
+                site_configs[site_key], mock_session, monitor.logger
+            )
+
     @pytest.mark.asyncio
     async def test_cleanup(self):
         """Test monitor cleanup."""
@@ -93,6 +121,23 @@ class TestWatchMonitor:
         session.close.assert_called_once()
         monitor.persistence.save_seen_items.assert_called_once_with(monitor.seen_items)
 
+    def test_periodic_cleanup_stages_trimmed_seen_items(self):
+        """Test periodic cleanup leaves the seen items write to the next flush."""
+        monitor = WatchMonitor()
+        monitor.persistence = Mock()
+        monitor.memory_monitor = Mock()
+        monitor.memory_monitor.get_current_usage_mb.return_value = 100.0
+        monitor.memory_monitor.force_garbage_collection.return_value = (0, 0, 0)
+        trimmed = {"site1": {"id2"}}
+        monitor.persistence.trim_seen_items.return_value = trimmed
+        monitor.seen_items = {"site1": {"id1", "id2"}}
+
+        monitor._perform_periodic_cleanup()
+
+        assert monitor.seen_items is trimmed
+        monitor.persistence.stage_seen_items.assert_called_once_with(trimmed)
+        monitor.persistence.save_seen_items.assert_not_called()
+
     def test_handle_shutdown(self):
         """Test shutdown signal handling."""
         monitor = WatchMonitor()
@@ -287,8 +332,9 @@ class TestWatchMonitor:
         # Check seen items were updated
         assert monitor.seen_items["site1"] == {"id1", "id2", "id3"}
 
-        # Verify persistence was called
-        monitor.persistence.save_seen_items.assert_called_once()
+        # Verify seen items were staged for the end-of-cycle flush
+        monitor.persistence.stage_seen_items.assert_called_once_with(monitor.seen_items)
+        monitor.persistence.save_seen_items.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_scrape_single_site_error(self):
@@ -536,7 +582,8 @@ class TestWatchMonitor:
         mock_scraper.scrape.assert_called_once()
         monitor.notification_manager.send_notifications.assert_called_once()
         monitor.persistence.save_session.assert_called_once()
-        monitor.persistence.save_seen_items.assert_called_once()
+        monitor.persistence.stage_seen_items.assert_called_once()
+        monitor.persistence.flush_if_needed.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_concurrent_site_scraping(self):
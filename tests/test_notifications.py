@@ -487,6 +487,39 @@ class TestNotificationManager:
         mock_sleep.assert_called_once_with(2)  # Should wait for rate limit
         mock_logger.warning.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_rate_limit_headers_throttle_next_request(
+        self, mock_aiohttp_session, mock_logger
+    ):
+        """Test Discord's rate limit headers hold back the next request."""
+        manager = NotificationManager(mock_aiohttp_session, mock_logger)
+
+        exhausted_response = AsyncMock()
+        exhausted_response.status = 204
+        exhausted_response.headers = {
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset-After": "3",
+        }
+        mock_aiohttp_session.post.return_value.__aenter__.return_value = (
+            exhausted_response
+        )
+
+        embed = {"title": "Test Watch", "color": 0x00FF00}
+        webhook_url = "https://discord.com/api/webhooks/test/token"
+
+        with patch("asyncio.sleep") as mock_sleep:
+            assert await manager._send_single_notification(
+                webhook_url, embed, "Test Site", "Test Watch"
+            )
+            mock_sleep.assert_not_called()
+
+            assert await manager._send_single_notification(
+                webhook_url, embed, "Test Site", "Test Watch"
+            )
+
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args.args[0] == pytest.approx(3, abs=0.5)
+
     @pytest.mark.asyncio
     async def test_send_single_notification_permanent_failure(
         self, mock_aiohttp_session, mock_logger
@@ -613,7 +646,7 @@ class TestNotificationManager:
     async def test_notification_rate_limiting(
         self, mock_aiohttp_session, mock_logger, test_site_config
     ):
-        """Test rate limiting between notifications."""
+        """Test requests beyond the bucket capacity wait for a refill."""
         watches = [
             WatchData(
                 title="Watch 1",
@@ -642,6 +675,7 @@ class TestNotificationManager:
             },
         ):
             manager = NotificationManager(mock_aiohttp_session, mock_logger)
+            manager.RATE_LIMIT_CAPACITY = 1
 
             # Mock successful responses
             mock_response = AsyncMock()
@@ -657,9 +691,57 @@ class TestNotificationManager:
                     result = await manager.send_notifications(watches, test_site_config)
 
         assert result == 3
-        # Should sleep between notifications (but not after the last one)
+        # One token per second: the first request goes at once, the others
+        # queue behind it one second apart
         assert mock_sleep.call_count == 2
-        mock_sleep.assert_called_with(1)  # 1 second delay
+        delays = sorted(call.args[0] for call in mock_sleep.call_args_list)
+        assert delays == [pytest.approx(1, abs=0.5), pytest.approx(2, abs=0.5)]
+
+    @pytest.mark.asyncio
+    async def test_send_notifications_overlaps_slow_responses(
+        self, mock_aiohttp_session, mock_logger, test_site_config
+    ):
+        """Test a slow webhook response does not hold back the next request."""
+        watches = [
+            WatchData(
+                title=f"Watch {i}",
+                url=f"https://example.com/watch{i}",
+                site_name="Test Site",
+                site_key="test_site",
+            )
+            for i in range(3)
+        ]
+        manager = NotificationManager(mock_aiohttp_session, mock_logger)
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def slow_send(*args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return True
+
+        with patch.dict(
+            "os.environ",
+            {
+                test_site_config.webhook_env_var: "https://discord.com/api/webhooks/test/token"
+            },
+        ):
+            with patch("notifications.APP_CONFIG") as mock_config:
+                mock_config.enable_notifications = True
+
+                with patch.object(
+                    manager, "_send_single_notification", side_effect=slow_send
+                ):
+                    result = await manager.send_notifications(
+                        watches, test_site_config
+                    )
+
+        assert result == 3
+        assert max_in_flight == 3
 
     @pytest.mark.asyncio
     async def test_notification_embed_generation(
@@ -692,10 +774,8 @@ class TestNotificationManager:
             manager = NotificationManager(mock_aiohttp_session, mock_logger)
 
             # Mock the to_discord_embed method to verify it's called with correct color
-            original_to_embed = watch.to_discord_embed
-            watch.to_discord_embed = Mock(
-                return_value=original_to_embed(test_site_config.color)
-            )
+            # (patched on the class: WatchData instances have no __dict__)
+            embed_mock = Mock(return_value=watch.to_discord_embed(test_site_config.color))
 
             mock_response = AsyncMock()
             mock_response.status = 204
@@ -703,7 +783,9 @@ class TestNotificationManager:
                 mock_response
             )
 
-            with patch("notifications.APP_CONFIG") as mock_config:
+            with patch("notifications.APP_CONFIG") as mock_config, patch.object(
+                WatchData, "to_discord_embed", embed_mock
+            ):
                 mock_config.enable_notifications = True
 
                 result = await manager.send_notifications([watch], test_site_config)
@@ -711,7 +793,7 @@ class TestNotificationManager:
         assert result == 1
 
         # Verify embed was generated with site color
-        watch.to_discord_embed.assert_called_once_with(test_site_config.color)
+        embed_mock.assert_called_once_with(test_site_config.color)
 
         # Verify request payload
         call_args = mock_aiohttp_session.post.call_args
@@ -62,6 +62,44 @@ class TestPersistenceManager:
             f"Loaded seen items: 5 total"
         )
     
+    def test_warm_populates_load_caches(self, test_persistence_manager, temp_dir):
+        """Test warm() loads both files and later loads are served from cache."""
+        seen_file = temp_dir / "test_seen_watches.json"
+        seen_file.write_text(json.dumps({"site1": ["id1", "id2"]}))
+        history_file = temp_dir / "test_session_history.json"
+        history_file.write_text(json.dumps([{"session_id": "s1", "started_at": datetime.now().isoformat()}]))
+        
+        test_persistence_manager.seen_items_file = seen_file
+        test_persistence_manager.session_history_file = history_file
+        
+        test_persistence_manager.warm()
+        
+        assert test_persistence_manager._seen_cache == {"site1": {"id1", "id2"}}
+        assert test_persistence_manager._history_cache[0]["session_id"] == "s1"
+        
+        with patch("builtins.open", side_effect=AssertionError("disk read")):
+            seen = test_persistence_manager.load_seen_items()
+            history = test_persistence_manager.load_session_history()
+        
+        assert seen == {"site1": {"id1", "id2"}}
+        assert len(history) == 1
+        
+        # Returned containers are copies, not the cache itself
+        seen["site1"].add("id3")
+        assert test_persistence_manager._seen_cache["site1"] == {"id1", "id2"}
+    
+    def test_load_seen_items_cache_invalidated_on_change(self, test_persistence_manager, temp_dir):
+        """Test a changed file bypasses the load cache."""
+        seen_file = temp_dir / "test_seen_watches.json"
+        seen_file.write_text(json.dumps({"site1": ["id1"]}))
+        test_persistence_manager.seen_items_file = seen_file
+        
+        assert test_persistence_manager.load_seen_items() == {"site1": {"id1"}}
+        
+        seen_file.write_text(json.dumps({"site1": ["id1", "id2", "id3"]}))
+        
+        assert test_persistence_manager.load_seen_items() == {"site1": {"id1", "id2", "id3"}}
+    
     def test_load_seen_items_empty_file(self, test_persistence_manager, temp_dir):
         """Test loading seen items from empty file."""
         seen_file = temp_dir / "test_seen_watches.json"
@@ -145,6 +183,49 @@ class TestPersistenceManager:
         # Verify warning was logged
         test_persistence_manager.logger.warning.assert_called()
     
+    def test_stage_and_flush_seen_items(self, test_persistence_manager, temp_dir):
+        """Test staged seen items are written once per flush."""
+        seen_file = temp_dir / "test_seen_watches.json"
+        test_persistence_manager.seen_items_file = seen_file
+        seen_items = {"site1": {"id1"}}
+        
+        test_persistence_manager.stage_seen_items(seen_items)
+        seen_items["site2"] = {"id2"}
+        test_persistence_manager.stage_seen_items(seen_items)
+        
+        assert not seen_file.exists()
+        assert test_persistence_manager.flush_if_needed() is True
+        
+        with open(seen_file, 'r') as f:
+            saved_data = json.load(f)
+        assert set(saved_data) == {"site1", "site2"}
+        
+        # Nothing staged since the last write
+        assert test_persistence_manager.flush_if_needed() is False
+        assert test_persistence_manager.flush() is False
+    
+    def test_flush_if_needed_respects_min_interval(self, test_persistence_manager, temp_dir):
+        """Test flush_if_needed defers writes inside the minimum interval."""
+        test_persistence_manager.seen_items_file = temp_dir / "test_seen_watches.json"
+        
+        test_persistence_manager.stage_seen_items({"site1": {"id1"}})
+        assert test_persistence_manager.flush_if_needed(min_interval=60) is True
+        
+        test_persistence_manager.stage_seen_items({"site1": {"id1", "id2"}})
+        assert test_persistence_manager.flush_if_needed(min_interval=60) is False
+        assert test_persistence_manager.flush() is True
+    
+    def test_flush_keeps_items_staged_after_failed_write(self, test_persistence_manager, temp_dir):
+        """Test a failed flush is reported and retried on the next flush."""
+        test_persistence_manager.seen_items_file = temp_dir / "test_seen_watches.json"
+        test_persistence_manager.stage_seen_items({"site1": {"id1"}})
+        
+        with patch('builtins.open', side_effect=OSError("disk full")):
+            assert test_persistence_manager.flush() is False
+        
+        assert test_persistence_manager.flush() is True
+        assert test_persistence_manager.load_seen_items() == {"site1": {"id1"}}
+    
     def test_save_seen_items_error(self, test_persistence_manager):
         """Test saving seen items with file error."""
         test_data = {"site1": {"id1"}}
@@ -417,6 +498,61 @@ class TestPersistenceManager:
         # No cleanup should have occurred
         test_persistence_manager.logger.info.assert_not_called()
     
+    def test_cleanup_old_data_skipped_after_save_session(self, test_persistence_manager, temp_dir):
+        """Test cleanup is a no-op when save_session already trimmed the file."""
+        history_file = temp_dir / "test_session_history.json"
+        test_persistence_manager.session_history_file = history_file
+        
+        session = ScrapingSession(session_id="test-session")
+        session.finalize()
+        test_persistence_manager.save_session(session)
+        
+        test_persistence_manager.load_session_history = Mock(side_effect=AssertionError("reloaded"))
+        test_persistence_manager.cleanup_old_data()
+        
+        test_persistence_manager.load_session_history.assert_not_called()
+        test_persistence_manager.logger.error.assert_not_called()
+    
+    def test_save_session_keeps_history_within_limit(self, test_persistence_manager, temp_dir):
+        """Test save_session writes at most max_session_history_entries sessions."""
+        history_file = temp_dir / "test_session_history.json"
+        test_persistence_manager.session_history_file = history_file
+        
+        with patch('persistence.APP_CONFIG') as mock_config:
+            mock_config.session_history_retention_days = 30
+            mock_config.max_session_history_entries = 2
+            
+            for index in range(3):
+                session = ScrapingSession(session_id=f"session-{index}")
+                session.finalize()
+                test_persistence_manager.save_session(session)
+        
+        with open(history_file, 'r') as f:
+            saved_data = json.load(f)
+        assert [s["session_id"] for s in saved_data] == ["session-1", "session-2"]
+    
+    def test_cleanup_old_data_removes_sessions_aged_out_since_save(self, test_persistence_manager, temp_dir):
+        """Test cleanup still applies retention to a file save_session wrote."""
+        history_file = temp_dir / "test_session_history.json"
+        test_persistence_manager.session_history_file = history_file
+        
+        session = ScrapingSession(session_id="test-session")
+        session.finalize()
+        
+        with patch('persistence.APP_CONFIG') as mock_config:
+            mock_config.session_history_retention_days = 30
+            mock_config.max_session_history_entries = 100
+            test_persistence_manager.save_session(session)
+            
+            # The saved session has since passed the retention cutoff
+            with patch('persistence.datetime') as mock_datetime:
+                mock_datetime.now.return_value = datetime.now() + timedelta(days=31)
+                mock_datetime.fromisoformat = datetime.fromisoformat
+                test_persistence_manager.cleanup_old_data()
+        
+        with open(history_file, 'r') as f:
+            assert json.load(f) == []
+    
     def test_cleanup_old_data_error(self, test_persistence_manager):
         """Test cleanup with error."""
         test_persistence_manager.load_session_history = Mock(side_effect=Exception("Load error"))
@@ -343,7 +343,7 @@ class TestRueschenbeckScraper:
     @pytest.mark.asyncio
     async def test_extract_watches_success(self, rueschenbeck_scraper, rueschenbeck_listing_html):
         """Test successful watch extraction from listing page."""
-        soup = BeautifulSoup(rueschenbeck_listing_html, 'html.parser')
+        soup = BeautifulSoup(rueschenbeck_listing_html, 'lxml')
         
         watches = await rueschenbeck_scraper._extract_watches(soup)
         
@@ -392,7 +392,7 @@ class TestRueschenbeckScraper:
     @pytest.mark.asyncio
     async def test_extract_watches_skip_sold_items(self, rueschenbeck_scraper, rueschenbeck_listing_html):
         """Test that sold watches are skipped."""
-        soup = BeautifulSoup(rueschenbeck_listing_html, 'html.parser')
+        soup = BeautifulSoup(rueschenbeck_listing_html, 'lxml')
         
         watches = await rueschenbeck_scraper._extract_watches(soup)
         
@@ -404,7 +404,7 @@ class TestRueschenbeckScraper:
     @pytest.mark.asyncio
     async def test_extract_watches_empty_page(self, rueschenbeck_scraper, rueschenbeck_empty_html):
         """Test extraction from empty listing page."""
-        soup = BeautifulSoup(rueschenbeck_empty_html, 'html.parser')
+        soup = BeautifulSoup(rueschenbeck_empty_html, 'lxml')
         
         watches = await rueschenbeck_scraper._extract_watches(soup)
         
@@ -413,7 +413,7 @@ class TestRueschenbeckScraper:
     @pytest.mark.asyncio
     async def test_extract_watches_malformed_elements(self, rueschenbeck_scraper, rueschenbeck_malformed_html):
         """Test extraction with malformed/missing elements."""
-        soup = BeautifulSoup(rueschenbeck_malformed_html, 'html.parser')
+        soup = BeautifulSoup(rueschenbeck_malformed_html, 'lxml')
         
         watches = await rueschenbeck_scraper._extract_watches(soup)
         
@@ -444,7 +444,7 @@ class TestRueschenbeckScraper:
             </div>
         </li>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         element = soup.select_one('.-rb-list-item')
         
         result = rueschenbeck_scraper._parse_watch_element(element)
@@ -482,7 +482,7 @@ class TestRueschenbeckScraper:
                 </a>
             </li>
             """
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, 'lxml')
             element = soup.select_one('.-rb-list-item')
             
             watch = rueschenbeck_scraper._parse_watch_element(element)
@@ -517,7 +517,7 @@ class TestRueschenbeckScraper:
                 </a>
             </li>
             """
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, 'lxml')
             element = soup.select_one('.-rb-list-item')
             
             watch = rueschenbeck_scraper._parse_watch_element(element)
@@ -564,7 +564,7 @@ class TestRueschenbeckScraper:
         """
         
         # Test with CPO badge
-        soup_cpo = BeautifulSoup(html_with_cpo, 'html.parser')
+        soup_cpo = BeautifulSoup(html_with_cpo, 'lxml')
         element_cpo = soup_cpo.select_one('.-rb-list-item')
         
         watch_cpo = rueschenbeck_scraper._parse_watch_element(element_cpo)
@@ -573,7 +573,7 @@ class TestRueschenbeckScraper:
         assert watch_cpo.condition == "★★★★☆"  # CPO condition
         
         # Test without CPO badge
-        soup_non_cpo = BeautifulSoup(html_without_cpo, 'html.parser')
+        soup_non_cpo = BeautifulSoup(html_without_cpo, 'lxml')
         element_non_cpo = soup_non_cpo.select_one('.-rb-list-item')
         
         watch_non_cpo = rueschenbeck_scraper._parse_watch_element(element_non_cpo)
@@ -593,7 +593,7 @@ class TestRueschenbeckScraper:
             model="Original Model"
         )
         
-        soup = BeautifulSoup(rueschenbeck_detail_html, 'html.parser')
+        soup = BeautifulSoup(rueschenbeck_detail_html, 'lxml')
         
         await rueschenbeck_scraper._extract_watch_details(watch, soup)
         
@@ -625,7 +625,7 @@ class TestRueschenbeckScraper:
             site_key="rueschenbeck"
         )
         
-        soup = BeautifulSoup(rueschenbeck_minimal_detail_html, 'html.parser')
+        soup = BeautifulSoup(rueschenbeck_minimal_detail_html, 'lxml')
         
         await rueschenbeck_scraper._extract_watch_details(watch, soup)
         
@@ -668,7 +668,7 @@ class TestRueschenbeckScraper:
         </div>
         """
         
-        soup = BeautifulSoup(detail_html, 'html.parser')
+        soup = BeautifulSoup(detail_html, 'lxml')
         
         details = rueschenbeck_scraper._parse_rueschenbeck_details(soup)
         
@@ -697,7 +697,7 @@ class TestRueschenbeckScraper:
         </div>
         """
         
-        soup = BeautifulSoup(detail_html, 'html.parser')
+        soup = BeautifulSoup(detail_html, 'lxml')
         
         details = rueschenbeck_scraper._parse_rueschenbeck_details(soup)
         
@@ -707,6 +707,26 @@ class TestRueschenbeckScraper:
         assert details.get("case_material_text") == "Roségold"
         assert details.get("condition_text") == "Very Good"
     
+    def test_parse_rueschenbeck_details_label_priority(self, rueschenbeck_scraper):
+        """Test labels matching several keyword groups go to the highest-priority field."""
+        detail_html = """
+        <div class="product-specifications">
+            <table>
+                <tr><th>Gehäusedurchmesser:</th><td>41 mm</td></tr>
+                <tr><th>Gehäusematerial:</th><td>Titan</td></tr>
+                <tr><th>Preis:</th><td>9.000 €</td></tr>
+            </table>
+        </div>
+        """
+
+        soup = BeautifulSoup(detail_html, 'lxml')
+
+        details = rueschenbeck_scraper._parse_rueschenbeck_details(soup)
+
+        assert details.get("diameter_text") == "41 mm"
+        assert details.get("case_material_text") == "Titan"
+        assert "9.000 €" not in details.values()
+
     def test_parse_rueschenbeck_details_description_sections(self, rueschenbeck_scraper):
         """Test parsing from description sections."""
         detail_html = """
@@ -727,7 +747,7 @@ class TestRueschenbeckScraper:
         </div>
         """
         
-        soup = BeautifulSoup(detail_html, 'html.parser')
+        soup = BeautifulSoup(detail_html, 'lxml')
         
         details = rueschenbeck_scraper._parse_rueschenbeck_details(soup)
         
@@ -819,7 +839,7 @@ class TestRueschenbeckScraper:
                     site_key="rueschenbeck"
                 )
                 
-                soup = BeautifulSoup(detail_html, 'html.parser')
+                soup = BeautifulSoup(detail_html, 'lxml')
                 rueschenbeck_scraper._extract_watch_details(watch, soup)
                 
                 assert watch.has_papers == expected_papers, f"Papers detection failed for: {detail_text}"
@@ -853,7 +873,7 @@ class TestRueschenbeckScraper:
         </li>
         """
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         element = soup.select_one('.-rb-list-item')
         
         result = rueschenbeck_scraper._parse_watch_element(element)
@@ -967,8 +987,8 @@ class TestRueschenbeckScraper:
         html1 = html_template.format(url_path="watch-1", brand="Brand1", title="Watch 1")
         html2 = html_template.format(url_path="watch-2", brand="Brand2", title="Watch 2")
         
-        soup1 = BeautifulSoup(html1, 'html.parser')
-        soup2 = BeautifulSoup(html2, 'html.parser')
+        soup1 = BeautifulSoup(html1, 'lxml')
+        soup2 = BeautifulSoup(html2, 'lxml')
         
         watch1 = rueschenbeck_scraper._parse_watch_element(soup1.select_one('.-rb-list-item'))
         watch2 = rueschenbeck_scraper._parse_watch_element(soup2.select_one('.-rb-list-item'))
@@ -1007,7 +1027,7 @@ class TestRueschenbeckScraper:
                 </a>
             </li>
             """
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, 'lxml')
             element = soup.select_one('.-rb-list-item')
             
             watch = rueschenbeck_scraper._parse_watch_element(element)
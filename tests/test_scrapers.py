@@ -2,11 +2,12 @@
 
 import pytest
 import asyncio
+import threading
 from unittest.mock import AsyncMock, Mock, patch
 from bs4 import BeautifulSoup
 from decimal import Decimal
 
-from scrapers.base import BaseScraper
+from scrapers.base import BaseScraper, listing_strainer
 from scrapers.worldoftime import WorldOfTimeScraper
 from models import WatchData
 from config import SiteConfig
@@ -157,6 +158,177 @@ class TestBaseScraper:
         assert result[0].reference == "123456"
         assert result[0].year == "2020"
     
+    @pytest.mark.asyncio
+    async def test_fetch_watch_details_bounded_concurrency(self, test_site_config, mock_aiohttp_session, mock_logger):
+        """Test detail fetching never exceeds max_concurrent_details in flight."""
+        class TestScraper(BaseScraper):
+            async def _extract_watches(self, soup):
+                return []
+
+            async def _extract_watch_details(self, watch, soup):
+                pass
+
+        scraper = TestScraper(test_site_config, mock_aiohttp_session, mock_logger)
+        watches = [
+            WatchData(
+                title=f"Watch {i}",
+                url=f"https://example.com/watch/{i}",
+                site_name="Test Site",
+                site_key="test_site"
+            )
+            for i in range(7)
+        ]
+        in_flight = 0
+        peak = 0
+        fetched = []
+
+        async def fake_detail(watch):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            fetched.append(watch.url)
+            in_flight -= 1
+
+        scraper._fetch_single_watch_detail = fake_detail
+
+        with patch('scrapers.base.APP_CONFIG') as mock_config:
+            mock_config.detail_page_delay = 0
+            mock_config.max_concurrent_details = 2
+
+            await scraper._fetch_watch_details(watches)
+
+        assert peak == 2
+        assert sorted(fetched) == sorted(w.url for w in watches)
+
+    @pytest.mark.asyncio
+    async def test_fetch_watch_details_skips_complete_watches(self, test_site_config, mock_aiohttp_session, mock_logger):
+        """Test watches with every notification field from the listing are not fetched."""
+        class TestScraper(BaseScraper):
+            async def _extract_watches(self, soup):
+                return []
+
+            async def _extract_watch_details(self, watch, soup):
+                pass
+
+        scraper = TestScraper(test_site_config, mock_aiohttp_session, mock_logger)
+        complete = WatchData(
+            title="Complete Watch",
+            url="https://example.com/watch/complete",
+            site_name="Test Site",
+            site_key="test_site",
+            price=Decimal("5000"),
+            image_url="https://example.com/image.jpg",
+            reference="123",
+            year="2020",
+            condition="★★★★☆",
+            has_box=True,
+            has_papers=True,
+            case_material="Steel",
+            diameter="40 mm"
+        )
+        partial = WatchData(
+            title="Partial Watch",
+            url="https://example.com/watch/partial",
+            site_name="Test Site",
+            site_key="test_site"
+        )
+        scraper._fetch_single_watch_detail = AsyncMock()
+
+        with patch('scrapers.base.APP_CONFIG') as mock_config:
+            mock_config.detail_page_delay = 0
+            mock_config.max_concurrent_details = 2
+
+            await scraper._fetch_watch_details([complete, partial])
+
+        scraper._fetch_single_watch_detail.assert_awaited_once_with(partial)
+
+    @pytest.mark.asyncio
+    async def test_fetch_watch_details_spaces_request_starts(self, test_site_config, mock_aiohttp_session, mock_logger):
+        """Test detail requests start at most max_concurrent_details per detail_page_delay."""
+        class TestScraper(BaseScraper):
+            async def _extract_watches(self, soup):
+                return []
+
+            async def _extract_watch_details(self, watch, soup):
+                pass
+
+        scraper = TestScraper(test_site_config, mock_aiohttp_session, mock_logger)
+        watches = [
+            WatchData(
+                title=f"Watch {i}",
+                url=f"https://example.com/watch/{i}",
+                site_name="Test Site",
+                site_key="test_site"
+            )
+            for i in range(4)
+        ]
+        loop = asyncio.get_running_loop()
+        starts = []
+
+        async def fake_detail(watch):
+            starts.append(loop.time())
+
+        scraper._fetch_single_watch_detail = fake_detail
+
+        with patch('scrapers.base.APP_CONFIG') as mock_config:
+            mock_config.detail_page_delay = 0.1
+            mock_config.max_concurrent_details = 2
+
+            await scraper._fetch_watch_details(watches)
+
+        assert len(starts) == 4
+        gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+        assert all(gap >= 0.045 for gap in gaps)
+        # No extra trailing delay per worker: total time is just the spacing
+        assert starts[-1] - starts[0] < 0.3
+
+    @pytest.mark.asyncio
+    async def test_detail_soup_cleaned_up_when_extraction_fails(self, test_site_config, mock_aiohttp_session, mock_logger, sample_html_content):
+        """Test the detail page soup is decomposed even if extraction raises."""
+        class TestScraper(BaseScraper):
+            async def _extract_watches(self, soup):
+                return []
+
+            async def _extract_watch_details(self, watch, soup):
+                raise ValueError("Broken detail page")
+
+        scraper = TestScraper(test_site_config, mock_aiohttp_session, mock_logger)
+        watch = WatchData(
+            title="Test Watch",
+            url="https://example.com/watch",
+            site_name="Test Site",
+            site_key="test_site"
+        )
+
+        with patch('scrapers.base.fetch_page', return_value=sample_html_content):
+            with patch.object(scraper, '_cleanup_soup') as mock_cleanup:
+                with pytest.raises(ValueError):
+                    await scraper._fetch_single_watch_detail(watch)
+
+        mock_cleanup.assert_called_once()
+        assert watch.detail_scraped is False
+
+    @pytest.mark.asyncio
+    async def test_parsed_soup_builds_tree_off_event_loop(self, test_site_config, mock_aiohttp_session, mock_logger, sample_html_content):
+        """Test page parsing runs in the executor, not on the event loop thread."""
+        class TestScraper(BaseScraper):
+            async def _extract_watches(self, soup):
+                return []
+
+        scraper = TestScraper(test_site_config, mock_aiohttp_session, mock_logger)
+        parse_threads = []
+
+        def recording_soup(*args, **kwargs):
+            parse_threads.append(threading.get_ident())
+            return BeautifulSoup(*args, **kwargs)
+
+        with patch('scrapers.base.BeautifulSoup', side_effect=recording_soup):
+            async with scraper._parsed_soup(sample_html_content) as soup:
+                assert soup.find("html") is not None
+
+        assert parse_threads and parse_threads[0] != threading.get_ident()
+
     @pytest.mark.asyncio
     async def test_scrape_extraction_error(self, test_site_config, mock_aiohttp_session, mock_logger, sample_html_content):
         """Test scraping when watch extraction raises an error."""
@@ -259,6 +431,72 @@ class TestBaseScraper:
         result = mock_base_scraper._clean_reference(None)
         assert result is None
 
+    def test_extract_brand_model_prefers_first_listed_brand(self, mock_aiohttp_session, mock_logger):
+        """Test brand prefix matching keeps the known_brands order."""
+        class TestScraper(BaseScraper):
+            async def _extract_watches(self, soup):
+                return []
+
+            async def _extract_watch_details(self, watch, soup):
+                pass
+
+        config = SiteConfig(
+            name="Test Site",
+            key="test_site",
+            url="https://example.com",
+            webhook_env_var="TEST_WEBHOOK",
+            color=0x000000,
+            base_url="https://example.com",
+            known_brands={
+                "rolex vintage": "Rolex",
+                "rolex": "Rolex",
+                "a. lange & söhne": "A. Lange & Söhne",
+            },
+        )
+        scraper = TestScraper(config, mock_aiohttp_session, mock_logger)
+
+        assert scraper._extract_brand_model("Rolex Vintage Submariner 5513") == ("Rolex", "Submariner 5513")
+        assert scraper._extract_brand_model("Rolex - Datejust") == ("Rolex", "Datejust")
+        assert scraper._extract_brand_model("A. Lange & Söhne Saxonia") == ("A. Lange & Söhne", "Saxonia")
+        assert scraper._extract_brand_model("Omega Seamaster") == ("Omega", "Seamaster")
+
+    def test_listing_strainer_matches_multi_class_elements(self):
+        """Test listing strainer keeps only matching elements, including multi-class ones."""
+        html = """
+        <html><body>
+            <nav><a href="/">Home</a></nav>
+            <div class="wrapper">
+                <article class="watch sold"><h1>First</h1></article>
+                <article class="watch"><h1>Second</h1></article>
+                <article class="watches"><h1>Other</h1></article>
+            </div>
+            <footer>Footer</footer>
+        </body></html>
+        """
+        soup = BeautifulSoup(html, "lxml", parse_only=listing_strainer("article", "watch"))
+
+        titles = [tag.get_text() for tag in soup.select("article.watch h1")]
+        assert titles == ["First", "Second"]
+        assert soup.find("nav") is None
+        assert soup.find("footer") is None
+
+    def test_listing_strainer_matches_any_listed_class(self):
+        """Test listing strainer keeps elements carrying any of several classes."""
+        html = """
+        <html><body>
+            <div class="header">Header</div>
+            <div class="new-arrivals-watch"><p>First</p></div>
+            <div class="paged-clocks-container">
+                <div class="watch-link"><p>Second</p></div>
+            </div>
+        </body></html>
+        """
+        strainer = listing_strainer("div", "new-arrivals-watch", "paged-clocks-container")
+        soup = BeautifulSoup(html, "lxml", parse_only=strainer)
+
+        assert [p.get_text() for p in soup.find_all("p")] == ["First", "Second"]
+        assert soup.find("div", class_="header") is None
+
 
 class TestWorldOfTimeScraper:
     """Test WorldOfTimeScraper implementation."""
@@ -321,7 +559,7 @@ class TestWorldOfTimeScraper:
         """
         
         scraper = WorldOfTimeScraper(config, mock_aiohttp_session, mock_logger)
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, 'lxml')
         
         result = await scraper._extract_watches(soup)
         
@@ -364,7 +602,7 @@ class TestWorldOfTimeScraper:
         html_content = "<div class='no-watches'>No watches found</div>"
         
         scraper = WorldOfTimeScraper(config, mock_aiohttp_session, mock_logger)  
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, 'lxml')
         
         result = await scraper._extract_watches(soup)
         
@@ -395,7 +633,7 @@ class TestWorldOfTimeScraper:
         """
         
         scraper = WorldOfTimeScraper(config, mock_aiohttp_session, mock_logger)
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, 'lxml')
         
         result = await scraper._extract_watches(soup)
         
@@ -430,7 +668,7 @@ class TestWorldOfTimeScraper:
         """
         
         scraper = WorldOfTimeScraper(config, mock_aiohttp_session, mock_logger)
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, 'lxml')
         
         # Mock _parse_watch_element to raise error for second element
         original_parse = scraper._parse_watch_element
@@ -494,7 +732,7 @@ class TestWorldOfTimeScraper:
         )
         
         scraper = WorldOfTimeScraper(config, mock_aiohttp_session, mock_logger)
-        soup = BeautifulSoup(detail_html, 'html.parser')
+        soup = BeautifulSoup(detail_html, 'lxml')
         
         await scraper._extract_watch_details(watch, soup)
         
@@ -529,7 +767,7 @@ class TestWorldOfTimeScraper:
         )
         
         scraper = WorldOfTimeScraper(config, mock_aiohttp_session, mock_logger)
-        soup = BeautifulSoup(detail_html, 'html.parser')
+        soup = BeautifulSoup(detail_html, 'lxml')
         
         # Should not raise an error
         await scraper._extract_watch_details(watch, soup)
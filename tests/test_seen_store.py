@@ -0,0 +1,112 @@
+"""Tests for SQLite-backed seen ID storage."""
+
+import json
+from unittest.mock import Mock, patch
+
+from persistence import PersistenceManager
+from seen_store import SeenStore
+
+
+def test_record_seen_and_load(temp_dir):
+    store = SeenStore(str(temp_dir / "seen.db"))
+    try:
+        store.record_seen("site1", ["id1", "id2"])
+        store.record_seen("site1", ["id2", "id3"])
+        store.record_seen("site2", ["id4"])
+
+        assert store.load() == {"site1": {"id1", "id2", "id3"}, "site2": {"id4"}}
+        assert store.contains("site1", "id3") is True
+        assert store.contains("site2", "id1") is False
+        assert store.count("site1") == 3
+    finally:
+        store.close()
+
+
+def test_sync_writes_only_differences(temp_dir):
+    store = SeenStore(str(temp_dir / "seen.db"))
+    try:
+        store.sync({"site1": {"id1", "id2"}, "site2": {"id3"}})
+        store.sync({"site1": {"id2", "id4"}})
+
+        assert store.load() == {"site1": {"id2", "id4"}}
+    finally:
+        store.close()
+
+
+def test_trim_keeps_most_recent_ids(temp_dir):
+    store = SeenStore(str(temp_dir / "seen.db"))
+    try:
+        for i in range(5):
+            store.record_seen("site1", [f"id{i}"])
+
+        assert store.trim("site1", 10) == set()
+        assert store.trim("site1", 2) == {"id0", "id1", "id2"}
+        assert store.load() == {"site1": {"id3", "id4"}}
+    finally:
+        store.close()
+
+
+def test_persistence_manager_sqlite_backend(temp_dir):
+    with patch("persistence.APP_CONFIG") as mock_config:
+        mock_config.seen_watches_file = str(temp_dir / "seen_watches.json")
+        mock_config.session_history_file = str(temp_dir / "session_history.json")
+        mock_config.seen_items_backend = "sqlite"
+        mock_config.max_seen_items_per_site = 2
+
+        manager = PersistenceManager(Mock())
+        try:
+            manager.save_seen_items({"site1": {"id1", "id2", "id3"}})
+
+            assert (temp_dir / "seen_watches.db").exists()
+            assert not (temp_dir / "seen_watches.json").exists()
+            assert len(manager.load_seen_items()["site1"]) == 2
+            manager.logger.warning.assert_called()
+        finally:
+            manager.close()
+
+
+def test_repeated_saves_over_limit_keep_newest_ids(temp_dir):
+    with patch("persistence.APP_CONFIG") as mock_config:
+        mock_config.seen_watches_file = str(temp_dir / "seen_watches.json")
+        mock_config.session_history_file = str(temp_dir / "session_history.json")
+        mock_config.seen_items_backend = "sqlite"
+        mock_config.max_seen_items_per_site = 4
+
+        manager = PersistenceManager(Mock())
+        try:
+            seen_items = {"site1": set()}
+            for cycle in range(4):
+                seen_items["site1"].update(f"c{cycle}_{i}" for i in range(3))
+                manager.save_seen_items(seen_items)
+
+                assert manager.load_seen_items() == seen_items
+                assert len(seen_items["site1"]) == min(3 * (cycle + 1), 4)
+
+            assert {"c3_0", "c3_1", "c3_2"} <= seen_items["site1"]
+            assert not any(watch_id.startswith("c0_") for watch_id in seen_items["site1"])
+        finally:
+            manager.close()
+
+
+def test_sqlite_backend_imports_existing_json_file(temp_dir):
+    json_file = temp_dir / "seen_watches.json"
+    json_file.write_text(json.dumps({"site1": ["id1", "id2"], "site2": ["id3"]}))
+
+    with patch("persistence.APP_CONFIG") as mock_config:
+        mock_config.seen_watches_file = str(json_file)
+        mock_config.session_history_file = str(temp_dir / "session_history.json")
+        mock_config.seen_items_backend = "sqlite"
+
+        manager = PersistenceManager(Mock())
+        try:
+            assert manager.load_seen_items() == {"site1": {"id1", "id2"}, "site2": {"id3"}}
+        finally:
+            manager.close()
+
+        # A populated database is never re-seeded from the JSON file
+        json_file.write_text(json.dumps({"site1": ["id9"]}))
+        manager = PersistenceManager(Mock())
+        try:
+            assert manager.load_seen_items()["site1"] == {"id1", "id2"}
+        finally:
+            manager.close()
@@ -7,7 +7,7 @@ from bs4 import BeautifulSoup
 from decimal import Decimal
 from urllib.parse import urljoin
 
-from scrapers.tropicalwatch import TropicalWatchScraper
+from scrapers.tropicalwatch import TropicalWatchScraper, _remove_ignore_case
 from models import WatchData
 from config import SiteConfig
 
@@ -302,7 +302,7 @@ class TestTropicalWatchScraper:
         self, tropicalwatch_scraper, tropicalwatch_listing_html
     ):
         """Test successful watch extraction from listing page."""
-        soup = BeautifulSoup(tropicalwatch_listing_html, "html.parser")
+        soup = BeautifulSoup(tropicalwatch_listing_html, "lxml")
 
         watches = await tropicalwatch_scraper._extract_watches(soup)
 
@@ -352,7 +352,7 @@ class TestTropicalWatchScraper:
         self, tropicalwatch_scraper, tropicalwatch_empty_html
     ):
         """Test extraction from empty listing page."""
-        soup = BeautifulSoup(tropicalwatch_empty_html, "html.parser")
+        soup = BeautifulSoup(tropicalwatch_empty_html, "lxml")
 
         watches = await tropicalwatch_scraper._extract_watches(soup)
 
@@ -363,7 +363,7 @@ class TestTropicalWatchScraper:
         self, tropicalwatch_scraper, tropicalwatch_malformed_html
     ):
         """Test extraction with malformed/missing elements."""
-        soup = BeautifulSoup(tropicalwatch_malformed_html, "html.parser")
+        soup = BeautifulSoup(tropicalwatch_malformed_html, "lxml")
 
         watches = await tropicalwatch_scraper._extract_watches(soup)
 
@@ -392,7 +392,7 @@ class TestTropicalWatchScraper:
             </div>
         </li>
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         element = soup.select_one(".watch")
 
         result = tropicalwatch_scraper._parse_watch_element(element)
@@ -413,7 +413,7 @@ class TestTropicalWatchScraper:
             currency="USD",
         )
 
-        soup = BeautifulSoup(tropicalwatch_detail_html, "html.parser")
+        soup = BeautifulSoup(tropicalwatch_detail_html, "lxml")
 
         await tropicalwatch_scraper._extract_watch_details(watch, soup)
 
@@ -460,7 +460,7 @@ class TestTropicalWatchScraper:
         </html>
         """
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
 
         await tropicalwatch_scraper._extract_watch_details(watch, soup)
 
@@ -480,7 +480,7 @@ class TestTropicalWatchScraper:
             site_key="tropicalwatch",
         )
 
-        soup = BeautifulSoup(tropicalwatch_minimal_detail_html, "html.parser")
+        soup = BeautifulSoup(tropicalwatch_minimal_detail_html, "lxml")
 
         await tropicalwatch_scraper._extract_watch_details(watch, soup)
 
@@ -555,6 +555,22 @@ class TestTropicalWatchScraper:
 
             assert brand == expected_brand, f"Brand extraction failed for: {title}"
 
+    def test_extract_brand_from_title_earliest_match(self, tropicalwatch_scraper):
+        """Test title brand detection picks the earliest brand in the title."""
+        assert tropicalwatch_scraper._extract_brand_from_title("Tudor Submariner by Rolex") == "Tudor"
+        assert tropicalwatch_scraper._extract_brand_from_title("Vintage Heuer Carrera 2447") == "Heuer"
+        assert tropicalwatch_scraper._extract_brand_from_title("A. LANGE & SÖHNE 1815") == "A. Lange & Söhne"
+        assert tropicalwatch_scraper._extract_brand_from_title("Unbranded Pocket Watch") is None
+        assert tropicalwatch_scraper._extract_brand_from_title("") is None
+
+    def test_remove_ignore_case(self):
+        """Test case-insensitive literal removal keeps the remaining casing."""
+        assert _remove_ignore_case("Rolex Submariner ROLEX", "rolex") == " Submariner "
+        assert _remove_ignore_case("Ref. 5513 Submariner", "5513") == "Ref.  Submariner"
+        assert _remove_ignore_case("Omega (Speedmaster)", "(speedmaster)") == "Omega "
+        assert _remove_ignore_case("Omega Seamaster", "Heuer") == "Omega Seamaster"
+        assert _remove_ignore_case("Omega Seamaster", "") == "Omega Seamaster"
+
     def test_model_extraction_from_title(self, tropicalwatch_scraper):
         """Test model extraction from title after removing brand."""
         watch = WatchData(
@@ -697,7 +713,7 @@ class TestTropicalWatchScraper:
                 site_key="tropicalwatch",
             )
 
-            soup = BeautifulSoup(detail_html, "html.parser")
+            soup = BeautifulSoup(detail_html, "lxml")
 
             # Mock parse_box_papers to test the flow
             with patch("scrapers.tropicalwatch.parse_box_papers") as mock_parse:
@@ -741,7 +757,7 @@ class TestTropicalWatchScraper:
                 </div>
             </li>
             """
-            soup = BeautifulSoup(html, "html.parser")
+            soup = BeautifulSoup(html, "lxml")
             element = soup.select_one(".watch")
 
             watch = tropicalwatch_scraper._parse_watch_element(element)
@@ -808,7 +824,7 @@ class TestTropicalWatchScraper:
         </table>
         """
 
-        soup = BeautifulSoup(table_html, "html.parser")
+        soup = BeautifulSoup(table_html, "lxml")
         table = soup.find("table")
 
         headers_map = {
@@ -932,7 +948,7 @@ class TestTropicalWatchScraper:
             </div>
         </li>
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         element = soup.select_one(".watch")
 
         watch = tropicalwatch_scraper._parse_watch_element(element)
@@ -974,8 +990,8 @@ class TestTropicalWatchScraper:
         </li>
         """
 
-        soup1 = BeautifulSoup(html1, "html.parser")
-        soup2 = BeautifulSoup(html2, "html.parser")
+        soup1 = BeautifulSoup(html1, "lxml")
+        soup2 = BeautifulSoup(html2, "lxml")
 
         watch1 = tropicalwatch_scraper._parse_watch_element(soup1.select_one(".watch"))
         watch2 = tropicalwatch_scraper._parse_watch_element(soup2.select_one(".watch"))
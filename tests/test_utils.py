@@ -11,7 +11,7 @@ from bs4 import BeautifulSoup
 from utils import (
     retry_with_backoff, fetch_page, get_usd_to_eur_rate, parse_price,
     parse_year, parse_box_papers, parse_condition, extract_text_from_element,
-    parse_table_data
+    parse_table_data, clear_parse_caches, clear_exchange_rate_cache
 )
 
 
@@ -174,6 +174,81 @@ class TestExchangeRate:
             rate = await get_usd_to_eur_rate(mock_aiohttp_session, mock_logger)
         
         assert rate is None
+    
+    @pytest.mark.asyncio
+    async def test_get_exchange_rate_concurrent_callers_share_fetch(self, mock_aiohttp_session, mock_logger):
+        """Test concurrent callers with a cold cache trigger a single fetch."""
+        async def slow_fetch(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return '{"rates": {"EUR": 0.9}}'
+        
+        fetch_mock = AsyncMock(side_effect=slow_fetch)
+        with patch('utils._exchange_rate_cache', {"rate": None, "last_fetched": 0}), \
+             patch.dict('utils._exchange_rate_locks', clear=True), \
+             patch('utils.fetch_page', fetch_mock):
+            rates = await asyncio.gather(
+                *(get_usd_to_eur_rate(mock_aiohttp_session, mock_logger) for _ in range(5))
+            )
+        
+        assert rates == [0.9] * 5
+        assert fetch_mock.await_count == 1
+    
+    def test_get_exchange_rate_lock_works_across_event_loops(self, mock_aiohttp_session, mock_logger):
+        """Test contended refreshes in a second asyncio.run do not reuse the first loop's lock."""
+        async def slow_fetch(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return '{"rates": {"EUR": 0.9}}'
+        
+        async def refresh_concurrently():
+            clear_exchange_rate_cache()
+            return await asyncio.gather(
+                *(get_usd_to_eur_rate(mock_aiohttp_session, mock_logger) for _ in range(3))
+            )
+        
+        with patch('utils.fetch_page', AsyncMock(side_effect=slow_fetch)):
+            assert asyncio.run(refresh_concurrently()) == [0.9] * 3
+            assert asyncio.run(refresh_concurrently()) == [0.9] * 3
+        clear_exchange_rate_cache()
+
+
+class TestParseCaching:
+    """Test memoization of the text parsers."""
+    
+    def test_parsers_memoize_repeated_text(self):
+        """Test repeated texts are served from the parse caches."""
+        from utils import _parse_year_cached, _parse_box_papers_cached, _parse_condition_cached
+        
+        clear_parse_caches()
+        text = "Baujahr 1995, Box und Papieren, sehr guter Zustand"
+        
+        for _ in range(3):
+            assert parse_year(text) == "1995"
+            assert parse_box_papers(text) == (True, True)
+            assert parse_condition(text) == "★★★★☆"
+        
+        for cached in (_parse_year_cached, _parse_box_papers_cached, _parse_condition_cached):
+            info = cached.cache_info()
+            assert info.misses == 1
+            assert info.hits == 2
+        
+        clear_parse_caches()
+        assert _parse_year_cached.cache_info().currsize == 0
+    
+    def test_parse_cache_keys_are_plain_strings(self):
+        """Test soup strings are cached as plain str, not tree-linked nodes."""
+        from utils import _parse_box_papers_cached
+        
+        clear_parse_caches()
+        soup = BeautifulSoup("<p>Fullset mit Box</p>", "lxml")
+        assert parse_box_papers(soup.p.string) == (True, True)
+        assert parse_box_papers("Fullset mit Box") == (True, True)
+        
+        assert _parse_box_papers_cached.cache_info().hits == 1
+    
+    def test_parse_condition_mappings_bypass_cache(self):
+        """Test site mappings still take priority and accept dict arguments."""
+        mappings = {"Zustand A": "★★★★★"}
+        assert parse_condition("Zustand A", "site", mappings) == "★★★★★"
 
 
 class TestPriceParsing:
@@ -375,7 +450,7 @@ class TestTextExtraction:
     def test_extract_text_from_element(self):
         """Test text extraction from BeautifulSoup element."""
         html = "<div>Hello <span>World</span> Test</div>"
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         div = soup.find('div')
         
         text = extract_text_from_element(div)
@@ -384,7 +459,7 @@ class TestTextExtraction:
     def test_extract_text_with_separator(self):
         """Test text extraction with custom separator."""
         html = "<div>Hello <span>World</span> Test</div>"
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         div = soup.find('div')
         
         text = extract_text_from_element(div, separator=" | ")
@@ -398,7 +473,7 @@ class TestTextExtraction:
     def test_extract_text_strips_whitespace(self):
         """Test that extracted text strips whitespace."""
         html = "<div>  Hello   <span>  World  </span>   Test  </div>"
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         div = soup.find('div')
         
         text = extract_text_from_element(div)
@@ -417,7 +492,7 @@ class TestTableDataParsing:
             <tr><th>Condition</th><td>Excellent</td></tr>
         </table>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         table = soup.find('table')
         
         headers_map = {
@@ -440,7 +515,7 @@ class TestTableDataParsing:
             <tr><th>Model:</th><td>Submariner</td></tr>
         </table>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         table = soup.find('table')
         
         headers_map = {
@@ -465,7 +540,7 @@ class TestTableDataParsing:
             <tr><th>Unknown</th><td>Value</td></tr>
         </table>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         table = soup.find('table')
         
         headers_map = {"known": "field"}
@@ -482,7 +557,7 @@ class TestTableDataParsing:
             <tr><th>Year</th><td>2020</td></tr>
         </table>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         table = soup.find('table')
         
         headers_map = {
@@ -374,7 +374,7 @@ class TestWatchOutScraper:
         self, watch_out_scraper, watch_out_listing_html
     ):
         """Test successful watch extraction with Shopify analytics matching."""
-        soup = BeautifulSoup(watch_out_listing_html, "html.parser")
+        soup = BeautifulSoup(watch_out_listing_html, "lxml")
 
         watches = await watch_out_scraper._extract_watches(soup)
 
@@ -469,7 +469,7 @@ class TestWatchOutScraper:
         </html>
         """
 
-        soup = BeautifulSoup(html_without_analytics, "html.parser")
+        soup = BeautifulSoup(html_without_analytics, "lxml")
 
         watches = await watch_out_scraper._extract_watches(soup)
 
@@ -487,7 +487,7 @@ class TestWatchOutScraper:
         self, watch_out_scraper, watch_out_empty_html
     ):
         """Test extraction from empty listing page."""
-        soup = BeautifulSoup(watch_out_empty_html, "html.parser")
+        soup = BeautifulSoup(watch_out_empty_html, "lxml")
 
         watches = await watch_out_scraper._extract_watches(soup)
 
@@ -498,7 +498,7 @@ class TestWatchOutScraper:
         self, watch_out_scraper, watch_out_malformed_html
     ):
         """Test extraction with malformed Shopify analytics."""
-        soup = BeautifulSoup(watch_out_malformed_html, "html.parser")
+        soup = BeautifulSoup(watch_out_malformed_html, "lxml")
 
         watches = await watch_out_scraper._extract_watches(soup)
 
@@ -521,7 +521,7 @@ class TestWatchOutScraper:
             <sale-price class="price">€5,000.00</sale-price>
         </product-card>
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         element = soup.select_one("product-card")
 
         result = watch_out_scraper._parse_watch_element(element, 0, [])
@@ -538,7 +538,7 @@ class TestWatchOutScraper:
             <sale-price class="price">€1,000.00</sale-price>
         </product-card>
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         element = soup.select_one("product-card")
 
         result = watch_out_scraper._parse_watch_element(element, 0, [])
@@ -575,7 +575,7 @@ class TestWatchOutScraper:
         </html>
         """
 
-        soup = BeautifulSoup(html_with_invalid_json, "html.parser")
+        soup = BeautifulSoup(html_with_invalid_json, "lxml")
 
         # Should handle JSON parsing error gracefully
         watches = await watch_out_scraper._extract_watches(soup)
@@ -583,6 +583,38 @@ class TestWatchOutScraper:
         assert len(watches) == 1  # Should still process visual elements
         assert watches[0].title == "Test Watch"
 
+    @pytest.mark.asyncio
+    async def test_shopify_analytics_meta_with_closing_brace_in_string(
+        self, watch_out_scraper
+    ):
+        """Test the meta object is read whole even if a string contains '};'."""
+        html = """
+        <html>
+        <head>
+            <script>
+                window.ShopifyAnalytics = window.ShopifyAnalytics || {};
+                var meta = {"page": {"note": "};"}, "products": [{"vendor": "Tudor",
+                    "variants": [{"name": "Tudor Black Bay", "price": 350000}]}]};
+                window.ShopifyAnalytics.meta = meta;
+            </script>
+        </head>
+        <body>
+            <product-card handle="tudor-black-bay">
+                <div class="product-card__title">
+                    <a class="bold" href="/products/tudor-black-bay">Black Bay</a>
+                </div>
+            </product-card>
+        </body>
+        </html>
+        """
+
+        soup = BeautifulSoup(html, "lxml")
+
+        watches = await watch_out_scraper._extract_watches(soup)
+
+        assert len(watches) == 1
+        assert watches[0].brand == "Tudor"
+
     @pytest.mark.asyncio
     async def test_extract_watch_details_success(
         self, watch_out_scraper, watch_out_detail_html
@@ -595,7 +627,7 @@ class TestWatchOutScraper:
             site_key="watch_out",
         )
 
-        soup = BeautifulSoup(watch_out_detail_html, "html.parser")
+        soup = BeautifulSoup(watch_out_detail_html, "lxml")
 
         await watch_out_scraper._extract_watch_details(watch, soup)
 
@@ -624,7 +656,7 @@ class TestWatchOutScraper:
             site_key="watch_out",
         )
 
-        soup = BeautifulSoup(watch_out_minimal_detail_html, "html.parser")
+        soup = BeautifulSoup(watch_out_minimal_detail_html, "lxml")
 
         await watch_out_scraper._extract_watch_details(watch, soup)
 
@@ -651,7 +683,7 @@ class TestWatchOutScraper:
         </div>
         """
 
-        soup = BeautifulSoup(accordion_html, "html.parser")
+        soup = BeautifulSoup(accordion_html, "lxml")
         accordion_box = soup.select_one("div.accordion-box")
 
         details = watch_out_scraper._parse_accordion_details_watch_out(accordion_box)
@@ -675,7 +707,7 @@ class TestWatchOutScraper:
         </div>
         """
 
-        soup = BeautifulSoup(accordion_html, "html.parser")
+        soup = BeautifulSoup(accordion_html, "lxml")
         accordion_box = soup.select_one("div.accordion-box")
 
         details = watch_out_scraper._parse_accordion_details_watch_out(accordion_box)
@@ -698,7 +730,7 @@ class TestWatchOutScraper:
         </div>
         """
 
-        soup = BeautifulSoup(accordion_html, "html.parser")
+        soup = BeautifulSoup(accordion_html, "lxml")
         accordion_box = soup.select_one("div.accordion-box")
 
         details = watch_out_scraper._parse_accordion_details_watch_out(accordion_box)
@@ -727,7 +759,7 @@ class TestWatchOutScraper:
         </div>
         """
 
-        soup = BeautifulSoup(accordion_html, "html.parser")
+        soup = BeautifulSoup(accordion_html, "lxml")
         accordion_box = soup.select_one("div.accordion-box")
 
         details = watch_out_scraper._parse_accordion_details_watch_out(accordion_box)
@@ -782,7 +814,7 @@ class TestWatchOutScraper:
         </product-card>
         """
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         element = soup.select_one("product-card")
 
         watch = watch_out_scraper._parse_watch_element(element, 0, [])
@@ -819,7 +851,7 @@ class TestWatchOutScraper:
         </product-card>
         """
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         element = soup.select_one("product-card")
 
         watch = watch_out_scraper._parse_watch_element(element, 0, analytics_data)
@@ -828,6 +860,51 @@ class TestWatchOutScraper:
         # Should use analytics price (€1500.00) over visual price (€2000.00)
         assert watch.price == Decimal("1500.00")
 
+    def test_analytics_matched_by_handle_when_out_of_order(self, watch_out_scraper):
+        """Test analytics items are matched by handle even if positions differ."""
+        analytics_data = [
+            {
+                "vendor": "Omega",
+                "variants": [
+                    {
+                        "name": "Omega Speedmaster",
+                        "price": 500000,
+                        "sku": "OM-1",
+                        "product": {"url": "/products/omega-speedmaster"},
+                    }
+                ],
+            },
+            {
+                "vendor": "Rolex",
+                "variants": [
+                    {
+                        "name": "Rolex Submariner",
+                        "price": 900000,
+                        "sku": "RX-1",
+                        "product": {"url": "/products/rolex-submariner?variant=1"},
+                    }
+                ],
+            },
+        ]
+
+        html = """
+        <product-card handle="rolex-submariner">
+            <div class="product-card__title">
+                <a class="bold" href="/products/rolex-submariner">Submariner</a>
+            </div>
+        </product-card>
+        """
+        element = BeautifulSoup(html, "lxml").select_one("product-card")
+
+        # Card sits at position 0, but its analytics entry is at position 1
+        watch = watch_out_scraper._parse_watch_element(element, 0, analytics_data)
+
+        assert watch is not None
+        assert watch.brand == "Rolex"
+        assert watch.title == "Rolex Submariner"
+        assert watch.price == Decimal("9000.00")
+        assert watch.reference == "RX-1"
+
     def test_handle_extraction_from_different_sources(self, watch_out_scraper):
         """Test handle extraction from handle attribute vs href."""
         test_cases = [
@@ -848,7 +925,7 @@ class TestWatchOutScraper:
         ]
 
         for html_snippet, expected_handle in test_cases:
-            soup = BeautifulSoup(html_snippet, "html.parser")
+            soup = BeautifulSoup(html_snippet, "lxml")
             element = soup.select_one("product-card")
 
             # Extract handle logic
@@ -943,10 +1020,10 @@ class TestWatchOutScraper:
                 # Mock _parse_watch_element to raise an error
                 original_parse = watch_out_scraper._parse_watch_element
 
-                def mock_parse(element, idx, analytics_data):
+                def mock_parse(element, idx, analytics_data, products_by_handle=None):
                     if "error-watch" in str(element):
                         raise Exception("Parse error")
-                    return original_parse(element, idx, analytics_data)
+                    return original_parse(element, idx, analytics_data, products_by_handle)
 
                 watch_out_scraper._parse_watch_element = mock_parse
 
@@ -969,8 +1046,8 @@ class TestWatchOutScraper:
         html1 = html_template.format(handle="watch-1", id="1")
         html2 = html_template.format(handle="watch-2", id="2")
 
-        soup1 = BeautifulSoup(html1, "html.parser")
-        soup2 = BeautifulSoup(html2, "html.parser")
+        soup1 = BeautifulSoup(html1, "lxml")
+        soup2 = BeautifulSoup(html2, "lxml")
 
         watch1 = watch_out_scraper._parse_watch_element(
             soup1.select_one("product-card"), 0, []
@@ -1013,7 +1090,7 @@ class TestWatchOutScraper:
         </product-card>
         """
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         element = soup.select_one("product-card")
 
         watch = watch_out_scraper._parse_watch_element(element, 0, analytics_data)
@@ -1050,7 +1127,7 @@ class TestWatchOutScraper:
         </product-card>
         """
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         element = soup.select_one("product-card")
 
         watch = watch_out_scraper._parse_watch_element(element, 0, analytics_data)
@@ -263,7 +263,7 @@ class TestWorldOfTimeScraper:
     @pytest.mark.asyncio
     async def test_extract_watches_success(self, worldoftime_scraper, worldoftime_listing_html):
         """Test successful watch extraction from listing page."""
-        soup = BeautifulSoup(worldoftime_listing_html, 'html.parser')
+        soup = BeautifulSoup(worldoftime_listing_html, 'lxml')
         
         watches = await worldoftime_scraper._extract_watches(soup)
         
@@ -343,7 +343,7 @@ class TestWorldOfTimeScraper:
     @pytest.mark.asyncio
     async def test_extract_watches_empty_page(self, worldoftime_scraper, worldoftime_empty_html):
         """Test extraction from empty listing page."""
-        soup = BeautifulSoup(worldoftime_empty_html, 'html.parser')
+        soup = BeautifulSoup(worldoftime_empty_html, 'lxml')
         
         watches = await worldoftime_scraper._extract_watches(soup)
         
@@ -352,7 +352,7 @@ class TestWorldOfTimeScraper:
     @pytest.mark.asyncio
     async def test_extract_watches_malformed_elements(self, worldoftime_scraper, worldoftime_malformed_html):
         """Test extraction with malformed/missing elements."""
-        soup = BeautifulSoup(worldoftime_malformed_html, 'html.parser')
+        soup = BeautifulSoup(worldoftime_malformed_html, 'lxml')
         
         watches = await worldoftime_scraper._extract_watches(soup)
         
@@ -373,7 +373,7 @@ class TestWorldOfTimeScraper:
             </div>
         </div>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         element = soup.select_one('.new-arrivals-watch')
         
         result = worldoftime_scraper._parse_watch_element(element)
@@ -410,7 +410,7 @@ class TestWorldOfTimeScraper:
                     </div>
                 </div>
                 """
-                soup = BeautifulSoup(html, 'html.parser')
+                soup = BeautifulSoup(html, 'lxml')
                 element = soup.select_one('.new-arrivals-watch')
                 
                 watch = worldoftime_scraper._parse_watch_element(element)
@@ -431,7 +431,7 @@ class TestWorldOfTimeScraper:
             </div>
         </div>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         element = soup.select_one('.new-arrivals-watch')
         
         watch = worldoftime_scraper._parse_watch_element(element)
@@ -440,6 +440,27 @@ class TestWorldOfTimeScraper:
         assert watch.brand == "Rolex"
         assert watch.model == "Vintage GMT-Master"
     
+    def test_brand_model_extraction_strips_matched_prefix(self, worldoftime_scraper):
+        """Test the model drops the matched brand prefix, not the display name."""
+        html = """
+        <div class="new-arrivals-watch">
+            <div class="image">
+                <a href="/test">Test</a>
+            </div>
+            <div class="text-truncate" style="font-size: 17px; font-family: 'AB';">
+                Universal Geneve Polerouter
+            </div>
+        </div>
+        """
+        soup = BeautifulSoup(html, 'lxml')
+        element = soup.select_one('.new-arrivals-watch')
+        
+        watch = worldoftime_scraper._parse_watch_element(element)
+        
+        assert watch is not None
+        assert watch.brand == "Universal Genève"
+        assert watch.model == "Polerouter"
+    
     def test_case_material_extraction(self, worldoftime_scraper):
         """Test case material extraction from descriptions."""
         test_cases = [
@@ -472,7 +493,7 @@ class TestWorldOfTimeScraper:
                 </p>
             </div>
             """
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, 'lxml')
             element = soup.select_one('.new-arrivals-watch')
             
             watch = worldoftime_scraper._parse_watch_element(element)
@@ -508,7 +529,7 @@ class TestWorldOfTimeScraper:
                 </p>
             </div>
             """
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, 'lxml')
             element = soup.select_one('.new-arrivals-watch')
             
             watch = worldoftime_scraper._parse_watch_element(element)
@@ -544,7 +565,7 @@ class TestWorldOfTimeScraper:
                 </div>
             </div>
             """
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, 'lxml')
             element = soup.select_one('.new-arrivals-watch')
             
             watch = worldoftime_scraper._parse_watch_element(element)
@@ -567,7 +588,7 @@ class TestWorldOfTimeScraper:
             </div>
         </div>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         element = soup.select_one('.new-arrivals-watch')
         
         watch = worldoftime_scraper._parse_watch_element(element)
@@ -600,7 +621,7 @@ class TestWorldOfTimeScraper:
                 </p>
             </div>
             """
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, 'lxml')
             element = soup.select_one('.new-arrivals-watch')
             
             watch = worldoftime_scraper._parse_watch_element(element)
@@ -618,7 +639,7 @@ class TestWorldOfTimeScraper:
             site_key="worldoftime"
         )
         
-        soup = BeautifulSoup("<html></html>", 'html.parser')
+        soup = BeautifulSoup("<html></html>", 'lxml')
         
         # Should not raise any errors and not modify the watch
         original_title = watch.title
@@ -716,7 +737,7 @@ class TestWorldOfTimeScraper:
             </div>
         </div>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         element = soup.select_one('.new-arrivals-watch')
         
         watch = worldoftime_scraper._parse_watch_element(element)
@@ -739,14 +760,14 @@ class TestWorldOfTimeScraper:
             </div>
         </div>
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
         element = soup.select_one('.new-arrivals-watch')
         
         watch1 = worldoftime_scraper._parse_watch_element(element)
         
         # Modify URL to create different watch
         html2 = html.replace("/test-watch-1", "/test-watch-2").replace("Test Watch 1", "Test Watch 2")
-        soup2 = BeautifulSoup(html2, 'html.parser')
+        soup2 = BeautifulSoup(html2, 'lxml')
         element2 = soup2.select_one('.new-arrivals-watch')
         
         watch2 = worldoftime_scraper._parse_watch_element(element2)
@@ -3,9 +3,10 @@
 import asyncio
 import re
 import time
+import weakref
 from decimal import Decimal, InvalidOperation
 from typing import Optional, Callable, TypeVar, List, Tuple, Dict, Any
-from functools import wraps
+from functools import lru_cache, wraps
 import aiohttp
 from bs4 import BeautifulSoup
 
@@ -24,6 +25,21 @@ _exchange_rate_cache = {
     "last_fetched": 0
 }
 
+# Serialises exchange rate refreshes. An asyncio.Lock binds to the loop that
+# first contends for it, so each running loop gets its own lock; entries go
+# away with their loop
+_exchange_rate_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _rate_is_fresh(current_time: float) -> bool:
+    """Check whether the cached exchange rate is still within its TTL."""
+    return bool(
+        _exchange_rate_cache["rate"] and
+        current_time - _exchange_rate_cache["last_fetched"] < APP_CONFIG.exchange_rate_cache_duration
+    )
+
 
 def clear_exchange_rate_cache():
     """Clear the exchange rate cache to release memory."""
@@ -34,6 +50,13 @@ def clear_exchange_rate_cache():
     }
 
 
+def clear_parse_caches():
+    """Clear the memoized year, box/papers and condition parse results."""
+    _parse_year_cached.cache_clear()
+    _parse_box_papers_cached.cache_clear()
+    _parse_condition_cached.cache_clear()
+
+
 async def retry_with_backoff(
     func: Callable[..., T],
     max_retries: int = APP_CONFIG.max_retries,
@@ -128,14 +151,28 @@ async def get_usd_to_eur_rate(session: aiohttp.ClientSession, logger=None) -> Op
     Returns:
         Exchange rate or None if failed
     """
-    current_time = time.time()
-    
-    # Check cache
-    if (_exchange_rate_cache["rate"] and 
-        (current_time - _exchange_rate_cache["last_fetched"] < APP_CONFIG.exchange_rate_cache_duration)):
+    # Check cache (no await on the hot path)
+    if _rate_is_fresh(time.time()):
         return _exchange_rate_cache["rate"]
     
-    # Fetch new rate
+    loop = asyncio.get_running_loop()
+    lock = _exchange_rate_locks.get(loop)
+    if lock is None:
+        lock = _exchange_rate_locks[loop] = asyncio.Lock()
+    
+    async with lock:
+        # Another caller may have refreshed the rate while we waited
+        current_time = time.time()
+        if _rate_is_fresh(current_time):
+            return _exchange_rate_cache["rate"]
+        
+        return await _fetch_usd_to_eur_rate(session, current_time, logger)
+
+
+async def _fetch_usd_to_eur_rate(
+    session: aiohttp.ClientSession, current_time: float, logger=None
+) -> Optional[float]:
+    """Fetch the USD to EUR rate and store it in the cache."""
     try:
         if logger:
             logger.info("Fetching fresh USD to EUR exchange rate")
@@ -164,6 +201,27 @@ async def get_usd_to_eur_rate(session: aiohttp.ClientSession, logger=None) -> Op
     return _exchange_rate_cache["rate"]
 
 
+# Bound on memoized parse results; listing cards repeat every cycle, so a few
+# hundred entries cover them while keeping cached description text small
+_PARSE_CACHE_SIZE = 512
+
+# Parsing patterns and keyword tables, built once at import instead of on
+# every call from the per-watch parsing path
+_PRICE_ON_REQUEST_RE = re.compile(r'price.*on.*request|preis.*auf.*anfrage', re.IGNORECASE)
+_PRICE_CURRENCY_RE = re.compile(r'[€$£¥₹CHF\s]|EUR|USD|GBP|CHF', re.IGNORECASE)
+_PRICE_TRAILING_DASH_RE = re.compile(r',-\s*$')
+_YEAR_KEYWORD_RE = re.compile(
+    r'(?:jahr|year|baujahr|papers from|original-papiere: ja \()?'
+    r'\s*(?:ca\.\s*|um\s*)?(\d{4})\b',
+    re.IGNORECASE
+)
+_YEAR_STANDALONE_RE = re.compile(r'\b(19[5-9]\d|20[0-3]\d)\b')
+_YEAR_SKIP_PREFIXES = (
+    "ref", "sku", "id:", "art-nr", "no.", "mod",
+    "artikel", "p/n", "ident", "kal."
+)
+
+
 def parse_price(price_text: str, currency: str = "EUR") -> Optional[Decimal]:
     """
     Parse price from various text formats.
@@ -179,17 +237,17 @@ def parse_price(price_text: str, currency: str = "EUR") -> Optional[Decimal]:
         return None
     
     # Handle "price on request" cases
-    if re.search(r'price.*on.*request|preis.*auf.*anfrage', price_text, re.IGNORECASE):
+    if _PRICE_ON_REQUEST_RE.search(price_text):
         return None
     
     # Clean the price string
     cleaned = price_text
     
     # Remove currency symbols and text
-    cleaned = re.sub(r'[€$£¥₹CHF\s]|EUR|USD|GBP|CHF', '', cleaned, flags=re.IGNORECASE)
+    cleaned = _PRICE_CURRENCY_RE.sub('', cleaned)
     
     # Remove trailing comma-dash
-    cleaned = re.sub(r',-\s*$', '', cleaned)
+    cleaned = _PRICE_TRAILING_DASH_RE.sub('', cleaned)
     
     # Handle different decimal/thousand separators
     if '.' in cleaned and ',' in cleaned:
@@ -237,19 +295,19 @@ def parse_year(text: str, title: str = "") -> Optional[str]:
     if not text and not title:
         return None
     
-    search_texts = [text, title]
-    
-    for search_text in search_texts:
+    # Plain str keys so the cache never holds tree-linked NavigableStrings
+    return _parse_year_cached(str(text) if text else "", str(title) if title else "")
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_year_cached(text: str, title: str) -> Optional[str]:
+    """Year search behind parse_year, memoized on the exact texts."""
+    for search_text in (text, title):
         if not search_text:
             continue
         
         # Look for year with keywords
-        year_match = re.search(
-            r'(?:jahr|year|baujahr|papers from|original-papiere: ja \()?'
-            r'\s*(?:ca\.\s*|um\s*)?(\d{4})\b',
-            search_text,
-            re.IGNORECASE
-        )
+        year_match = _YEAR_KEYWORD_RE.search(search_text)
         
         if year_match:
             year_val = year_match.group(1)
@@ -258,19 +316,14 @@ def parse_year(text: str, title: str = "") -> Optional[str]:
                 return year_val
         
         # Look for standalone 4-digit years
-        potential_years = re.findall(r'\b(19[5-9]\d|20[0-3]\d)\b', search_text)
+        potential_years = _YEAR_STANDALONE_RE.findall(search_text)
         
         for year in potential_years:
             # Check context to avoid reference numbers
             idx = search_text.find(year)
             pre_context = search_text[max(0, idx - 15):idx].lower()
             
-            skip_prefixes = [
-                "ref", "sku", "id:", "art-nr", "no.", "mod",
-                "artikel", "p/n", "ident", "kal."
-            ]
-            
-            if not any(prefix in pre_context for prefix in skip_prefixes):
+            if not any(prefix in pre_context for prefix in _YEAR_SKIP_PREFIXES):
                 year_int = int(year)
                 if 1900 <= year_int <= 2030:
                     return year
@@ -278,6 +331,33 @@ def parse_year(text: str, title: str = "") -> Optional[str]:
     return None
 
 
+# Box and papers keyword tables for parse_box_papers
+_BOTH_KEYWORDS = (
+    "box and paper", "box und papieren", "fullset", "full set",
+    "box & papers", "box, papiere"
+)
+_PAPERS_YES_KEYWORDS = (
+    "papers: yes", "papiere: ja", "original-papiere: ja",
+    "originalzertifikat", "zertifikat vorhanden", "mit papieren",
+    "original papieren", "mit zertifikat", "papiere vorhanden",
+    "service karte", "garantiekarte", "certificate",
+    "papiere", "papers"
+)
+_PAPERS_NO_KEYWORDS = (
+    "papers: no", "papiere: nein", "ohne papiere",
+    "original-papiere: nein"
+)
+_BOX_YES_KEYWORDS = (
+    "box: yes", "box: ja", "original-box: ja",
+    "original box", "originalbox", "mit box",
+    "originalverpackung", "box vorhanden"
+)
+_BOX_NO_KEYWORDS = (
+    "box: no", "box: nein", "ohne box",
+    "original-box: nein"
+)
+
+
 def parse_box_papers(text: str) -> Tuple[Optional[bool], Optional[bool]]:
     """
     Parse box and papers status from text.
@@ -291,53 +371,30 @@ def parse_box_papers(text: str) -> Tuple[Optional[bool], Optional[bool]]:
     if not text:
         return None, None
     
+    return _parse_box_papers_cached(str(text))
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_box_papers_cached(text: str) -> Tuple[Optional[bool], Optional[bool]]:
+    """Keyword scan behind parse_box_papers, memoized on the exact text."""
     text_lower = text.lower()
     
     # Check for both together
-    both_keywords = [
-        "box and paper", "box und papieren", "fullset", "full set",
-        "box & papers", "box, papiere"
-    ]
-    
-    if any(kw in text_lower for kw in both_keywords):
+    if any(kw in text_lower for kw in _BOTH_KEYWORDS):
         return True, True
     
     # Check papers
     has_papers = None
-    papers_yes = [
-        "papers: yes", "papiere: ja", "original-papiere: ja",
-        "originalzertifikat", "zertifikat vorhanden", "mit papieren",
-        "original papieren", "mit zertifikat", "papiere vorhanden",
-        "service karte", "garantiekarte", "certificate",
-        "papiere", "papers"
-    ]
-    
-    papers_no = [
-        "papers: no", "papiere: nein", "ohne papiere",
-        "original-papiere: nein"
-    ]
-    
-    if any(kw in text_lower for kw in papers_yes):
+    if any(kw in text_lower for kw in _PAPERS_YES_KEYWORDS):
         has_papers = True
-    elif any(kw in text_lower for kw in papers_no):
+    elif any(kw in text_lower for kw in _PAPERS_NO_KEYWORDS):
         has_papers = False
     
     # Check box
     has_box = None
-    box_yes = [
-        "box: yes", "box: ja", "original-box: ja",
-        "original box", "originalbox", "mit box",
-        "originalverpackung", "box vorhanden"
-    ]
-    
-    box_no = [
-        "box: no", "box: nein", "ohne box",
-        "original-box: nein"
-    ]
-    
-    if any(kw in text_lower for kw in box_yes):
+    if any(kw in text_lower for kw in _BOX_YES_KEYWORDS):
         has_box = True
-    elif any(kw in text_lower for kw in box_no):
+    elif any(kw in text_lower for kw in _BOX_NO_KEYWORDS):
         has_box = False
     elif "box" in text_lower:
         has_box = True  # Default to yes if "box" is mentioned
@@ -365,34 +422,41 @@ def parse_condition(text: str, site_key: str = "", mappings: Dict[str, str] = No
     if not text:
         return None
     
-    text_lower = text.lower()
-    
     # Site-specific mappings
     if mappings and text in mappings:
         return mappings[text]
     
-    # Common condition keywords
-    conditions = [
-        (["ungetragen", "unworn", "new old stock", "nos", "fabrikneu", "mint", " neu ", " new ", "neuwertig"],
-         "★★★★★"),
-        
-        (["excellent", "very nice original condition", "top zustand", "makellos", "near mint",
-          "perfekter zustand", "sehr guter zustand", "very good condition", "1a zustand"],
-         "★★★★☆"),
-        
-        (["leichte gebrauchsspuren", "leichte tragespuren", "good condition", "nice condition",
-          "gut erhalten", "guter zustand", "gebraucht"],
-         "★★★☆☆"),
-        
-        (["light wear", "fair condition", "sichtbare gebrauchsspuren", "getragen"],
-         "★★☆☆☆"),
-        
-        (["gebrauchsspuren", "worn", "signs of wear", "deutliche gebrauchsspuren",
-          "strong signs of use", "starke gebrauchsspuren"],
-         "★☆☆☆☆")
-    ]
+    return _parse_condition_cached(str(text))
+
+
+# Common condition keywords, best rating first
+_CONDITION_KEYWORDS = (
+    (("ungetragen", "unworn", "new old stock", "nos", "fabrikneu", "mint", " neu ", " new ", "neuwertig"),
+     "★★★★★"),
+    
+    (("excellent", "very nice original condition", "top zustand", "makellos", "near mint",
+      "perfekter zustand", "sehr guter zustand", "very good condition", "1a zustand"),
+     "★★★★☆"),
+    
+    (("leichte gebrauchsspuren", "leichte tragespuren", "good condition", "nice condition",
+      "gut erhalten", "guter zustand", "gebraucht"),
+     "★★★☆☆"),
+    
+    (("light wear", "fair condition", "sichtbare gebrauchsspuren", "getragen"),
+     "★★☆☆☆"),
+    
+    (("gebrauchsspuren", "worn", "signs of wear", "deutliche gebrauchsspuren",
+      "strong signs of use", "starke gebrauchsspuren"),
+     "★☆☆☆☆")
+)
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_condition_cached(text: str) -> Optional[str]:
+    """Keyword scan behind parse_condition, memoized on the exact text."""
+    text_lower = text.lower()
     
-    for keywords, rating in conditions:
+    for keywords, rating in _CONDITION_KEYWORDS:
         if any(kw in text_lower for kw in keywords):
             return rating
     